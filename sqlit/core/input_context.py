@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from sqlit.core.vim import VimMode
 
 
-@dataclass
+@dataclass(frozen=True)
 class InputContext:
-    """Snapshot of UI input state for key routing/state evaluation."""
+    """Snapshot of UI input state for key routing/state evaluation.
+
+    Frozen so snapshots are hashable and can key action-check caches.
+    """
 
     focus: str  # "explorer" | "query" | "results" | "none"
     vim_mode: VimMode
@@ -34,3 +37,8 @@ class InputContext:
     has_results: bool
     stacked_result_count: int = 0
     count_buffer: str = ""
+    # Derived once per snapshot so the main-screen probe is a single read.
+    main_screen_active: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "main_screen_active", not self.modal_open and not self.query_executing)
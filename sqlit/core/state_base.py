@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import NamedTuple
 
 from sqlit.core.input_context import InputContext
 
@@ -34,13 +35,13 @@ class ActionResult(Enum):
     UNHANDLED = auto()  # State doesn't handle this action (delegate to parent)
 
 
-@dataclass
-class DisplayBinding:
+class DisplayBinding(NamedTuple):
     """A binding to display in the footer."""
 
     key: str  # Display key (e.g., "enter", "y", "<space>")
     label: str  # Human-readable label (e.g., "Connect", "Yes")
     action: str  # Action name for reference
+    disabled: bool = False  # Render struck through in the footer
 
 
 @dataclass
@@ -6,13 +6,24 @@ and extract connection details from them.
 
 from __future__ import annotations
 
+import re
+import sys
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Protocol, cast
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, cast
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from sqlit.domains.connections.domain.config import ConnectionConfig
 
+# Seconds a docker status probe is reused; (timestamp, status, client).
+_STATUS_CACHE_TTL = 2.0
+_STATUS_CACHE: tuple[float, DockerStatus, Any | None] | None = None
+
 
 class DockerStatus(Enum):
     """Status of Docker availability."""
@@ -85,25 +96,51 @@ def _iter_docker_detectors() -> list[tuple[str, Any]]:
 def get_docker_status() -> DockerStatus:
     """Check if Docker is available and running.
 
+    The result (and the pinged client) is reused for a couple of seconds so
+    a single UI refresh does not create and ping several clients.
+
     Returns:
         DockerStatus indicating the current state of Docker.
     """
+    return _get_docker_status_and_client()[0]
+
+
+def _get_docker_status_and_client() -> tuple[DockerStatus, Any | None]:
+    """Return the (cached) docker status with the client that was pinged."""
+    global _STATUS_CACHE
+    now = time.monotonic()
+    cached = _STATUS_CACHE
+    if cached is not None and now - cached[0] < _STATUS_CACHE_TTL:
+        return cached[1], cached[2]
+    status, client = _probe_docker()
+    _STATUS_CACHE = (now, status, client)
+    return status, client
+
+
+def _probe_docker() -> tuple[DockerStatus, Any | None]:
+    """Create a docker client and ping the daemon."""
     try:
         import docker  # pyright: ignore[reportMissingModuleSource]
     except ImportError:
-        return DockerStatus.NOT_INSTALLED
+        return DockerStatus.NOT_INSTALLED, None
 
     try:
         client = docker.from_env()
         client.ping()
-        return DockerStatus.AVAILABLE
+        return DockerStatus.AVAILABLE, client
     except Exception as e:
         error_str = str(e).lower()
         if "permission denied" in error_str:
-            return DockerStatus.NOT_ACCESSIBLE
+            return DockerStatus.NOT_ACCESSIBLE, None
         if "connection refused" in error_str or "connect" in error_str:
-            return DockerStatus.NOT_RUNNING
-        return DockerStatus.NOT_RUNNING
+            return DockerStatus.NOT_RUNNING, None
+        return DockerStatus.NOT_RUNNING, None
+
+
+def _reset_docker_status_cache() -> None:
+    """Forget the cached docker status (for tests)."""
+    global _STATUS_CACHE
+    _STATUS_CACHE = None
 
 
 def _get_db_type_from_image(image_name: str) -> str | None:
@@ -115,79 +152,101 @@ def _get_db_type_from_image(image_name: str) -> str | None:
     Returns:
         Database type string or None if not a recognized database image.
     """
-    for db_type, detector in _iter_docker_detectors():
-        if detector.match_image(image_name):
-            return db_type
-    return None
+    return _resolve_db_type(image_name.lower())
 
 
-def _get_host_port(container: Any, container_port: int) -> int | None:
-    """Extract the host-mapped port from container port bindings.
+@lru_cache(maxsize=1)
+def _image_matcher() -> tuple[re.Pattern[str], Mapping[str, tuple[int, str]]]:
+    """Build one regex over every detector's image patterns.
 
-    Args:
-        container: Docker container object
-        container_port: The container's internal port
+    Returns the compiled pattern and a map of pattern -> (provider rank, db_type),
+    so a single scan can still honour provider order when several match.
+    """
+    ranked: dict[str, tuple[int, str]] = {}
+    for rank, (db_type, detector) in enumerate(_iter_docker_detectors()):
+        for pattern in detector.image_patterns:
+            ranked.setdefault(sys.intern(pattern.lower()), (rank, db_type))
+    alternatives = "|".join(re.escape(pattern) for pattern in sorted(ranked, key=lambda p: ranked[p][0]))
+    # Zero-width lookahead reports a match at every offset, including overlaps.
+    return re.compile(f"(?=({alternatives}))"), MappingProxyType(ranked)
+
+
+@lru_cache(maxsize=256)
+def _resolve_db_type(image_lower: str) -> str | None:
+    """Match a lowercased image name against provider detectors (memoized)."""
+    regex, ranked = _image_matcher()
+    best: tuple[int, str] | None = None
+    for match in regex.finditer(image_lower):
+        candidate = ranked[match.group(1)]
+        if best is None or candidate[0] < best[0]:
+            best = candidate
+    return best[1] if best is not None else None
+
+
+def _extract_port_info(
+    container: Any, default_port: int | None
+) -> tuple[int | None, int | None, bool, list[int]]:
+    """Derive all port facts from container attrs in one pass.
 
     Returns:
-        Host port number or None if not mapped.
+        (host port mapped to default_port, host port when exactly one TCP
+        mapping exists, whether the container uses host networking, exposed
+        TCP ports; the latter are only collected for host networking).
     """
-    ports = container.attrs.get("NetworkSettings", {}).get("Ports") or {}
-
-    # Try TCP port first
-    port_key = f"{container_port}/tcp"
-    bindings = ports.get(port_key)
-
-    if bindings and len(bindings) > 0:
-        host_port = bindings[0].get("HostPort")
-        if host_port:
-            return int(host_port)
-
-    return None
+    attrs = container.attrs
+    ports = attrs.get("NetworkSettings", {}).get("Ports") or {}
+    default_key = f"{default_port}/tcp" if default_port else None
 
-
-def _get_single_mapped_host_port(container: Any) -> int | None:
-    """Return a host port when only one TCP port mapping exists."""
-    ports = container.attrs.get("NetworkSettings", {}).get("Ports") or {}
+    default_host_port = None
     mapped_ports: set[int] = set()
     for port_key, bindings in ports.items():
         if not port_key.endswith("/tcp") or not bindings:
             continue
+        if port_key == default_key:
+            host_port = bindings[0].get("HostPort")
+            if host_port:
+                default_host_port = int(host_port)
         for binding in bindings:
             host_port = binding.get("HostPort")
             if host_port:
                 mapped_ports.add(int(host_port))
-    if len(mapped_ports) == 1:
-        return mapped_ports.pop()
-    return None
+    single_mapped = next(iter(mapped_ports)) if len(mapped_ports) == 1 else None
 
+    is_host_network = attrs.get("HostConfig", {}).get("NetworkMode") == "host"
+    exposed_ports: list[int] = []
+    if is_host_network:
+        exposed = attrs.get("Config", {}).get("ExposedPorts") or {}
+        for port_key in exposed:
+            port_str, _, proto = port_key.partition("/")
+            if proto == "tcp" and port_str.isdigit():
+                exposed_ports.append(int(port_str))
+
+    return default_host_port, single_mapped, is_host_network, exposed_ports
 
-def _get_exposed_tcp_ports(container: Any) -> list[int]:
-    """Return exposed TCP ports declared in the container config."""
-    exposed = container.attrs.get("Config", {}).get("ExposedPorts") or {}
-    exposed_ports = []
-    for port_key in exposed.keys():
-        if not port_key.endswith("/tcp"):
-            continue
-        port_str = port_key.split("/")[0]
-        if port_str.isdigit():
-            exposed_ports.append(int(port_str))
-    return exposed_ports
+
+# An image reference that is only an ID: sha256:<digest> or a bare hex ID
+# (short or full), as passed to `docker run 1a2b3c4d5e6f`.
+_IMAGE_ID_RE = re.compile(r"(?:sha256:)?[0-9a-f]{12,64}")
 
 
 def _get_container_image_name(container: Any) -> str | None:
-    """Best-effort image name for tagless or digest-based images."""
+    """Best-effort image name for tagless or digest-based images.
+
+    Config.Image comes with the list() payload, so it is tried before
+    container.image, which costs an extra inspect request per container.
+    Containers started from an image ID carry that ID there instead of a
+    name, so those still go through the image's tags.
+    """
     try:
-        image_tags = container.image.tags
-        if image_tags:
-            return str(image_tags[0])
+        config_image = container.attrs.get("Config", {}).get("Image")
+        if config_image and _IMAGE_ID_RE.fullmatch(str(config_image)) is None:
+            return str(config_image)
     except Exception:
         pass
     try:
-        config_image = container.attrs.get("Config", {}).get("Image")
-        if isinstance(config_image, str):
-            return config_image
-        if config_image:
-            return str(config_image)
+        image_tags = container.image.tags
+        if image_tags:
+            return str(image_tags[0])
     except Exception:
         pass
     try:
@@ -208,103 +267,113 @@ def _get_container_env_vars(container: Any) -> dict[str, str]:
     env_list = container.attrs.get("Config", {}).get("Env", [])
     env_dict = {}
     for env in env_list:
-        if "=" in env:
-            key, value = env.split("=", 1)
+        key, sep, value = env.partition("=")
+        if sep:
             env_dict[key] = value
     return env_dict
 
 
 def _detect_containers_with_status(
-    client: Any, status_filter: str, container_status: ContainerStatus
+    containers: list[Any], container_status: ContainerStatus
 ) -> list[DetectedContainer]:
-    """Detect database containers with a specific status.
+    """Detect database containers among pre-fetched containers of one status.
 
     Args:
-        client: Docker client
-        status_filter: Docker status filter (e.g., "running", "exited")
+        containers: Docker containers already filtered to container_status
         container_status: ContainerStatus to assign to detected containers
 
     Returns:
         List of DetectedContainer objects
     """
-    try:
-        containers = client.containers.list(filters={"status": status_filter})
-    except Exception:
-        return []
+    results = [_extract_detected(container, container_status) for container in containers]
+    return [container for container in results if container is not None]
 
-    detected: list[DetectedContainer] = []
 
-    for container in containers:
-        # Get image name
-        image_name = _get_container_image_name(container)
-        if not image_name:
-            continue
+class _DetectionProfile(NamedTuple):
+    """Per-db-type facts needed to turn a container into a connection."""
 
-        # Determine database type
-        db_type = _get_db_type_from_image(image_name)
-        if not db_type:
-            continue
+    detector: Any
+    default_port: int | None
+    host: str
+    requires_auth: bool
 
-        from sqlit.domains.connections.providers.catalog import get_provider
 
-        provider = get_provider(db_type)
-        detector = provider.docker_detector
-        if detector is None:
-            continue
-        default_port_str = provider.metadata.default_port
-        default_port = int(default_port_str) if default_port_str else None
-
-        # Get host-mapped port (only available for running containers)
-        host_port = None
-        if container_status == ContainerStatus.RUNNING:
-            if default_port:
-                host_port = _get_host_port(container, default_port)
-            if host_port is None:
-                host_port = _get_single_mapped_host_port(container)
-
-            network_mode = container.attrs.get("HostConfig", {}).get("NetworkMode")
-            if host_port is None and network_mode == "host" and default_port:
-                exposed_ports = _get_exposed_tcp_ports(container)
-                if len(exposed_ports) == 1:
-                    host_port = exposed_ports[0]
-                else:
-                    host_port = default_port
-
-        # Get credentials from environment variables
-        env_vars = _get_container_env_vars(container)
-        credentials = detector.get_credentials(env_vars)
-
-        # Create container name (strip leading slash if present)
-        container_name = container.name
-        if container_name.startswith("/"):
-            container_name = container_name[1:]
-
-        # Use 127.0.0.1 for MySQL/MariaDB to force TCP connection
-        # (localhost causes them to try Unix socket which doesn't exist on host)
-        host = detector.preferred_host
-
-        # For databases that don't require auth, use empty string instead of None
-        # This prevents the UI from prompting for a password
-        password = credentials.password
-        if password is None and not provider.metadata.requires_auth:
-            password = ""
-
-        detected.append(
-            DetectedContainer(
-                container_id=container.short_id,
-                container_name=container_name,
-                db_type=db_type,
-                host=host,
-                port=host_port,
-                username=credentials.user,
-                password=password,
-                database=credentials.database,
-                status=container_status,
-                connectable=container_status == ContainerStatus.RUNNING and host_port is not None,
-            )
-        )
+@cache
+def _detection_profile(db_type: str) -> _DetectionProfile | None:
+    """Resolve provider details once per db type rather than once per container."""
+    from sqlit.domains.connections.providers.catalog import get_provider
+
+    provider = get_provider(db_type)
+    detector = provider.docker_detector
+    if detector is None:
+        return None
+    default_port_str = provider.metadata.default_port
+    return _DetectionProfile(
+        detector=detector,
+        default_port=int(default_port_str) if default_port_str else None,
+        # MySQL/MariaDB prefer 127.0.0.1 to force TCP (localhost means Unix socket)
+        host=detector.preferred_host,
+        requires_auth=provider.metadata.requires_auth,
+    )
 
-    return detected
+
+def _extract_detected(container: Any, container_status: ContainerStatus) -> DetectedContainer | None:
+    """Build a DetectedContainer for one docker container, or None if not a database."""
+    # Get image name
+    image_name = _get_container_image_name(container)
+    if not image_name:
+        return None
+
+    # Determine database type
+    db_type = _get_db_type_from_image(image_name)
+    if not db_type:
+        return None
+
+    profile = _detection_profile(db_type)
+    if profile is None:
+        return None
+    default_port = profile.default_port
+
+    # Get host-mapped port (only available for running containers)
+    host_port = None
+    if container_status == ContainerStatus.RUNNING:
+        default_host_port, single_mapped, is_host_network, exposed_ports = _extract_port_info(
+            container, default_port
+        )
+        if default_host_port is not None:
+            host_port = default_host_port
+        elif single_mapped is not None:
+            host_port = single_mapped
+        elif is_host_network and default_port:
+            host_port = exposed_ports[0] if len(exposed_ports) == 1 else default_port
+
+    # Get credentials from environment variables
+    env_vars = _get_container_env_vars(container)
+    credentials = profile.detector.get_credentials(env_vars)
+
+    # Create container name (strip leading slash if present)
+    container_name = container.name
+    if container_name.startswith("/"):
+        container_name = container_name[1:]
+
+    # For databases that don't require auth, use empty string instead of None
+    # This prevents the UI from prompting for a password
+    password = credentials.password
+    if password is None and not profile.requires_auth:
+        password = ""
+
+    return DetectedContainer(
+        container_id=container.short_id,
+        container_name=container_name,
+        db_type=db_type,
+        host=profile.host,
+        port=host_port,
+        username=credentials.user,
+        password=password,
+        database=credentials.database,
+        status=container_status,
+        connectable=container_status == ContainerStatus.RUNNING and host_port is not None,
+    )
 
 
 def detect_database_containers() -> tuple[DockerStatus, list[DetectedContainer]]:
@@ -318,18 +387,32 @@ def detect_database_containers() -> tuple[DockerStatus, list[DetectedContainer]]
     if status != DockerStatus.AVAILABLE:
         return status, []
 
-    try:
-        import docker  # pyright: ignore[reportMissingModuleSource]
+    # Reuse the client the status check just pinged when it is still fresh
+    client = _get_docker_status_and_client()[1]
+    if client is None:
+        try:
+            import docker  # pyright: ignore[reportMissingModuleSource]
 
-        client = docker.from_env()
+            client = docker.from_env()
+        except Exception:
+            return DockerStatus.NOT_ACCESSIBLE, []
+
+    # One daemon round-trip; partition by status client-side
+    try:
+        containers = client.containers.list(all=True)
     except Exception:
-        return DockerStatus.NOT_ACCESSIBLE, []
+        containers = []
+    by_status: dict[str, list[Any]] = {"running": [], "exited": []}
+    for container in containers:
+        bucket = by_status.get(container.status)
+        if bucket is not None:
+            bucket.append(container)
 
     # Detect running containers first
-    running = _detect_containers_with_status(client, "running", ContainerStatus.RUNNING)
+    running = _detect_containers_with_status(by_status["running"], ContainerStatus.RUNNING)
 
     # Detect exited containers
-    exited = _detect_containers_with_status(client, "exited", ContainerStatus.EXITED)
+    exited = _detect_containers_with_status(by_status["exited"], ContainerStatus.EXITED)
 
     # Return running first, then exited
     return DockerStatus.AVAILABLE, running + exited
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from copy import copy
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
 
 
 class DatabaseType(str, Enum):
@@ -342,20 +345,14 @@ class ConnectionConfig:
         return data
 
     def with_endpoint(self, **kwargs: Any) -> ConnectionConfig:
-        from dataclasses import replace
-
         if not isinstance(self.endpoint, TcpEndpoint):
             return self
-        endpoint = replace(self.endpoint, **kwargs)
-        return replace(self, endpoint=endpoint)
+        return _copy_with(self, endpoint=_copy_with(self.endpoint, **kwargs))
 
     def with_tunnel(self, **kwargs: Any) -> ConnectionConfig:
-        from dataclasses import replace
-
         if self.tunnel is None:
             return self
-        tunnel = replace(self.tunnel, **kwargs)
-        return replace(self, tunnel=tunnel)
+        return _copy_with(self, tunnel=_copy_with(self.tunnel, **kwargs))
 
     def get_source_emoji(self) -> str:
         return get_source_emoji(self.source)
@@ -551,3 +548,18 @@ def normalize_folder_path(path: str | None) -> str:
     path = path.replace("\\", "/")
     parts = [part.strip() for part in path.split("/") if part.strip()]
     return "/".join(parts)
+
+
+def _copy_with(obj: _T, **changes: Any) -> _T:
+    """Shallow-copy a config dataclass and override fields.
+
+    Cheaper than dataclasses.replace, which re-inspects fields and re-runs
+    __init__ on every call; these copies are made per query on tunnelled
+    connections.
+    """
+    clone = copy(obj)
+    for name, value in changes.items():
+        if name not in obj.__dataclass_fields__:  # type: ignore[attr-defined]
+            raise TypeError(f"{type(obj).__name__} has no field {name!r}")
+        setattr(clone, name, value)
+    return clone
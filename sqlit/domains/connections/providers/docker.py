@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,27 +21,32 @@ class DockerCredentials:
 @dataclass(frozen=True)
 class DockerDetector:
     image_patterns: tuple[str, ...]
-    env_vars: dict[str, tuple[str, ...]]
+    env_vars: Mapping[str, tuple[str, ...]]
     default_user: str | None = None
     default_database: str | None = None
     preferred_host: str = "localhost"
     default_user_requires_password: bool = False
     post_process: Callable[[DockerCredentials, Mapping[str, str]], DockerCredentials] | None = None
+    # Lookup tuples resolved from env_vars once at construction.
+    _user_vars: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _password_vars: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _database_vars: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Detectors are shared module-level singletons; keep their tables read-only.
+        object.__setattr__(self, "env_vars", MappingProxyType(dict(self.env_vars)))
+        object.__setattr__(self, "_user_vars", tuple(self.env_vars.get("user", ())))
+        object.__setattr__(self, "_password_vars", tuple(self.env_vars.get("password", ())))
+        object.__setattr__(self, "_database_vars", tuple(self.env_vars.get("database", ())))
 
     def match_image(self, image_name: str) -> bool:
         image_lower = image_name.lower()
         return any(pattern in image_lower for pattern in self.image_patterns)
 
     def get_credentials(self, env_vars: dict[str, str]) -> DockerCredentials:
-        def get_first(values: tuple[str, ...]) -> str | None:
-            for key in values:
-                if key in env_vars:
-                    return env_vars[key]
-            return None
-
-        user = get_first(self.env_vars.get("user", ()))
-        password = get_first(self.env_vars.get("password", ()))
-        database = get_first(self.env_vars.get("database", ())) or self.default_database
+        user = _first_env(env_vars, self._user_vars)
+        password = _first_env(env_vars, self._password_vars)
+        database = _first_env(env_vars, self._database_vars) or self.default_database
         if not user and self.default_user is not None and (not self.default_user_requires_password or password):
             user = self.default_user
         if not database:
@@ -49,3 +55,8 @@ class DockerDetector:
         if self.post_process:
             return self.post_process(creds, env_vars)
         return creds
+
+
+def _first_env(env_vars: Mapping[str, str], keys: tuple[str, ...]) -> str | None:
+    """Return the value of the first key present in env_vars."""
+    return next((env_vars[key] for key in keys if key in env_vars), None)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Protocol, cast
 
 from sqlit.shared.ui.protocols import ConnectionsProtocol, TextualAppProtocol
@@ -111,15 +112,34 @@ class AzureFirewallHandler:
         )
 
 
-_DEFAULT_HANDLERS: tuple[ConnectionErrorHandler, ...] = (
-    AzureFirewallHandler(),
-    MissingDriverHandler(),
-)
+# Handlers that have to inspect the error message, tried in order before
+# the type-keyed handlers.
+_MESSAGE_HANDLERS: tuple[ConnectionErrorHandler, ...] = (AzureFirewallHandler(),)
 
 
-def handle_connection_error(app: ConnectionErrorApp, error: Exception, config: ConnectionConfig) -> bool:
-    for handler in _DEFAULT_HANDLERS:
+@cache
+def _type_handlers() -> dict[type[BaseException], ConnectionErrorHandler]:
+    """Handlers keyed by the exception type they handle (built on first use)."""
+    from sqlit.domains.connections.providers.exceptions import MissingDriverError
+
+    return {MissingDriverError: MissingDriverHandler()}
+
+
+def _find_handler(error: Exception) -> ConnectionErrorHandler | None:
+    for handler in _MESSAGE_HANDLERS:
         if handler.can_handle(error):
-            handler.handle(app, error, config)
-            return True
-    return False
+            return handler
+    by_type = _type_handlers()
+    for cls in type(error).__mro__:
+        handler = by_type.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
+def handle_connection_error(app: ConnectionErrorApp, error: Exception, config: ConnectionConfig) -> bool:
+    handler = _find_handler(error)
+    if handler is None:
+        return False
+    handler.handle(app, error, config)
+    return True
@@ -250,7 +250,7 @@ class ConnectionMixin:
             tree_builder.ensure_connecting_indicator(self, config)
         tree_builder.update_connecting_indicator(self)
         try:
-            self._update_status_bar()
+            self._request_status_refresh()
         except Exception:
             pass
 
@@ -273,7 +273,7 @@ class ConnectionMixin:
             return
         tree_builder.update_connecting_indicator(self)
         try:
-            self._update_status_bar()
+            self._request_status_refresh()
         except Exception:
             pass
 
@@ -450,6 +450,7 @@ class ConnectionMixin:
         if self.current_connection is not None:
             self._disconnect_silent()
             self.status_bar.update("Disconnected")
+            self._last_status_render = None
             self.notify("Disconnected")
 
     def _get_effective_database(self: ConnectionMixinHost) -> str | None:
@@ -506,6 +507,8 @@ class ConnectionMixin:
         except Exception:
             return
         footer.set_bindings([], [])
+        # The footer no longer shows the bindings _update_footer_bindings last set.
+        self._last_footer_ctx = None
 
     def _wrap_connection_result(self: ConnectionMixinHost, result: tuple | None) -> None:
         self._update_footer_bindings()
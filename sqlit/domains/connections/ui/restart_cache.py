@@ -7,10 +7,13 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+# Resolved once: gettempdir() probes env vars and directory permissions.
+_RESTART_CACHE_PATH = Path(tempfile.gettempdir()) / "sqlit-driver-install-restore.json"
+
 
 def get_restart_cache_path() -> Path:
     """Return the cache path used for restart state."""
-    return Path(tempfile.gettempdir()) / "sqlit-driver-install-restore.json"
+    return _RESTART_CACHE_PATH
 
 
 def write_restart_cache(payload: dict[str, Any]) -> None:
@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectionNode:
     """Node representing a database connection."""
 
+    KIND: ClassVar[str] = "connection"
+
     config: ConnectionConfig
 
     def get_connection_config(self) -> ConnectionConfig:
@@ -22,48 +24,54 @@ class ConnectionNode:
         return self.config.name
 
     def get_node_kind(self) -> str:
-        return "connection"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"conn:{self.config.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectionFolderNode:
     """Node representing a folder that groups connections."""
 
+    KIND: ClassVar[str] = "connection_folder"
+
     name: str
 
     def get_label_text(self) -> str:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "connection_folder"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"conn_folder:{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatabaseNode:
     """Node representing a database in a multi-database server."""
 
+    KIND: ClassVar[str] = "database"
+
     name: str
 
     def get_label_text(self) -> str:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "database"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"db:{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FolderNode:
     """Node representing a folder (databases, tables, views, indexes, triggers, sequences, procedures)."""
 
+    KIND: ClassVar[str] = "folder"
+
     folder_type: str  # "databases", "tables", "views", "indexes", "triggers", "sequences", "procedures"
     database: str | None = None
 
@@ -71,16 +79,18 @@ class FolderNode:
         return self.folder_type
 
     def get_node_kind(self) -> str:
-        return "folder"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"folder:{self.folder_type}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaNode:
     """Node representing a schema grouping."""
 
+    KIND: ClassVar[str] = "schema"
+
     database: str | None
     schema: str
     folder_type: str
@@ -89,16 +99,18 @@ class SchemaNode:
         return self.schema
 
     def get_node_kind(self) -> str:
-        return "schema"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"schema:{self.schema}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableNode:
     """Node representing a database table."""
 
+    KIND: ClassVar[str] = "table"
+
     database: str | None
     schema: str
     name: str
@@ -107,16 +119,18 @@ class TableNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "table"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"table:{self.schema}.{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewNode:
     """Node representing a database view."""
 
+    KIND: ClassVar[str] = "view"
+
     database: str | None
     schema: str
     name: str
@@ -125,16 +139,18 @@ class ViewNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "view"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"view:{self.schema}.{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcedureNode:
     """Node representing a stored procedure."""
 
+    KIND: ClassVar[str] = "procedure"
+
     database: str | None
     name: str
 
@@ -142,16 +158,18 @@ class ProcedureNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "procedure"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"proc:{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IndexNode:
     """Node representing a database index."""
 
+    KIND: ClassVar[str] = "index"
+
     database: str | None
     name: str
     table_name: str
@@ -160,16 +178,18 @@ class IndexNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "index"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"index:{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TriggerNode:
     """Node representing a database trigger."""
 
+    KIND: ClassVar[str] = "trigger"
+
     database: str | None
     name: str
     table_name: str
@@ -178,16 +198,18 @@ class TriggerNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "trigger"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"trigger:{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SequenceNode:
     """Node representing a database sequence."""
 
+    KIND: ClassVar[str] = "sequence"
+
     database: str | None
     name: str
 
@@ -195,16 +217,18 @@ class SequenceNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "sequence"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"sequence:{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnNode:
     """Node representing a table/view column."""
 
+    KIND: ClassVar[str] = "column"
+
     database: str | None
     schema: str
     table: str
@@ -214,21 +238,23 @@ class ColumnNode:
         return self.name
 
     def get_node_kind(self) -> str:
-        return "column"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return f"column:{self.schema}.{self.table}.{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoadingNode:
     """Placeholder node shown during async loading."""
 
+    KIND: ClassVar[str] = "loading"
+
     def get_label_text(self) -> str:
         return ""
 
     def get_node_kind(self) -> str:
-        return "loading"
+        return self.KIND
 
     def get_node_path_part(self) -> str:
         return ""
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
     from sqlit.domains.connections.providers.model import DatabaseProvider
 
 MIN_TIMER_DELAY_S = 0.001
+# Kinds with no children to load or expansion state worth persisting.
+LEAF_NODE_KINDS = frozenset({"column", "index", "trigger", "sequence", "procedure", "loading"})
 
 
 class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
@@ -76,10 +78,13 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
         """Save state when a node is collapsed."""
         tree_expansion_state.update_expanded_state(self, event.node, expanded=False)
         self._schedule_expanded_state_persist()
+        tree_loaders.release_collapsed_folder(self, event.node)
 
     def on_tree_node_expanded(self: TreeMixinHost, event: Tree.NodeExpanded) -> None:
         """Load child objects when a node is expanded."""
         node = event.node
+        if self._get_node_kind(node) in LEAF_NODE_KINDS:
+            return
 
         tree_expansion_state.update_expanded_state(self, node, expanded=True)
         self._schedule_expanded_state_persist()
@@ -99,12 +104,12 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
                 config
                 and self.current_config
                 and self.current_config.name == config.name
-                and not list(node.children)
+                and not node.children
             ):
                 tree_builder.populate_connected_tree(self)
             return
 
-        children = list(node.children)
+        children = node.children
         if children:
             if len(children) == 1 and self._get_node_kind(children[0]) == "loading":
                 return
@@ -284,13 +289,17 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
 
     def action_collapse_tree(self: TreeMixinHost) -> None:
         """Collapse all nodes in the explorer."""
-
-        def collapse_all(node: Any) -> None:
-            for child in node.children:
-                collapse_all(child)
-                child.collapse()
-
-        collapse_all(self.object_tree.root)
+        # Pre-order walk, then collapse in reverse so children go before
+        # their parents, as the old recursive version did.
+        ordered: list[Any] = []
+        stack = list(self.object_tree.root.children)
+        while stack:
+            node = stack.pop()
+            ordered.append(node)
+            stack.extend(node.children)
+        for node in reversed(ordered):
+            if node.is_expanded:
+                node.collapse()
         self._expanded_paths.clear()
         self._schedule_expanded_state_persist()
 
@@ -325,15 +334,20 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
         data = node.data
 
         if self._get_node_kind(node) in ("table", "view"):
+            columns = tree_loaders.cached_table_columns(self, data.database, data.schema, data.name)
             self._last_query_table = {
                 "database": data.database,
                 "schema": data.schema,
                 "name": data.name,
-                "columns": [],
+                "columns": list(columns) if columns is not None else [],
             }
             # Stash per-result metadata so results can resolve PKs without relying on globals.
             self._pending_result_table_info = self._last_query_table
-            self._prime_last_query_table_columns(data.database, data.schema, data.name)
+            if columns is None:
+                self._prime_last_query_table_columns(data.database, data.schema, data.name)
+            else:
+                # Invalidate any prime still in flight for a previous table.
+                self._last_query_table_token += 1
 
             self.query_input.text = self.current_provider.dialect.build_select_query(
                 data.name,
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from rich.markup import escape as escape_markup
-
-from sqlit.shared.core.utils import fuzzy_match, highlight_matches
+from sqlit.domains.explorer.ui.tree.markup import escape_markup
+from sqlit.shared.core.utils import fuzzy_match, highlight_matches, highlight_span
 from sqlit.shared.ui.protocols import TreeFilterMixinHost
 
 if TYPE_CHECKING:
@@ -23,7 +22,13 @@ class TreeFilterMixin:
     _tree_filter_typing: bool = False
     _tree_filter_matches: list[Any] = []
     _tree_filter_match_index: int = 0
-    _tree_original_labels: dict[int, str] = {}
+    _tree_filter_refine_query: str = ""
+    _tree_filter_needle: str = ""
+    _tree_filter_case_sensitive: bool = False
+    _tree_filter_index: list[tuple[Any, str, str]] | None = None
+    _tree_filter_applied_text: str | None = None
+    _tree_filter_update_pending: bool = False
+    _tree_original_labels: dict[Any, str] = {}
 
     def action_tree_filter(self: TreeFilterMixinHost) -> None:
         """Open the tree filter."""
@@ -37,6 +42,9 @@ class TreeFilterMixin:
         self._tree_filter_typing = True
         self._tree_filter_matches = []
         self._tree_filter_match_index = 0
+        self._tree_filter_refine_query = ""
+        self._tree_filter_index = None
+        self._tree_filter_applied_text = None
         self._tree_original_labels = {}
 
         self.tree_filter_input.show()
@@ -50,6 +58,8 @@ class TreeFilterMixin:
         self._tree_filter_query = ""
         self._tree_filter_fuzzy = False
         self._tree_filter_typing = False
+        self._tree_filter_refine_query = ""
+        self._tree_filter_applied_text = None
         self.tree_filter_input.hide()
         self._restore_tree_labels()
         self._show_all_tree_nodes()
@@ -57,6 +67,10 @@ class TreeFilterMixin:
 
     def action_tree_filter_accept(self: TreeFilterMixinHost) -> None:
         """Accept current filter selection, close filter, and activate the node."""
+        if self._tree_filter_update_pending:
+            # Apply the text typed since the last update before picking a match.
+            self._tree_filter_update_pending = False
+            self._update_tree_filter()
         # Store current match before closing
         current_node = None
         if self._tree_filter_matches and self._tree_filter_match_index < len(self._tree_filter_matches):
@@ -146,7 +160,7 @@ class TreeFilterMixin:
             if self._tree_filter_typing:
                 if self._tree_filter_text:
                     self._tree_filter_text = self._tree_filter_text[:-1]
-                    self._update_tree_filter()
+                    self._schedule_tree_filter_update()
                 else:
                     # Exit filter when backspacing with no text
                     self.action_tree_filter_close()
@@ -167,7 +181,7 @@ class TreeFilterMixin:
                 super().on_key(event)  # type: ignore[misc]
                 return
             self._tree_filter_text += char
-            self._update_tree_filter()
+            self._schedule_tree_filter_update()
             event.prevent_default()
             event.stop()
             return
@@ -175,29 +189,68 @@ class TreeFilterMixin:
         # Pass unhandled keys to next mixin
         super().on_key(event)  # type: ignore[misc]
 
+    def _schedule_tree_filter_update(self: TreeFilterMixinHost) -> None:
+        """Update the filter after the next refresh, once per burst of keys."""
+        if self._tree_filter_update_pending:
+            return
+        self._tree_filter_update_pending = True
+
+        def run() -> None:
+            if not self._tree_filter_update_pending:
+                return
+            self._tree_filter_update_pending = False
+            if self._tree_filter_visible:
+                self._update_tree_filter()
+
+        self.call_after_refresh(run)
+
     def _update_tree_filter(self: TreeFilterMixinHost) -> None:
         """Update the tree based on current filter text."""
-        self._restore_tree_labels()
-        total = self._count_all_nodes()
         raw_text = self._tree_filter_text
-        self._tree_filter_fuzzy = raw_text.startswith("~")
-        self._tree_filter_query = raw_text[1:] if self._tree_filter_fuzzy else raw_text
-
-        if not self._tree_filter_query:
+        if raw_text == self._tree_filter_applied_text:
+            return
+        self._tree_filter_applied_text = raw_text
+        total = self._count_all_nodes()
+        fuzzy = raw_text.startswith("~")
+        self._tree_filter_query = raw_text[1:] if fuzzy else raw_text
+        # A one-character subsequence is just a substring, so short fuzzy
+        # queries skip fuzzy_match and scan the lowercase label index instead.
+        self._tree_filter_fuzzy = fuzzy and len(self._tree_filter_query) > 1
+
+        query = self._tree_filter_query
+        if not query:
+            self._restore_tree_labels()
             self._show_all_tree_nodes()
             self._tree_filter_matches = []
+            self._tree_filter_refine_query = ""
             self.tree_filter_input.set_filter("", 0, total)
             return
 
-        # Find all matching nodes
+        # Smart case: a query with uppercase letters matches case-sensitively.
+        # Fuzzy queries always ignore case.
+        needle = query.lower()
+        self._tree_filter_case_sensitive = needle != query and not fuzzy
+        self._tree_filter_needle = query if self._tree_filter_case_sensitive else needle
+
+        # Find all matching nodes. When a substring query was only extended,
+        # anything matching it also matched the previous query, so only the
+        # previous matches need checking.
         matches: list[Any] = []
-        self._find_matching_nodes(self.object_tree.root, matches)
+        label_updates: list[tuple[Any, str]] = []
+        previous = self._tree_filter_refine_query
+        if previous and not self._tree_filter_fuzzy and query.startswith(previous):
+            for node in self._tree_filter_matches:
+                self._match_filter_node(node, matches, label_updates)
+        else:
+            self._find_matching_nodes(matches, label_updates)
+        self._tree_filter_refine_query = "" if self._tree_filter_fuzzy else query
 
         self._tree_filter_matches = matches
         self._tree_filter_match_index = 0
 
         # Hide non-matching nodes and highlight matches
         self._apply_filter_to_tree()
+        self._apply_tree_label_updates(label_updates)
 
         # Update filter display
         self.tree_filter_input.set_filter(
@@ -208,45 +261,79 @@ class TreeFilterMixin:
         if matches:
             self._jump_to_current_match()
 
-    def _find_matching_nodes(
-        self: TreeFilterMixinHost, node: Any, matches: list
-    ) -> bool:
-        """Recursively find nodes matching the filter.
+    def _get_tree_filter_index(self: TreeFilterMixinHost) -> list[tuple[Any, str, str]]:
+        """Searchable nodes with their label text, lowercased text alongside.
 
-        Returns True if this node or any descendant matches.
+        Built once per filter session, children before parents (the order
+        matches are listed in), and dropped by tree_builder.mark_tree_changed
+        when nodes are added or removed elsewhere.
         """
-        node_matches = False
-        has_matching_child = False
-
-        # Check children first
-        for child in node.children:
-            if self._find_matching_nodes(child, matches):
-                has_matching_child = True
-
-        # Get node label text for matching
-        label_text = self._get_node_label_text(node)
-        if label_text:
-            if self._tree_filter_fuzzy:
-                matched, indices = fuzzy_match(self._tree_filter_query, label_text)
+        index = self._tree_filter_index
+        if index is not None:
+            return index
+        # Children are pushed in order, so the reversed visit order is post-order.
+        visited: list[Any] = []
+        stack = list(self.object_tree.root.children)
+        while stack:
+            node = stack.pop()
+            visited.append(node)
+            stack.extend(node.children)
+        index = []
+        for node in reversed(visited):
+            label_text = self._get_node_label_text(node)
+            if label_text:
+                index.append((node, label_text, label_text.lower()))
+        self._tree_filter_index = index
+        return index
+
+    def _find_matching_nodes(
+        self: TreeFilterMixinHost,
+        matches: list,
+        label_updates: list[tuple[Any, str]],
+    ) -> None:
+        """Find all nodes in the tree matching the filter."""
+        match_node = self._match_filter_node
+        for node, label_text, label_lower in self._get_tree_filter_index():
+            match_node(node, matches, label_updates, label_text, label_lower)
+
+    def _match_filter_node(
+        self: TreeFilterMixinHost,
+        node: Any,
+        matches: list,
+        label_updates: list[tuple[Any, str]],
+        label_text: str | None = None,
+        label_lower: str | None = None,
+    ) -> bool:
+        """Collect a single node and its highlighted label if it matches the filter."""
+        if label_text is None:
+            label_text = self._get_node_label_text(node)
+        if not label_text:
+            return False
+        query = self._tree_filter_query
+        if self._tree_filter_fuzzy:
+            matched, indices = fuzzy_match(query, label_text)
+            if not matched:
+                return False
+            highlighted = highlight_matches(escape_markup(label_text), indices, style="bold #FFFF00")
+        else:
+            needle = self._tree_filter_needle
+            if self._tree_filter_case_sensitive:
+                haystack = label_text
             else:
-                label_lower = label_text.lower()
-                query_lower = self._tree_filter_query.lower()
-                start = label_lower.find(query_lower)
-                matched = start >= 0
-                indices = list(range(start, start + len(self._tree_filter_query))) if matched else []
-
-            if matched:
-                node_matches = True
-                matches.append(node)
-                # Store original label and apply highlighting
-                self._tree_original_labels[id(node)] = str(node.label)
-                highlighted = highlight_matches(
-                    escape_markup(label_text), indices, style="bold #FFFF00"
-                )
-                # Preserve any existing markup prefix (like icons, colors)
-                node.set_label(self._rebuild_label_with_highlight(node, highlighted))
-
-        return node_matches or has_matching_child
+                haystack = label_lower if label_lower is not None else label_text.lower()
+            if needle not in haystack:
+                return False
+            start = haystack.find(needle)
+            highlighted = highlight_span(escape_markup(label_text), start, len(query), style="bold #FFFF00")
+
+        matches.append(node)
+        # Keep the label from before the first highlight; it is restored later.
+        originals = self._tree_original_labels
+        if node not in originals:
+            originals[node] = str(node.label)
+        # Preserve any existing markup prefix (like icons, colors)
+        label_updates.append((node, self._rebuild_label_with_highlight(node, highlighted)))
+        return True
 
     def _get_node_label_text(self, node: Any) -> str:
         """Get the plain text label for a node."""
@@ -285,6 +372,12 @@ class TreeFilterMixin:
             self.object_tree.root, match_ids, ancestor_ids, visible=True
         )
 
+        # Only matches and their ancestors are left in the tree.
+        index = self._tree_filter_index
+        if index is not None:
+            kept = match_ids | ancestor_ids
+            self._tree_filter_index = [entry for entry in index if id(entry[0]) in kept]
+
     def _set_node_visibility(
         self: TreeFilterMixinHost,
         node: Any,
@@ -292,22 +385,25 @@ class TreeFilterMixin:
         ancestor_ids: set,
         visible: bool,
     ) -> None:
-        """Recursively set node visibility by removing non-matching nodes."""
+        """Set node visibility below node by removing non-matching nodes."""
+        if not self._tree_filter_query:
+            return
         # Collect nodes to remove (can't modify children while iterating)
         nodes_to_remove: list[Any] = []
 
-        for child in node.children:
-            child_id = id(child)
-            is_match = child_id in match_ids
-            is_ancestor = child_id in ancestor_ids
-            should_show = is_match or is_ancestor or not self._tree_filter_query
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for child in current.children:
+                child_id = id(child)
+                if child_id in match_ids or child_id in ancestor_ids:
+                    stack.append(child)
+                else:
+                    nodes_to_remove.append(child)
 
-            if not should_show and self._tree_filter_query:
-                # Mark for removal
-                nodes_to_remove.append(child)
-            else:
-                # Recurse into visible nodes
-                self._set_node_visibility(child, match_ids, ancestor_ids, should_show)
+        if nodes_to_remove:
+            # The tree no longer matches what the last refresh built.
+            setattr(self, "_tree_state_key", None)
 
         # Remove non-matching nodes
         for child in nodes_to_remove:
@@ -320,28 +416,29 @@ class TreeFilterMixin:
         """Rebuild the tree to restore all nodes after filtering."""
         self.refresh_tree()
 
+    def _apply_tree_label_updates(
+        self: TreeFilterMixinHost, label_updates: list[tuple[Any, str]]
+    ) -> None:
+        """Set highlighted labels and restore nodes that no longer match, in one batch."""
+        originals = self._tree_original_labels
+        highlighted = {node for node, _ in label_updates}
+        stale = [node for node in originals if node not in highlighted]
+        with self.batch_update():
+            for node in stale:
+                node.set_label(originals.pop(node))
+            for node, label in label_updates:
+                node.set_label(label)
+
     def _restore_tree_labels(self: TreeFilterMixinHost) -> None:
         """Restore original labels for all modified nodes."""
-        def restore_node(node: Any) -> None:
-            node_id = id(node)
-            if node_id in self._tree_original_labels:
-                node.set_label(self._tree_original_labels[node_id])
-            for child in node.children:
-                restore_node(child)
-
-        restore_node(self.object_tree.root)
+        originals = self._tree_original_labels
         self._tree_original_labels = {}
+        if not originals:
+            return
+        with self.batch_update():
+            for node, label in originals.items():
+                node.set_label(label)
 
     def _count_all_nodes(self: TreeFilterMixinHost) -> int:
         """Count all searchable nodes in the tree."""
-        count = 0
-
-        def count_nodes(node: Any) -> None:
-            nonlocal count
-            if node.data and self._get_node_label_text(node):
-                count += 1
-            for child in node.children:
-                count_nodes(child)
-
-        count_nodes(self.object_tree.root)
-        return count
+        return len(self._get_tree_filter_index())
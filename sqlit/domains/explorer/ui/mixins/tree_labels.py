@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from rich.markup import escape as escape_markup
-
 from sqlit.domains.connections.providers.metadata import get_badge_label, get_connection_display_info
+from sqlit.domains.explorer.ui.tree.markup import escape_markup
 from sqlit.shared.ui.protocols import TreeMixinHost
 from sqlit.shared.ui.spinner import SPINNER_FRAMES
 
@@ -22,6 +22,18 @@ def _dim_color(hex_color: str, factor: float = 0.3) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+@lru_cache(maxsize=512)
+def _name_part(source_emoji: str, name: str) -> str:
+    """Emoji plus markup-escaped connection name."""
+    return f"{source_emoji}{escape_markup(name)}"
+
+
+@lru_cache(maxsize=64)
+def _connecting_suffix(source_emoji: str, name: str) -> str:
+    """Everything after the spinner frame in a connecting label."""
+    return f"[/] {_name_part(source_emoji, name)} [dim italic]Connecting...[/]"
+
+
 class TreeLabelMixin:
     """Mixin providing connection label helpers."""
 
@@ -30,29 +42,27 @@ class TreeLabelMixin:
         return get_badge_label(db_type)
 
     def _format_connection_label(self, conn: Any, status: str, spinner: str | None = None) -> str:
-        display_info = escape_markup(get_connection_display_info(conn))
-        db_type_label = self._db_type_badge(conn.db_type)
-        escaped_name = escape_markup(conn.name)
         source_emoji = conn.get_source_emoji()
         selected = getattr(self, "_selected_connection_names", set())
         is_selected = getattr(conn, "name", None) in selected
-        if status == "connected":
+        if status == "connecting":
+            # Rebuilt on every spinner frame: only the frame is new text.
+            frame = spinner or SPINNER_FRAMES[0]
+            label = "[#FBBF24]" + frame + _connecting_suffix(source_emoji, conn.name)
+        elif status == "connected":
+            name_part = _name_part(source_emoji, conn.name)
+            display_info = escape_markup(get_connection_display_info(conn))
+            db_type_label = self._db_type_badge(conn.db_type)
             primary = getattr(getattr(self, "current_theme", None), "primary", "#7E9CD8")
             label = (
-                f"[{primary}]* {source_emoji}{escaped_name}[/]"
+                f"[{primary}]* {name_part}[/]"
                 f" [{db_type_label}] ({display_info})"
             )
-        elif status == "connecting":
-            frame = spinner or SPINNER_FRAMES[0]
-            label = (
-                f"[#FBBF24]{frame}[/] {source_emoji}{escaped_name}"
-                " [dim italic]Connecting...[/]"
-            )
         else:
-            label = (
-                f"[dim]{source_emoji}{escaped_name}"
-                f" [{db_type_label}] ({display_info})[/]"
-            )
+            name_part = _name_part(source_emoji, conn.name)
+            display_info = escape_markup(get_connection_display_info(conn))
+            db_type_label = self._db_type_badge(conn.db_type)
+            label = f"[dim]{name_part} [{db_type_label}] ({display_info})[/]"
 
         if is_selected:
             primary = getattr(getattr(self, "current_theme", None), "primary", "#7E9CD8")
@@ -65,13 +75,12 @@ class TreeLabelMixin:
         return spinner.frame if spinner else SPINNER_FRAMES[0]
 
     def _get_node_kind(self, node: Any) -> str:
+        # Called for every child on refresh and expansion, so read the class
+        # attribute rather than calling get_node_kind().
         data = getattr(node, "data", None)
         if data is None:
             return ""
-        getter = getattr(data, "get_node_kind", None)
-        if callable(getter):
-            return str(getter())
-        return ""
+        return getattr(type(data), "KIND", "")
 
     def _get_node_path_part(self, data: Any) -> str:
         getter = getattr(data, "get_node_path_part", None)
@@ -5,8 +5,6 @@ from __future__ import annotations
 from typing import Any, Callable
 from contextlib import nullcontext
 
-from rich.markup import escape as escape_markup
-
 from sqlit.domains.connections.providers.metadata import get_connection_display_info
 from sqlit.domains.explorer.domain.tree_nodes import ConnectionFolderNode, ConnectionNode, FolderNode
 from sqlit.domains.explorer.ui.tree.expansion_state import (
@@ -14,6 +12,7 @@ from sqlit.domains.explorer.ui.tree.expansion_state import (
     get_node_path,
     restore_subtree_expansion_with_paths,
 )
+from sqlit.domains.explorer.ui.tree.markup import escape_markup
 from sqlit.shared.ui.protocols import TreeMixinHost
 
 MIN_TIMER_DELAY_S = 0.001
@@ -97,6 +96,8 @@ def _add_connection_node(
     node = parent.add(label)
     node.data = ConnectionNode(config=config)
     node.allow_expand = is_connected
+    if is_connecting:
+        setattr(host, "_connecting_node", node)
     return node
 
 
@@ -229,36 +230,58 @@ def _get_connection_folder_path(host: TreeMixinHost, node: Any) -> str:
     return "/".join(reversed(parts))
 
 
-def refresh_tree_incremental(
+def mark_tree_changed(host: TreeMixinHost) -> None:
+    """Drop data derived from the tree's nodes after some were added or removed.
+
+    That is the tree filter's node index, and its previous matches, which
+    can no longer stand in for a search of the whole tree.
+    """
+    setattr(host, "_tree_filter_index", None)
+    setattr(host, "_tree_filter_refine_query", "")
+
+
+def _tree_state_key(
     host: TreeMixinHost,
-    *,
-    on_done: Callable[[], None] | None = None,
-) -> None:
-    """Refresh the explorer tree without clearing it to reduce flicker."""
-    token = object()
-    setattr(host, "_tree_refresh_token", token)
+    connections: list[Any],
+    connecting_name: str | None,
+    exclusive_active: bool,
+) -> tuple[Any, ...]:
+    """Snapshot of the state refresh_tree_incremental renders from.
+
+    Covers the displayed connections (by config identity, name and
+    folder_path), the current config and connection, the connecting name,
+    exclusive mode, the multi-selection and the theme object. It does not
+    see configs or themes mutated in place (display info, badges, theme
+    colours), so skipping on an unchanged key is opt-in via force=False.
+    """
+    return (
+        tuple((id(c), c.name, getattr(c, "folder_path", "")) for c in connections if c is not None),
+        id(host.current_config),
+        id(host.current_connection),
+        connecting_name,
+        exclusive_active,
+        frozenset(getattr(host, "_selected_connection_names", ())),
+        id(getattr(host, "current_theme", None)),
+    )
 
-    cursor_path = ""
-    cursor_connection_name = ""
-    cursor = host.object_tree.cursor_node
-    if cursor is not None and cursor.data:
-        cursor_path = get_node_path(host, cursor)
-        if host._get_node_kind(cursor) == "connection":
-            cursor_config = getattr(cursor.data, "config", None)
-            if cursor_config and cursor_config.name:
-                cursor_connection_name = cursor_config.name
 
-    connecting_config = getattr(host, "_connecting_config", None)
-    connecting_name = connecting_config.name if connecting_config else None
-    connecting_spinner = host._connect_spinner_frame() if connecting_config else None
+def _displayed_connections(
+    host: TreeMixinHost, connecting_config: Any | None
+) -> tuple[list[Any], bool, tuple[Any, ...]]:
+    """Connections the tree shows, in display order.
 
+    Returns (connections, whether an exclusive startup connection is shown,
+    the _tree_state_key for this render).
+    """
+    connecting_name = connecting_config.name if connecting_config else None
+    current_name = host.current_config.name if host.current_config is not None else None
     direct_config = getattr(host, "_direct_connection_config", None)
     startup_config = getattr(host, "_startup_connect_config", None)
     exclusive_connection = getattr(host, "_exclusive_connection", False)
     direct_active = (
         direct_config is not None
-        and host.current_config is not None
-        and direct_config.name == host.current_config.name
+        and current_name is not None
+        and direct_config.name == current_name
     )
     startup_pending = startup_config is not None and not any(
         c.name == startup_config.name for c in host.connections
@@ -272,10 +295,48 @@ def refresh_tree_incremental(
         connections = [startup_config]
     else:
         connections = list(host.connections)
-    if connecting_config and not any(c.name == connecting_config.name for c in connections):
-        connections = connections + [connecting_config]
+    if connecting_config and connecting_name not in {c.name for c in connections}:
+        connections = [*connections, connecting_config]
 
     connections = _sort_connections_for_display(connections)
+    state_key = _tree_state_key(host, connections, connecting_name, exclusive_active)
+    return connections, exclusive_active, state_key
+
+
+def refresh_tree_incremental(
+    host: TreeMixinHost,
+    *,
+    on_done: Callable[[], None] | None = None,
+    force: bool = True,
+) -> None:
+    """Refresh the explorer tree without clearing it to reduce flicker.
+
+    With ``force=False`` the refresh is skipped when nothing it renders from
+    has changed since the last one.
+    """
+    token = object()
+    setattr(host, "_tree_refresh_token", token)
+
+    cursor_path = ""
+    cursor_connection_name = ""
+    cursor = host.object_tree.cursor_node
+    if cursor is not None and cursor.data:
+        cursor_path = get_node_path(host, cursor)
+        if host._get_node_kind(cursor) == "connection":
+            cursor_config = getattr(cursor.data, "config", None)
+            if cursor_config and cursor_config.name:
+                cursor_connection_name = cursor_config.name
+
+    connecting_config = getattr(host, "_connecting_config", None)
+    connecting_name = connecting_config.name if connecting_config else None
+    connecting_spinner = host._connect_spinner_frame() if connecting_config else None
+
+    current_name = host.current_config.name if host.current_config is not None else None
+    connections, exclusive_active, state_key = _displayed_connections(host, connecting_config)
+    if not force and getattr(host, "_tree_state_key", None) == state_key:
+        if on_done:
+            on_done()
+        return
 
     expanded_snapshot = set(getattr(host, "_expanded_paths", set()))
 
@@ -313,7 +374,7 @@ def refresh_tree_incremental(
         for conn in connections:
             if conn is None:
                 continue
-            is_connected = host.current_config is not None and conn.name == host.current_config.name
+            is_connected = current_name is not None and conn.name == current_name
             is_connecting = connecting_name == conn.name and not is_connected
             skip_folder = exclusive_active
             if skip_folder:
@@ -345,6 +406,8 @@ def refresh_tree_incremental(
                     node.allow_expand = is_connected
                     node.data = ConnectionNode(config=conn)
                     existing_nodes[conn.name] = node
+                    if is_connecting:
+                        setattr(host, "_connecting_node", node)
 
             if node is None:
                 node = _add_connection_node(
@@ -385,7 +448,7 @@ def refresh_tree_incremental(
             for conn in desired_conns:
                 if conn is None:
                     continue
-                is_connected = host.current_config is not None and conn.name == host.current_config.name
+                is_connected = current_name is not None and conn.name == current_name
                 is_connecting = connecting_name == conn.name and not is_connected
                 _add_connection_node(
                     host,
@@ -406,6 +469,8 @@ def refresh_tree_incremental(
             tree_loaders = None
         if tree_loaders is not None:
             tree_loaders.ensure_expanded_nodes_loaded(host, host.object_tree.root)
+    setattr(host, "_tree_state_key", state_key)
+    mark_tree_changed(host)
 
     if getattr(host, "_tree_refresh_token", None) is not token:
         return
@@ -420,11 +485,32 @@ def refresh_tree_incremental(
         on_done()
 
 
+def _connecting_node(host: TreeMixinHost, config: Any) -> Any | None:
+    """Return the tree node for the connecting config.
+
+    The node is remembered on the host so spinner frames do not walk the
+    tree; the cached node is checked to still be in the tree and to belong
+    to this config before it is reused.
+    """
+    node = getattr(host, "_connecting_node", None)
+    if node is not None:
+        node_config = getattr(getattr(node, "data", None), "config", None)
+        try:
+            attached = host.object_tree.get_node_by_id(node.id) is node
+        except Exception:
+            attached = False
+        if attached and node_config is not None and node_config.name == config.name:
+            return node
+    node = _find_connection_node(host, config)
+    setattr(host, "_connecting_node", node)
+    return node
+
+
 def ensure_connecting_indicator(host: TreeMixinHost, config: Any) -> None:
     """Ensure a connecting node exists without rebuilding the tree."""
     spinner = host._connect_spinner_frame()
     label = host._format_connection_label(config, "connecting", spinner=spinner)
-    node = _find_connection_node(host, config)
+    node = _connecting_node(host, config)
     if node is not None:
         node.set_label(label)
         node.allow_expand = False
@@ -444,6 +530,7 @@ def clear_connecting_indicator(host: TreeMixinHost, config: Any | None) -> None:
     if config is None:
         return
     node = _find_connection_node(host, config)
+    setattr(host, "_connecting_node", None)
     if node is None:
         return
     is_saved = any(c.name == config.name for c in host.connections)
@@ -505,7 +592,7 @@ def update_connecting_indicator(host: TreeMixinHost) -> None:
 
     spinner = host._connect_spinner_frame()
     label = host._format_connection_label(connecting_config, "connecting", spinner=spinner)
-    node = _find_connection_node(host, connecting_config)
+    node = _connecting_node(host, connecting_config)
     if node is not None:
         node.set_label(label)
         node.allow_expand = False
@@ -521,10 +608,11 @@ def refresh_tree_chunked(
     *,
     batch_size: int = 10,
     on_done: Callable[[], None] | None = None,
+    force: bool = True,
 ) -> None:
     """Refresh the explorer tree in small batches to reduce UI stalls."""
     _ = batch_size
-    refresh_tree_incremental(host, on_done=on_done)
+    refresh_tree_incremental(host, on_done=on_done, force=force)
 
 
 def update_connection_state(
@@ -536,6 +624,8 @@ def update_connection_state(
 
     This is more efficient than refresh_tree when only the connection state changes.
     """
+    setattr(host, "_tree_state_key", None)
+    mark_tree_changed(host)
     # Update old connected node to idle state
     if old_config is not None:
         old_node = _find_connection_node(host, old_config)
@@ -557,6 +647,8 @@ def remove_connection_nodes(host: TreeMixinHost, names: set[str]) -> None:
     """
     if not names:
         return
+    setattr(host, "_tree_state_key", None)
+    mark_tree_changed(host)
 
     # Find and remove the connection nodes
     nodes_to_remove: list[Any] = []
@@ -617,6 +709,7 @@ def populate_connected_tree(host: TreeMixinHost) -> None:
         or host.current_provider is None
     ):
         return
+    mark_tree_changed(host)
 
     provider = host.current_provider
     def get_conn_label(config: Any, connected: bool = False) -> str:
@@ -679,13 +772,31 @@ def add_database_object_nodes(host: TreeMixinHost, parent_node: Any, database: s
     if not host.current_provider:
         return
 
-    caps = host.current_provider.capabilities
-    node_provider = host.current_provider.explorer_nodes
-
-    for folder in node_provider.get_root_folders(caps):
-        if folder.requires(caps):
-            folder_node = parent_node.add(escape_markup(folder.label))
-            folder_node.data = FolderNode(folder_type=folder.kind, database=database)
+    for kind, label, available in _root_folder_layout(host):
+        if available:
+            folder_node = parent_node.add(label)
+            folder_node.data = FolderNode(folder_type=kind, database=database)
             folder_node.allow_expand = True
         else:
-            parent_node.add_leaf(f"[dim]{folder.label} (Not available)[/]")
+            parent_node.add_leaf(label)
+
+
+def _root_folder_layout(host: TreeMixinHost) -> tuple[tuple[str, str, bool], ...]:
+    """Folder kinds, labels and availability under each database node.
+
+    Capabilities are fixed for a provider, so the layout is worked out once
+    and reused for every database node until the provider changes.
+    """
+    provider = host.current_provider
+    cached = getattr(host, "_root_folder_layout_cache", None)
+    if cached is not None and cached[0] is provider:
+        return cached[1]
+    caps = provider.capabilities
+    layout = tuple(
+        (folder.kind, escape_markup(folder.label), True)
+        if folder.requires(caps)
+        else (folder.kind, f"[dim]{folder.label} (Not available)[/]", False)
+        for folder in provider.explorer_nodes.get_root_folders(caps)
+    )
+    setattr(host, "_root_folder_layout_cache", (provider, layout))
+    return layout
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from rich.markup import escape as escape_markup
-
+from sqlit.domains.explorer.ui.tree.markup import escape_markup
 from sqlit.shared.ui.protocols import TreeMixinHost
 
 
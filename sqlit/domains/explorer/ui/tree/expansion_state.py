@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from sqlit.shared.ui.protocols import TreeMixinHost
 
 
 def get_node_path(host: TreeMixinHost, node: Any) -> str:
-    """Get a unique path string for a tree node."""
+    """Get a unique path string for a tree node.
+
+    Paths are interned, as are those loaded from settings, so lookups in
+    host._expanded_paths usually match by identity.
+    """
     parts: list[str] = []
     current = node
     while current and current.parent:
@@ -18,7 +23,16 @@ def get_node_path(host: TreeMixinHost, node: Any) -> str:
             if path_part:
                 parts.append(path_part)
         current = current.parent
-    return "/".join(reversed(parts))
+    return sys.intern("/".join(reversed(parts)))
+
+
+def _child_path(host: TreeMixinHost, parent_path: str, child: Any) -> str:
+    """Path of a child node given its parent's path (same result as get_node_path)."""
+    data = child.data
+    part = host._get_node_path_part(data) if data else ""
+    if not part:
+        return parent_path
+    return sys.intern(f"{parent_path}/{part}" if parent_path else part)
 
 
 def find_node_by_path(host: TreeMixinHost, root: Any, path: str) -> Any | None:
@@ -45,13 +59,18 @@ def restore_subtree_expansion_with_paths(
     node: Any,
     expanded_paths: set[str],
 ) -> None:
-    """Recursively expand nodes that should be expanded."""
-    for child in node.children:
-        if child.data:
-            path = get_node_path(host, child)
-            if path in expanded_paths:
-                child.expand()
-        restore_subtree_expansion_with_paths(host, child, expanded_paths)
+    """Recursively expand nodes that should be expanded.
+
+    Paths are built top-down from the parent's path, so each node costs one
+    path-part lookup instead of a walk back to the root.
+    """
+    stack = [(child, get_node_path(host, node)) for child in reversed(node.children)]
+    while stack:
+        child, parent_path = stack.pop()
+        path = _child_path(host, parent_path, child)
+        if child.data and path in expanded_paths:
+            child.expand()
+        stack.extend((grandchild, path) for grandchild in reversed(child.children))
 
 
 def restore_subtree_expansion(host: TreeMixinHost, node: Any) -> None:
@@ -85,29 +104,32 @@ def update_expanded_state(host: TreeMixinHost, node: Any, expanded: bool) -> Non
     host._expanded_paths = expanded_paths
 
 
-def persist_expanded_state(host: TreeMixinHost) -> None:
-    """Persist expanded state to settings."""
-    expanded = sorted(getattr(host, "_expanded_paths", set()))
+def _write_expanded_paths(host: TreeMixinHost, expanded: list[str]) -> None:
+    """Write expanded paths to settings unless they match the last write."""
+    snapshot = frozenset(expanded)
+    if snapshot == getattr(host, "_persisted_expanded_paths", None):
+        return
     settings = host.services.settings_store.load_all()
     settings["expanded_nodes"] = expanded
     host.services.settings_store.save_all(settings)
+    host._persisted_expanded_paths = snapshot
+
+
+def persist_expanded_state(host: TreeMixinHost) -> None:
+    """Persist expanded state to settings."""
+    _write_expanded_paths(host, sorted(getattr(host, "_expanded_paths", set())))
 
 
 def save_expanded_state(host: TreeMixinHost) -> None:
     """Save which nodes are expanded (full tree scan)."""
     expanded: list[str] = []
 
-    def collect_expanded(node: Any) -> None:
-        if node.is_expanded and node.data:
-            path = get_node_path(host, node)
-            if path:
-                expanded.append(path)
-        for child in node.children:
-            collect_expanded(child)
-
-    collect_expanded(host.object_tree.root)
+    stack: list[tuple[Any, str]] = [(host.object_tree.root, "")]
+    while stack:
+        node, path = stack.pop()
+        if node.is_expanded and node.data and path:
+            expanded.append(path)
+        stack.extend((child, _child_path(host, path, child)) for child in reversed(node.children))
 
     host._expanded_paths = set(expanded)
-    settings = host.services.settings_store.load_all()
-    settings["expanded_nodes"] = expanded
-    host.services.settings_store.save_all(settings)
+    _write_expanded_paths(host, expanded)
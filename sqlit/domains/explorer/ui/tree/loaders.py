@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
-from rich.markup import escape as escape_markup
-
 from sqlit.domains.explorer.domain.tree_nodes import (
     ColumnNode,
     DatabaseNode,
@@ -18,12 +17,20 @@ from sqlit.domains.explorer.domain.tree_nodes import (
     TriggerNode,
     ViewNode,
 )
+from sqlit.domains.explorer.ui.tree.markup import escape_markup
 from sqlit.shared.ui.protocols import TreeMixinHost
 
 from . import builder as tree_builder
 from . import expansion_state, schema_render
 
 MIN_TIMER_DELAY_S = 0.001
+# Collapsed folders holding more nodes than this drop them; expanding the
+# folder again reloads it (from the schema object cache once fetched).
+RELEASE_COLLAPSED_FOLDER_NODES = 200
+# Columns fetched for an expanded table are reused by action_select_table for
+# this long; the schema object cache they live in is also cleared on refresh.
+TABLE_COLUMNS_TTL_S = 60.0
+_TABLE_COLUMNS_KEY = "table_columns"
 
 
 def ensure_loading_nodes(host: TreeMixinHost) -> set[str]:
@@ -37,12 +44,25 @@ def ensure_loading_nodes(host: TreeMixinHost) -> set[str]:
 def add_loading_placeholder(host: TreeMixinHost, node: Any) -> None:
     loading_node = node.add_leaf("[dim italic]Loading...[/]")
     loading_node.data = LoadingNode()
+    placeholders = getattr(host, "_loading_placeholders", None)
+    if placeholders is None:
+        placeholders = {}
+        setattr(host, "_loading_placeholders", placeholders)
+    placeholders[id(node)] = loading_node
 
 
 def remove_loading_placeholders(host: TreeMixinHost, node: Any) -> None:
-    for child in list(node.children):
-        if host._get_node_kind(child) == "loading":
-            child.remove()
+    """Remove the placeholder add_loading_placeholder put under node."""
+    placeholders = getattr(host, "_loading_placeholders", None)
+    if not placeholders:
+        return
+    loading_node = placeholders.pop(id(node), None)
+    if loading_node is None:
+        return
+    try:
+        loading_node.remove()
+    except Exception:
+        pass  # Already gone with its parent's children.
 
 
 def clear_loading_state(host: TreeMixinHost, node: Any) -> None:
@@ -52,6 +72,39 @@ def clear_loading_state(host: TreeMixinHost, node: Any) -> None:
     remove_loading_placeholders(host, node)
 
 
+def release_collapsed_folder(host: TreeMixinHost, node: Any) -> bool:
+    """Drop the children of a large collapsed folder so the tree stays small.
+
+    Returns True when the children were removed. Any batched render still
+    queued for the folder or a node below it is cancelled.
+    """
+    if getattr(host, "_tree_filter_visible", False):
+        return False
+    if host._get_node_kind(node) != "folder":
+        return False
+    children = node.children
+    size = len(children) + sum(len(child.children) for child in children)
+    if size <= RELEASE_COLLAPSED_FOLDER_NODES:
+        return False
+    token_maps = [
+        tokens
+        for tokens in (
+            getattr(host, "_node_render_tokens", None),
+            getattr(host, "_schema_render_tokens", None),
+        )
+        if tokens
+    ]
+    if token_maps:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for tokens in token_maps:
+                tokens.pop(id(current), None)
+            stack.extend(current.children)
+    node.remove_children()
+    return True
+
+
 def _should_load_expanded_node(host: TreeMixinHost, node: Any) -> bool:
     if not getattr(node, "data", None):
         return False
@@ -62,7 +115,7 @@ def _should_load_expanded_node(host: TreeMixinHost, node: Any) -> bool:
     kind = host._get_node_kind(node)
     if kind not in ("folder", "table", "view"):
         return False
-    children = list(node.children)
+    children = node.children
     if children:
         if len(children) == 1 and host._get_node_kind(children[0]) == "loading":
             return False
@@ -157,6 +210,53 @@ def load_columns_async(host: TreeMixinHost, node: Any, data: TableNode | ViewNod
     host.run_worker(work_async(), name=f"load-columns-{obj_name}", exclusive=False)
 
 
+def _claim_render_token(host: TreeMixinHost, node: Any) -> tuple[object, dict[int, object]]:
+    """Mark a batched render as the current one for ``node``.
+
+    A later load of the same node replaces the token, which stops any
+    batches still scheduled for the earlier load.
+    """
+    token = object()
+    tokens = getattr(host, "_node_render_tokens", None)
+    if tokens is None:
+        tokens = {}
+        setattr(host, "_node_render_tokens", tokens)
+    tokens[id(node)] = token
+    return token, tokens
+
+
+def remember_table_columns(
+    host: TreeMixinHost,
+    db_name: str | None,
+    schema_name: str | None,
+    obj_name: str,
+    columns: list[Any],
+) -> None:
+    """Store fetched columns in the schema object cache for later reuse."""
+    db_cache = host._get_object_cache().setdefault(db_name or "__default__", {})
+    entries = db_cache.setdefault(_TABLE_COLUMNS_KEY, {})
+    entries[(schema_name, obj_name)] = (time.monotonic(), columns)
+
+
+def cached_table_columns(
+    host: TreeMixinHost,
+    db_name: str | None,
+    schema_name: str | None,
+    obj_name: str,
+) -> list[Any] | None:
+    """Return columns remembered by remember_table_columns, if still fresh."""
+    db_cache = host._get_object_cache().get(db_name or "__default__")
+    if not db_cache:
+        return None
+    entry = db_cache.get(_TABLE_COLUMNS_KEY, {}).get((schema_name, obj_name))
+    if entry is None:
+        return None
+    stored_at, columns = entry
+    if time.monotonic() - stored_at >= TABLE_COLUMNS_TTL_S:
+        return None
+    return columns
+
+
 def on_columns_loaded(
     host: TreeMixinHost,
     node: Any,
@@ -167,6 +267,7 @@ def on_columns_loaded(
 ) -> None:
     """Handle column load completion on main thread."""
     clear_loading_state(host, node)
+    remember_table_columns(host, db_name, schema_name, obj_name, columns)
 
     if not columns:
         empty_child = node.add_leaf("[dim](Empty)[/]")
@@ -176,10 +277,11 @@ def on_columns_loaded(
     batch_size = 50
     total = len(columns)
     idx = 0
+    token, tokens = _claim_render_token(host, node)
 
     def render_batch() -> None:
         nonlocal idx
-        if idx >= total:
+        if idx >= total or tokens.get(id(node)) is not token:
             return
         end = min(idx + batch_size, total)
         for col in columns[idx:end]:
@@ -188,9 +290,12 @@ def on_columns_loaded(
             child = node.add_leaf(f"[dim]{col_name}[/] [italic dim]{col_type}[/]")
             child.data = ColumnNode(database=db_name, schema=schema_name, table=obj_name, name=col.name)
         idx = end
+        tree_builder.mark_tree_changed(host)
         tree_builder.restore_pending_cursor(host)
         if idx < total:
             host.set_timer(MIN_TIMER_DELAY_S, render_batch)
+        else:
+            tokens.pop(id(node), None)
 
     render_batch()
 
@@ -243,9 +348,19 @@ def load_folder_async(host: TreeMixinHost, node: Any, data: FolderNode) -> None:
                         db_name,
                     )
 
+            # Group tables/views by schema here so the UI thread only adds nodes.
+            grouped = None
+            session = host._session
+            if folder_type in ("tables", "views") and items and session is not None:
+                grouped = await asyncio.to_thread(
+                    schema_render.group_items_by_schema,
+                    items,
+                    session.provider.capabilities.default_schema,
+                )
+
             host.set_timer(
                 MIN_TIMER_DELAY_S,
-                lambda: on_folder_loaded(host, node, db_name, folder_type, items),
+                lambda: on_folder_loaded(host, node, db_name, folder_type, items, grouped=grouped),
             )
         except Exception as error:
             error_message = f"Error loading: {error}"
@@ -258,9 +373,18 @@ def load_folder_async(host: TreeMixinHost, node: Any, data: FolderNode) -> None:
 
 
 def on_folder_loaded(
-    host: TreeMixinHost, node: Any, db_name: str | None, folder_type: str, items: list[Any]
+    host: TreeMixinHost,
+    node: Any,
+    db_name: str | None,
+    folder_type: str,
+    items: list[Any],
+    *,
+    grouped: list[tuple[str, list[Any]]] | None = None,
 ) -> None:
-    """Handle folder load completion on main thread."""
+    """Handle folder load completion on main thread.
+
+    ``grouped`` carries tables/views already grouped by the loading worker.
+    """
     clear_loading_state(host, node)
 
     if not host._session:
@@ -286,12 +410,18 @@ def on_folder_loaded(
             db_node.data = DatabaseNode(name=str(db))
             db_node.allow_expand = True
             tree_builder.add_database_object_nodes(host, db_node, str(db))
-
+        tree_builder.mark_tree_changed(host)
         return
 
     if folder_type in ("tables", "views"):
         schema_render.add_schema_grouped_items(
-            host, node, db_name, folder_type, items, provider.capabilities.default_schema
+            host,
+            node,
+            db_name,
+            folder_type,
+            items,
+            provider.capabilities.default_schema,
+            grouped=grouped,
         )
         expansion_state.restore_subtree_expansion_with_paths(
             host, node, getattr(host, "_expanded_paths", set())
@@ -300,22 +430,49 @@ def on_folder_loaded(
         tree_builder.restore_pending_cursor(host)
         return
 
-    for item in items:
-        if item[0] == "procedure":
-            child = node.add_leaf(escape_markup(item[2]))
-            child.data = ProcedureNode(database=db_name, name=item[2])
-        elif item[0] == "index":
-            display = f"{escape_markup(item[1])} [dim]({escape_markup(item[2])})[/]"
-            child = node.add_leaf(display)
-            child.data = IndexNode(database=db_name, name=item[1], table_name=item[2])
-        elif item[0] == "trigger":
-            display = f"{escape_markup(item[1])} [dim]({escape_markup(item[2])})[/]"
-            child = node.add_leaf(display)
-            child.data = TriggerNode(database=db_name, name=item[1], table_name=item[2])
-        elif item[0] == "sequence":
-            child = node.add_leaf(escape_markup(item[1]))
-            child.data = SequenceNode(database=db_name, name=item[1])
-    tree_builder.restore_pending_cursor(host)
+    # Large folders (e.g. thousands of indexes) are added in batches so the
+    # event loop can handle input between them.
+    batch_size = 200
+    total = len(items)
+    idx = 0
+    token, tokens = _claim_render_token(host, node)
+
+    def render_batch() -> None:
+        nonlocal idx
+        if tokens.get(id(node)) is not token:
+            return
+        end = min(idx + batch_size, total)
+        try:
+            for item in items[idx:end]:
+                _add_folder_item(node, db_name, item)
+        except Exception:
+            return
+        idx = end
+        tree_builder.mark_tree_changed(host)
+        tree_builder.restore_pending_cursor(host)
+        if idx < total:
+            host.set_timer(MIN_TIMER_DELAY_S, render_batch)
+        else:
+            tokens.pop(id(node), None)
+
+    render_batch()
+
+
+def _add_folder_item(node: Any, db_name: str | None, item: Any) -> None:
+    if item[0] == "procedure":
+        child = node.add_leaf(escape_markup(item[2]))
+        child.data = ProcedureNode(database=db_name, name=item[2])
+    elif item[0] == "index":
+        display = f"{escape_markup(item[1])} [dim]({escape_markup(item[2])})[/]"
+        child = node.add_leaf(display)
+        child.data = IndexNode(database=db_name, name=item[1], table_name=item[2])
+    elif item[0] == "trigger":
+        display = f"{escape_markup(item[1])} [dim]({escape_markup(item[2])})[/]"
+        child = node.add_leaf(display)
+        child.data = TriggerNode(database=db_name, name=item[1], table_name=item[2])
+    elif item[0] == "sequence":
+        child = node.add_leaf(escape_markup(item[1]))
+        child.data = SequenceNode(database=db_name, name=item[1])
 
 
 def on_tree_load_error(host: TreeMixinHost, node: Any, error_message: str) -> None:
@@ -0,0 +1,17 @@
+"""Markup escaping for explorer tree labels."""
+
+from __future__ import annotations
+
+from rich.markup import escape as _rich_escape
+
+
+def escape_markup(text: str) -> str:
+    """Escape text for Rich markup, same result as ``rich.markup.escape``.
+
+    Rich only rewrites text containing ``[`` or ending in a backslash; most
+    object names contain neither, so they are returned as is without running
+    Rich's regex substitution.
+    """
+    if "[" not in text and not text.endswith("\\"):
+        return text
+    return _rich_escape(text)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from sqlit.domains.explorer.domain.tree_nodes import IndexNode, SequenceNode, TriggerNode
@@ -56,20 +58,37 @@ def show_sequence_info(host: TreeMixinHost, data: SequenceNode) -> None:
         host.notify(f"Error getting sequence info: {error}", severity="error")
 
 
+def _format_list(value: list[Any]) -> str:
+    return ", ".join(map(str, value)) if value else "(none)"
+
+
+def _format_bool(value: bool) -> str:
+    return "Yes" if value else "No"
+
+
+_VALUE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    list: _format_list,
+    bool: _format_bool,
+}
+
+
+@lru_cache(maxsize=128)
+def _display_key(key: str) -> str:
+    """Property label for an info key (keys come from a small fixed set)."""
+    return key.replace("_", " ").title()
+
+
 def display_object_info(host: TreeMixinHost, object_type: str, info: dict[str, Any]) -> None:
     """Display object info in the results table as a Property/Value view."""
     rows: list[tuple[str, str]] = []
     for key, value in info.items():
         if value is None:
             continue
-        display_key = key.replace("_", " ").title()
-        if isinstance(value, list):
-            display_value = ", ".join(str(v) for v in value) if value else "(none)"
-        elif isinstance(value, bool):
-            display_value = "Yes" if value else "No"
-        else:
-            display_value = str(value)
-        rows.append((display_key, display_value))
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is None and isinstance(value, list):
+            formatter = _format_list
+        display_value = formatter(value) if formatter is not None else str(value)
+        rows.append((_display_key(key), display_value))
 
     host._replace_results_table(["Property", "Value"], rows)
 
@@ -5,9 +5,8 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Any
 
-from rich.markup import escape as escape_markup
-
 from sqlit.domains.explorer.domain.tree_nodes import SchemaNode, TableNode, ViewNode
+from sqlit.domains.explorer.ui.tree.markup import escape_markup
 from sqlit.shared.ui.protocols import TreeMixinHost
 
 from . import builder as tree_builder
@@ -15,6 +14,23 @@ from . import expansion_state
 MIN_TIMER_DELAY_S = 0.001
 
 
+def group_items_by_schema(items: list[Any], default_schema: str) -> list[tuple[str, list[Any]]]:
+    """Group (type, schema, name) items by schema, default schema first.
+
+    Pure and thread-safe, so loaders can run it off the UI thread.
+    """
+    by_schema: dict[str, list[Any]] = defaultdict(list)
+    for item in items:
+        by_schema[item[1]].append(item)
+
+    def schema_sort_key(schema: str) -> tuple[int, str]:
+        if not schema or schema == default_schema:
+            return (0, schema)
+        return (1, schema.lower())
+
+    return [(schema, by_schema[schema]) for schema in sorted(by_schema, key=schema_sort_key)]
+
+
 def add_schema_grouped_items(
     host: TreeMixinHost,
     node: Any,
@@ -22,25 +38,23 @@ def add_schema_grouped_items(
     folder_type: str,
     items: list[Any],
     default_schema: str,
+    *,
+    grouped: list[tuple[str, list[Any]]] | None = None,
 ) -> None:
-    """Add tables/views grouped by schema."""
-    by_schema: dict[str, list[Any]] = defaultdict(list)
-    for item in items:
-        by_schema[item[1]].append(item)
+    """Add tables/views grouped by schema.
 
-    def schema_sort_key(schema: str) -> tuple[int, str]:
-        if not schema or schema == default_schema:
-            return (0, schema)
-        return (1, schema.lower())
+    ``grouped`` is the result of group_items_by_schema for ``items`` when the
+    caller already computed it.
+    """
+    if grouped is None:
+        grouped = group_items_by_schema(items, default_schema)
 
-    sorted_schemas = sorted(by_schema.keys(), key=schema_sort_key)
-    has_multiple_schemas = len(sorted_schemas) > 1
+    has_multiple_schemas = len(grouped) > 1
     schema_nodes: dict[str, Any] = {}
     items_to_add: list[tuple[Any, str, str, str]] = []
     expanded_paths = getattr(host, "_expanded_paths", set())
 
-    for schema in sorted_schemas:
-        schema_items = by_schema[schema]
+    for schema, schema_items in grouped:
         is_default = not schema or schema == default_schema
 
         if is_default and not has_multiple_schemas:
@@ -80,19 +94,22 @@ def add_schema_grouped_items(
         if tokens.get(id(node)) is not token:
             return
         end = min(idx + batch_size, len(items_to_add))
+        # Bound once per batch: each one runs for up to batch_size nodes.
+        escape = escape_markup
+        table_node, view_node = TableNode, ViewNode
+        get_node_path = expansion_state.get_node_path
         for parent, item_type, schema_name, obj_name in items_to_add[idx:end]:
             try:
-                child = parent.add(escape_markup(obj_name))
+                child = parent.add(escape(obj_name))
             except Exception:
                 return
-            if item_type == "table":
-                child.data = TableNode(database=db_name, schema=schema_name, name=obj_name)
-            else:
-                child.data = ViewNode(database=db_name, schema=schema_name, name=obj_name)
+            node_cls = table_node if item_type == "table" else view_node
+            child.data = node_cls(database=db_name, schema=schema_name, name=obj_name)
             child.allow_expand = True
-            if expansion_state.get_node_path(host, child) in expanded_paths:
+            if get_node_path(host, child) in expanded_paths:
                 child.expand()
         idx = end
+        tree_builder.mark_tree_changed(host)
         tree_builder.restore_pending_cursor(host)
         if idx < len(items_to_add):
             host.set_timer(MIN_TIMER_DELAY_S, render_batch)
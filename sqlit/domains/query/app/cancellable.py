@@ -7,6 +7,7 @@ for query execution that can be cancelled by closing the connection.
 from __future__ import annotations
 
 import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -18,6 +19,10 @@ if TYPE_CHECKING:
 
     from .query_service import NonQueryResult, QueryAnalyzer, QueryResult
 
+# Driver methods that abort an in-flight statement without draining it:
+# JDBC-style abort(), psycopg/oracledb cancel(), sqlite3/duckdb interrupt().
+_ABORT_METHODS = ("abort", "cancel", "interrupt")
+
 
 @dataclass
 class CancellableQuery:
@@ -57,10 +62,13 @@ class CancellableQuery:
     def __post_init__(self) -> None:
         """Initialize internal state."""
         self._connection: Any = None
+        self._close_fn: Callable[[], Any] | None = None
+        self._abort_fn: Callable[[], Any] | None = None
         self._created_tunnel: Any = None
+        # The lock only guards the connection handle; flags are lock-free reads.
         self._lock = threading.Lock()
-        self._cancelled = False
-        self._executing = False
+        self._cancelled = threading.Event()
+        self._executing = threading.Event()
 
     def execute(
         self,
@@ -85,10 +93,9 @@ class CancellableQuery:
 
         from .query_service import NonQueryResult, QueryResult
 
-        with self._lock:
-            if self._cancelled:
-                raise RuntimeError("Query was cancelled")
-            self._executing = True
+        if self._cancelled.is_set():
+            raise RuntimeError("Query was cancelled")
+        self._executing.set()
 
         try:
             # reuse existing tunnel or create new one
@@ -108,9 +115,11 @@ class CancellableQuery:
 
             # Create dedicated connection
             with self._lock:
-                if self._cancelled:
+                if self._cancelled.is_set():
                     raise RuntimeError("Query was cancelled")
                 self._connection = self.provider.connection_factory.connect(connect_config)
+                self._close_fn = getattr(self._connection, "close", None)
+                self._abort_fn = _find_abort(self._connection)
                 try:
                     self.provider.post_connect(self._connection, connect_config)
                 except Exception:
@@ -150,51 +159,70 @@ class CancellableQuery:
             or not yet started.
         """
         with self._lock:
-            if self._cancelled:
+            if self._cancelled.is_set():
                 return False
-            self._cancelled = True
-
-            # If we have a connection, close it to abort the query
-            if self._connection is not None:
-                try:
-                    close_fn = getattr(self._connection, "close", None)
-                    if callable(close_fn):
-                        close_fn()
-                except Exception:
-                    pass
-                self._connection = None
-
+            self._cancelled.set()
+            abort_fn = self._abort_fn
+            close_fn = self._detach_connection()
+
+        # Close outside the lock: drivers may block on socket I/O here
+        # and _cleanup() must not wait behind it. Aborting first keeps
+        # close() from draining a large in-flight result set.
+        _call_quietly(abort_fn)
+        _call_quietly(close_fn)
         return True
 
     def _cleanup(self) -> None:
         """Clean up resources (connection and tunnel)."""
+        self._executing.clear()
         with self._lock:
-            self._executing = False
+            close_fn = self._detach_connection()
+            tunnel = self._created_tunnel
+            self._created_tunnel = None
 
-            # Close connection
-            if self._connection is not None:
-                try:
-                    close_fn = getattr(self._connection, "close", None)
-                    if callable(close_fn):
-                        close_fn()
-                except Exception:
-                    pass
-                self._connection = None
+        # Close connection
+        _call_quietly(close_fn)
 
-            # Stop locally created SSH tunnel
-            if self._created_tunnel is not None:
-                try:
-                    self._created_tunnel.stop()
-                except Exception:
-                    pass
-                self._created_tunnel = None
+        # Stop locally created SSH tunnel
+        if tunnel is not None:
+            _call_quietly(tunnel.stop)
+
+    def _detach_connection(self) -> Callable[[], Any] | None:
+        """Drop the connection handle and return its close method.
+
+        Must be called with the lock held; the caller closes outside it.
+        """
+        close_fn = self._close_fn
+        self._connection = None
+        self._close_fn = None
+        self._abort_fn = None
+        return close_fn
 
     @property
     def is_cancelled(self) -> bool:
         """Check if this query has been cancelled."""
-        return self._cancelled
+        return self._cancelled.is_set()
 
     @property
     def is_executing(self) -> bool:
         """Check if this query is currently executing."""
-        return self._executing
+        return self._executing.is_set()
+
+
+def _call_quietly(fn: Callable[[], Any] | None) -> None:
+    """Call a close/stop function, ignoring driver errors."""
+    if fn is None:
+        return
+    try:
+        fn()
+    except Exception:
+        pass
+
+
+def _find_abort(connection: Any) -> Callable[[], Any] | None:
+    """Return the connection's statement-abort method, if the driver has one."""
+    for name in _ABORT_METHODS:
+        abort_fn = getattr(connection, name, None)
+        if callable(abort_fn):
+            return abort_fn
+    return None
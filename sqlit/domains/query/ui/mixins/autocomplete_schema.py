@@ -730,7 +730,7 @@ class AutocompleteSchemaMixin:
         self._schema_indexing = True
         if self._schema_spinner is not None:
             self._schema_spinner.stop()
-        spinner = Spinner(self, on_tick=lambda _: self._update_status_bar(), fps=10)
+        spinner = Spinner(self, on_tick=lambda _: self._request_status_refresh(), fps=10)
         self._schema_spinner = spinner
         spinner.start()
 
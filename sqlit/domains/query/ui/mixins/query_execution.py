@@ -254,7 +254,7 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
         self._query_start_time = time.perf_counter()
         if self._query_spinner is not None:
             self._query_spinner.stop()
-        self._query_spinner = Spinner(self, on_tick=lambda _: self._update_status_bar(), fps=30)
+        self._query_spinner = Spinner(self, on_tick=lambda _: self._request_status_refresh(), fps=30)
         self._query_spinner.start()
         self._update_footer_bindings()
 
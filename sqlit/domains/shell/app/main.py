@@ -7,6 +7,7 @@ import platform
 import subprocess
 import sys
 import time
+from array import array
 from datetime import datetime
 from collections.abc import Awaitable, Callable
 from pathlib import Path
@@ -114,7 +115,8 @@ class SSMSTUI(
         self._startup_profile = self.services.runtime.profile_startup
         self._startup_mark = self.services.runtime.startup_mark
         self._startup_init_time = time.perf_counter()
-        self._startup_events: list[tuple[str, float]] = []
+        self._startup_step_names: list[str] = []
+        self._startup_step_ts: array[float] = array("d")
         self._launch_ms: float | None = None
         self._startup_stamp("init_start")
         self.connections: list[ConnectionConfig] = []
@@ -124,6 +126,7 @@ class SSMSTUI(
         self.current_ssh_tunnel: Any | None = None
         self.vim_mode: VimMode = VimMode.NORMAL
         self._expanded_paths: set[str] = set()
+        self._persisted_expanded_paths: frozenset[str] | None = None
         self._selected_connection_names: set[str] = set()
         self._tree_visual_mode_anchor: str | None = None
         self._leader_pending_menu: str = "leader"
@@ -150,16 +153,11 @@ class SSMSTUI(
         # Undo/redo history for query editor
         self._undo_history: Any = None  # Lazy init UndoHistory
         self._fullscreen_mode: str = "none"
-        self._last_notification: str = ""
-        self._last_notification_severity: str = "information"
-        self._last_notification_time: str = ""
-        self._notification_timer: Timer | None = None
-        self._notification_history: list[tuple[str, str, str]] = []
+        self._init_status_state()
         self._connection_failed: bool = False
         self._leader_timer: Timer | None = None
         self._leader_pending: bool = False
         self._dialog_open: bool = False
-        self._last_active_pane: str | None = None
         self._query_worker: Worker[Any] | None = None
         self._query_handle: Any | None = None
         self._command_mode: bool = False
@@ -1154,11 +1152,13 @@ class SSMSTUI(
 
     def on_mount(self) -> None:
         """Initialize the app."""
+        self._cache_pane_refs()
         run_on_mount(cast(AppProtocol, self))
         self._apply_theme_classes()
 
     def on_unmount(self) -> None:
         """Clean up background timers when the app exits."""
+        self._clear_pane_refs()
         if self._idle_scheduler is not None:
             self._idle_scheduler.stop()
             self._idle_scheduler = None
@@ -1179,7 +1179,8 @@ class SSMSTUI(
     def _startup_stamp(self, name: str) -> None:
         if not self._startup_profile:
             return
-        self._startup_events.append((name, time.perf_counter()))
+        self._startup_step_names.append(name)
+        self._startup_step_ts.append(time.perf_counter())
 
     def _record_launch_ms(self) -> None:
         base = self._startup_mark if self._startup_mark is not None else self._startup_init_time
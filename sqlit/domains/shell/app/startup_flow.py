@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import json
 import sys
-import tempfile
 import time
-from pathlib import Path
+from collections.abc import Callable
+from typing import Any
 
 from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.ui.restart_cache import clear_restart_cache, get_restart_cache_path
 from sqlit.domains.explorer.ui.tree import builder as tree_builder
 from sqlit.domains.shell.app.idle_scheduler import init_idle_scheduler
 from sqlit.shared.app.startup_profiler import write_line
@@ -38,7 +39,10 @@ def run_on_mount(app: AppProtocol) -> None:
     app._keymap_manager.initialize()
     app._startup_stamp("keymap_loaded")
 
-    app._expanded_paths = set(settings.get("expanded_nodes", []))
+    app._expanded_paths = {
+        sys.intern(path) for path in settings.get("expanded_nodes", []) if isinstance(path, str)
+    }
+    app._persisted_expanded_paths = frozenset(app._expanded_paths)
     if settings.get("debug_events_enabled"):
         setter = getattr(app, "_set_debug_events_enabled", None)
         if callable(setter):
@@ -170,10 +174,10 @@ def setup_startup_connection(app: AppProtocol, config: ConnectionConfig) -> None
     app._startup_connect_config = config
 
 
-def log_startup_timing(app: AppProtocol) -> None:
+def log_startup_timing(app: AppProtocol, _now: Callable[[], float] = time.perf_counter) -> None:
     if not app._startup_profile:
         return
-    now = time.perf_counter()
+    now = _now()
     since_start = (now - app._startup_mark) * 1000 if app._startup_mark is not None else None
     init_to_mount = (now - app._startup_init_time) * 1000
 
@@ -185,7 +189,7 @@ def log_startup_timing(app: AppProtocol) -> None:
     _log_startup_steps(app)
 
     def after_refresh() -> None:
-        now_refresh = time.perf_counter()
+        now_refresh = _now()
         start_to_refresh = (now_refresh - app._startup_mark) * 1000 if app._startup_mark is not None else None
         init_to_refresh = (now_refresh - app._startup_init_time) * 1000
 
@@ -201,7 +205,7 @@ def log_startup_timing(app: AppProtocol) -> None:
 
 
 def _log_startup_steps(app: AppProtocol) -> None:
-    for name, ts in app._startup_events:
+    for name, ts in zip(app._startup_step_names, app._startup_step_ts):
         _log_startup_step(app, name, ts)
 
 
@@ -230,22 +234,13 @@ def _maybe_exit_after_refresh(app: AppProtocol) -> None:
         pass
 
 
-def _get_restart_cache_path() -> Path:
-    return Path(tempfile.gettempdir()) / "sqlit-driver-install-restore.json"
-
-
-def maybe_auto_connect_pending(app: AppProtocol) -> bool:
+def maybe_auto_connect_pending(app: AppProtocol, _loads: Callable[[str], Any] = json.loads) -> bool:
     """Auto-connect to a pending connection after driver install restart.
 
     Returns True if a connection was initiated, False otherwise.
     """
     from sqlit.shared.core.debug_events import emit_debug_event
 
-    from sqlit.domains.connections.ui.restart_cache import (
-        clear_restart_cache,
-        get_restart_cache_path,
-    )
-
     cache_path = get_restart_cache_path()
     emit_debug_event(
         "startup.pending_connection_check",
@@ -261,7 +256,7 @@ def maybe_auto_connect_pending(app: AppProtocol) -> bool:
     )
 
     try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        payload = _loads(cache_path.read_text(encoding="utf-8"))
     except Exception as e:
         emit_debug_event("startup.pending_connection_parse_error", error=str(e))
         clear_restart_cache()
@@ -289,12 +284,12 @@ def maybe_auto_connect_pending(app: AppProtocol) -> bool:
     emit_debug_event(
         "startup.pending_connection_lookup",
         connection_name=connection_name,
-        available_connections=[getattr(c, "name", None) for c in app.connections],
+        available_connections=[c.name for c in app.connections],
     )
 
     # Find the connection by name
     config = next(
-        (c for c in app.connections if getattr(c, "name", None) == connection_name),
+        (c for c in app.connections if c.name == connection_name),
         None,
     )
     if config is None:
@@ -311,14 +306,14 @@ def maybe_auto_connect_pending(app: AppProtocol) -> bool:
     return True
 
 
-def maybe_restore_connection_screen(app: AppProtocol) -> None:
+def maybe_restore_connection_screen(app: AppProtocol, _loads: Callable[[str], Any] = json.loads) -> None:
     """Restore an in-progress connection form after a driver-install restart."""
-    cache_path = _get_restart_cache_path()
+    cache_path = get_restart_cache_path()
     if not cache_path.exists():
         return
 
     try:
-        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        payload = _loads(cache_path.read_text(encoding="utf-8"))
     except Exception:
         try:
             cache_path.unlink(missing_ok=True)
@@ -347,7 +342,7 @@ def maybe_restore_connection_screen(app: AppProtocol) -> None:
 
     config = None
     if editing and isinstance(original_name, str) and original_name:
-        config = next((c for c in app.connections if getattr(c, "name", None) == original_name), None)
+        config = next((c for c in app.connections if c.name == original_name), None)
 
     if config is None:
         config = ConnectionConfig(
@@ -0,0 +1 @@
+"""Static text resources for the shell UI."""
@@ -10,8 +10,13 @@ adding or overriding specific behaviors.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from importlib.resources import files
+
 from sqlit.core.input_context import InputContext
-from sqlit.core.keymap import format_key
+from sqlit.core.keymap import KeymapProvider, format_key, get_keymap
 from sqlit.core.leader_commands import get_leader_commands
 from sqlit.core.state_base import (
     ActionResult,
@@ -83,7 +88,7 @@ class UIStateMachine:
         self.value_view_tree_mode = ValueViewTreeModeState(parent=self.value_view_active)
         self.value_view_syntax_mode = ValueViewSyntaxModeState(parent=self.value_view_active)
 
-        self._states = [
+        self._states: tuple[State, ...] = (
             self.modal_active,
             self.leader_pending,
             self.tree_filter_active,  # Before tree_focused (more specific when filter active)
@@ -106,17 +111,32 @@ class UIStateMachine:
             self.results_focused,
             self.main_screen,
             self.root,
-        ]
+        )
+        # Bound is_active probes in priority order, resolved once so the
+        # per-keystroke scan skips the method lookup on each state.
+        self._probes: tuple[tuple[Callable[[InputContext], bool], State], ...] = tuple(
+            (state.is_active, state) for state in self._states
+        )
+        # Action checks are pure functions of the input snapshot and the active
+        # keymap (leader commands), so repeated footer/binding checks hit the cache.
+        self._check_cached = lru_cache(maxsize=512)(self._check_action_uncached)
 
     def get_active_state(self, app: InputContext) -> State:
         """Find the most specific active state."""
-        for state in self._states:
-            if state.is_active(app):
+        for is_active, state in self._probes:
+            if is_active(app):
                 return state
         return self.root
 
     def check_action(self, app: InputContext, action_name: str) -> bool:
         """Check if action is allowed in current state."""
+        return self._check_cached(app, get_keymap(), action_name)
+
+    def clear_action_cache(self) -> None:
+        """Drop cached action checks (e.g. after state definitions change)."""
+        self._check_cached.cache_clear()
+
+    def _check_action_uncached(self, app: InputContext, keymap: KeymapProvider, action_name: str) -> bool:
         state = self.get_active_state(app)
         result = state.check_action(app, action_name)
         return result == ActionResult.ALLOWED
@@ -133,189 +153,40 @@ class UIStateMachine:
 
     def generate_help_text(self) -> str:
         """Generate structured help text with organized sections."""
-        from sqlit.core.keymap import format_key
-
         leader_key = resolve_display_key("leader_key") or "<space>"
 
-        def section(title: str) -> str:
-            divider = "-" * 62
-            return f"[bold $primary]{title}[/]\n[dim]{divider}[/]"
-
-        def subsection(title: str) -> str:
-            return f"  [bold $text-muted]{title}[/]"
-
-        def binding(key: str, desc: str, indent: int = 4) -> str:
-            pad = " " * indent
-            return f"{pad}[bold $warning]{key:<14}[/] [dim]-[/] {desc}"
-
-        lines: list[str] = []
-
-        # ═══════════════════════════════════════════════════════════════════
-        # GLOBAL
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("GLOBAL"))
-        lines.append(binding(":q", "Quit"))
-        lines.append(binding(f"{leader_key}t", "Change theme"))
-        lines.append(binding(f"{leader_key}f", "Toggle fullscreen pane"))
-        lines.append(binding(f"{leader_key}e", "Toggle explorer visibility"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # NAVIGATION
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("NAVIGATION"))
-        lines.append(binding("e", "Focus Explorer pane"))
-        lines.append(binding("q", "Focus Query pane"))
-        lines.append(binding("r", "Focus Results pane"))
-        lines.append(binding(leader_key, "Open command menu"))
-        lines.append(binding("?", "Show this help"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # EXPLORER
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("EXPLORER"))
-        lines.append(binding("j/k", "Move cursor down/up"))
-        lines.append(binding("<enter>", "Expand node / Connect"))
-        lines.append(binding("s", "SELECT TOP 100 (on table/view)"))
-        lines.append(binding("/", "Filter tree"))
-        lines.append(binding("z", "Collapse all nodes"))
-        lines.append(binding("f", "Refresh tree"))
-        lines.append("")
-        lines.append(subsection("On Connection Node:"))
-        lines.append(binding("n", "New connection"))
-        lines.append(binding("e", "Edit connection"))
-        lines.append(binding("d", "Delete connection"))
-        lines.append(binding("D", "Duplicate connection"))
-        lines.append(binding("x", "Disconnect"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # QUERY EDITOR
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("QUERY EDITOR"))
-        lines.append(subsection("Normal Mode:"))
-        lines.append(binding("i/I", "Enter INSERT mode"))
-        lines.append(binding("o/O", "Open line below/above"))
-        lines.append(binding("C", "Change to line end"))
-        lines.append(binding("D", "Delete to line end"))
-        lines.append(binding("<enter>/gr", "Execute query"))
-        lines.append(binding("gt", "Execute as transaction"))
-        lines.append(binding("<backspace>", "Query history"))
-        lines.append(binding("N", "New query (clear)"))
-        lines.append(binding("u", "Undo"))
-        lines.append(binding("^r", "Redo"))
-        lines.append("")
-        lines.append(subsection("Insert Mode:"))
-        lines.append(binding("<esc>", "Exit to NORMAL mode"))
-        lines.append(binding("^<enter>", "Execute (stay in INSERT)"))
-        lines.append(binding("<tab>", "Accept autocomplete"))
-        lines.append(binding("^a", "Select all"))
-        lines.append(binding("^c", "Copy selection"))
-        lines.append(binding("^v", "Paste"))
-        lines.append("")
-        lines.append(subsection("Vim Operators (Normal Mode):"))
-        lines.append(binding("y{motion}", "Copy"))
-        lines.append(binding("d{motion}", "Delete"))
-        lines.append(binding("c{motion}", "Change (delete + INSERT)"))
-        lines.append(binding("p", "Paste after cursor"))
-        lines.append("")
-        lines.append(subsection("Vim Motions:"))
-        lines.append(binding("h/j/k/l", "Cursor left/down/up/right"))
-        lines.append(binding("w/W", "Word forward"))
-        lines.append(binding("b/B", "Word backward"))
-        lines.append(binding("0/$", "Line start/end"))
-        lines.append(binding("gg/G", "File start/end"))
-        lines.append(binding("f{c}/F{c}", "Find char forward/back"))
-        lines.append(binding("t{c}/T{c}", "Till char forward/back"))
-        lines.append(binding("%", "Matching bracket"))
-        lines.append("")
-        lines.append(subsection("Text Objects (with i=inner, a=around):"))
-        lines.append(binding("iw/aw", "Word"))
-        lines.append(binding('i"/a"', "Double quotes"))
-        lines.append(binding("i'/a'", "Single quotes"))
-        lines.append(binding("i)/a)", "Parentheses"))
-        lines.append(binding("i}/a}", "Braces"))
-        lines.append(binding("i]/a]", "Brackets"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # RESULTS
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("RESULTS"))
-        lines.append(binding("h/j/k/l", "Navigate cells"))
-        lines.append(binding("v", "Preview cell (inline)"))
-        lines.append(binding("V", "View full cell value"))
-        lines.append(binding("u", "Generate UPDATE statement"))
-        lines.append(binding("d", "Generate DELETE statement"))
-        lines.append(binding("/", "Filter rows"))
-        lines.append(binding("x", "Clear results"))
-        lines.append(binding("<tab>", "Next result set"))
-        lines.append(binding("<s-tab>", "Previous result set"))
-        lines.append(binding("z", "Collapse/expand result"))
-        lines.append("")
-        lines.append(subsection("Copy Menu (y):"))
-        lines.append(binding("yc", "Copy cell"))
-        lines.append(binding("yy", "Copy row"))
-        lines.append(binding("ya", "Copy all"))
-        lines.append(binding("ye", "Export menu..."))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # FILTERING
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("FILTERING"))
-        lines.append(binding("/", "Open filter (Explorer/Results)"))
-        lines.append(binding("<enter>", "Apply filter"))
-        lines.append(binding("<esc>", "Close filter"))
-        lines.append(binding("~prefix", "Fuzzy match mode"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # COMMAND MENU
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section(f"COMMAND MENU ({leader_key})"))
-        leader_cmds = get_leader_commands("leader")
-        by_cat: dict[str, list[tuple[str, str]]] = {}
-        for cmd in leader_cmds:
-            if cmd.category not in by_cat:
-                by_cat[cmd.category] = []
-            by_cat[cmd.category].append((cmd.key, cmd.label))
-
-        for cat in ["View", "Connection", "Actions"]:
-            if cat in by_cat:
-                lines.append(subsection(f"{cat}:"))
-                for key, label in by_cat[cat]:
-                    lines.append(binding(f"{leader_key}{format_key(key)}", label))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # CONNECTION PICKER
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("CONNECTION PICKER"))
-        lines.append(binding("/", "Search connections"))
-        lines.append(binding("j/k", "Navigate list"))
-        lines.append(binding("<enter>", "Connect to selected"))
-        lines.append(binding("n", "New connection"))
-        lines.append(binding("e", "Edit connection"))
-        lines.append(binding("d", "Delete connection"))
-        lines.append(binding("D", "Duplicate connection"))
-        lines.append(binding("<esc>", "Close picker"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # COMMAND MODE
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("COMMAND MODE"))
-        lines.append(binding(":", "Enter command mode"))
-        lines.append(binding(":commands", "Show command list"))
-        lines.append("")
-
-        # ═══════════════════════════════════════════════════════════════════
-        # SETTINGS
-        # ═══════════════════════════════════════════════════════════════════
-        lines.append(section("SETTINGS"))
-        lines.append(binding(":alert off|delete|write", "Confirm risky queries"))
-        lines.append(binding(":set ln on|off|relative", "Line numbers"))
-
-        return "\n".join(lines)
+        text = _LEADER_BINDING_RE.sub(
+            lambda match: _binding_key(leader_key + match.group(1)),
+            _load_help_template(),
+        )
+        text = text.replace("{leader_commands}", _leader_commands_help(leader_key))
+        return text.replace("{leader_key}", leader_key)
+
+
+# Leader-prefixed binding keys; re-padded once the real leader key is known.
+_LEADER_BINDING_RE = re.compile(r"(?<=\[bold \$warning\])\{leader_key\}([^\[\s]*)\[/\]")
+
+
+@lru_cache(maxsize=1)
+def _load_help_template() -> str:
+    """Load the static help body; leader keys are substituted per call."""
+    return files("sqlit.domains.shell.resources").joinpath("help.txt").read_text(encoding="utf-8").rstrip("\n")
+
+
+def _binding_key(key: str) -> str:
+    return f"{key:<14}[/]"
+
+
+def _leader_commands_help(leader_key: str) -> str:
+    """Render the command-menu section from the live leader command registry."""
+    by_cat: dict[str, list[tuple[str, str]]] = {}
+    for cmd in get_leader_commands("leader"):
+        by_cat.setdefault(cmd.category, []).append((cmd.key, cmd.label))
+
+    lines: list[str] = []
+    for cat in ["View", "Connection", "Actions"]:
+        if cat in by_cat:
+            lines.append(f"  [bold $text-muted]{cat}:[/]")
+            for key, label in by_cat[cat]:
+                lines.append(f"    [bold $warning]{_binding_key(leader_key + format_key(key))} [dim]-[/] {label}")
+    return "\n".join(lines)
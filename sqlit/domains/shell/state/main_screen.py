@@ -24,6 +24,4 @@ class MainScreenState(State):
         self.allows("show_help", key="?", label="Help")
 
     def is_active(self, app: InputContext) -> bool:
-        if app.modal_open:
-            return False
-        return not app.query_executing
+        return app.main_screen_active
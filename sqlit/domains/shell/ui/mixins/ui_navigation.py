@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from textual.timer import Timer
 
+from sqlit.core.vim import VimMode
 from sqlit.shared.ui.protocols import UINavigationMixinHost
 
 from .ui_leader import UILeaderMixin
@@ -14,27 +15,33 @@ from .ui_status import UIStatusMixin
 if TYPE_CHECKING:
     pass
 
+_FULLSCREEN_CLASSES = {
+    "explorer": "explorer-fullscreen",
+    "query": "query-fullscreen",
+    "results": "results-fullscreen",
+}
+_ALL_FULLSCREEN_CLASSES = frozenset(_FULLSCREEN_CLASSES.values())
+
 
 class UINavigationMixin(UIStatusMixin, UILeaderMixin):
     """Mixin providing UI navigation and vim mode functionality."""
 
-    _notification_timer: Timer | None = None
     _leader_timer: Timer | None = None
-    _last_active_pane: str | None = None
+    _chrome_dirty: bool = False
 
     def _set_fullscreen_mode(self: UINavigationMixinHost, mode: str) -> None:
         """Set fullscreen mode: none|explorer|query|results."""
+        if self._fullscreen_mode == mode:
+            return
         self._fullscreen_mode = mode
-        self.screen.remove_class("results-fullscreen")
-        self.screen.remove_class("query-fullscreen")
-        self.screen.remove_class("explorer-fullscreen")
-
-        if mode == "results":
-            self.screen.add_class("results-fullscreen")
-        elif mode == "query":
-            self.screen.add_class("query-fullscreen")
-        elif mode == "explorer":
-            self.screen.add_class("explorer-fullscreen")
+        screen = self.screen
+        classes = screen.classes - _ALL_FULLSCREEN_CLASSES
+        target = _FULLSCREEN_CLASSES.get(mode)
+        if target is not None:
+            classes |= {target}
+        # Apply the whole transition in one style update.
+        if classes != screen.classes:
+            screen.set_classes(classes)
 
     def action_focus_explorer(self: UINavigationMixinHost) -> None:
         """Focus the Explorer pane."""
@@ -52,8 +59,6 @@ class UINavigationMixin(UIStatusMixin, UILeaderMixin):
 
     def action_focus_query(self: UINavigationMixinHost) -> None:
         """Focus the Query pane (in NORMAL mode)."""
-        from sqlit.core.vim import VimMode
-
         self._clear_count_buffer()  # Clear any pending count prefix
         if self._fullscreen_mode != "none":
             self._set_fullscreen_mode("none")
@@ -92,8 +97,6 @@ class UINavigationMixin(UIStatusMixin, UILeaderMixin):
 
     def action_enter_insert_mode(self: UINavigationMixinHost) -> None:
         """Enter INSERT mode for query editing."""
-        from sqlit.core.vim import VimMode
-
         if self.query_input.has_focus and self.vim_mode == VimMode.NORMAL:
             self.vim_mode = VimMode.INSERT
             self.query_input.read_only = False
@@ -102,8 +105,6 @@ class UINavigationMixin(UIStatusMixin, UILeaderMixin):
 
     def action_exit_insert_mode(self: UINavigationMixinHost) -> None:
         """Exit INSERT mode, return to NORMAL mode."""
-        from sqlit.core.vim import VimMode
-
         self._clear_count_buffer()  # Clear any pending count prefix
         if self.vim_mode == VimMode.INSERT:
             self.vim_mode = VimMode.NORMAL
@@ -202,9 +203,6 @@ class UINavigationMixin(UIStatusMixin, UILeaderMixin):
 
     def on_descendant_focus(self: UINavigationMixinHost, event: Any) -> None:
         """Handle focus changes to update section labels and footer."""
-        from sqlit.core.vim import VimMode
-
-        self._update_section_labels()
         try:
             has_query_focus = self.query_input.has_focus
         except Exception:
@@ -215,9 +213,23 @@ class UINavigationMixin(UIStatusMixin, UILeaderMixin):
                 self.query_input.read_only = True
             except Exception:
                 pass
-        self._update_footer_bindings()
-        self._update_vim_mode_visuals()
+        self._schedule_chrome_refresh()
 
     def on_descendant_blur(self: UINavigationMixinHost, event: Any) -> None:
         """Handle blur to update section labels."""
-        self.call_later(self._update_section_labels)
+        self._schedule_chrome_refresh()
+
+    def _schedule_chrome_refresh(self: UINavigationMixinHost) -> None:
+        """Coalesce focus/blur bursts into a single chrome refresh per frame."""
+        if self._chrome_dirty:
+            return
+        self._chrome_dirty = True
+        self.call_after_refresh(self._flush_chrome)
+
+    def _flush_chrome(self: UINavigationMixinHost) -> None:
+        """Refresh pane labels, footer, and vim visuals in one repaint."""
+        self._chrome_dirty = False
+        with self.batch_update():
+            self._update_section_labels()
+            self._update_footer_bindings()
+            self._update_vim_mode_visuals()
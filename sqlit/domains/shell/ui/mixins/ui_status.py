@@ -2,29 +2,145 @@
 
 from __future__ import annotations
 
+import re
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+from rich.markup import escape as escape_markup
+from textual.app import ScreenStackError
+from textual.css.query import NoMatches
+
+from sqlit.core.keymap import get_keymap
+from sqlit.core.state_base import resolve_display_key
+from sqlit.core.vim import VimMode
 from sqlit.domains.connections.providers.metadata import get_connection_display_info
+from sqlit.domains.shell.app.themes import (
+    DEFAULT_MODE_COLORS,
+    MODE_INSERT_COLOR_VAR,
+    MODE_NORMAL_COLOR_VAR,
+)
+from sqlit.shared.core.utils import format_duration_ms
 from sqlit.shared.ui.protocols import UINavigationMixinHost
+from sqlit.shared.ui.spinner import SPINNER_FRAMES
+from sqlit.shared.ui.widgets import ContextFooter
+
+# Oldest notifications are dropped once the history reaches this size
+NOTIFICATION_HISTORY_LIMIT = 500
+
+_MARKUP_RE = re.compile(r"\[.*?\]")
+_WS_RE = re.compile(r"\s+")
+
+# Widget ids that identify which pane owns the focused widget
+_PANE_BY_WIDGET_ID = {
+    "object-tree": "explorer",
+    "sidebar": "explorer",
+    "query-input": "query",
+    "query-area": "query",
+    "results-table": "results",
+    "results-area": "results",
+}
+
+
+@lru_cache(maxsize=32)
+def _pane_title(key: str, label: str, active: bool, dialog_open: bool) -> str:
+    """Build a pane border title; only a handful of combinations exist."""
+    if active and dialog_open:
+        # Active pane with dialog: key matches border (disabled), title stays primary
+        # Border reverts to default (active-pane class removed)
+        return f"[$border]\\[{key}][/] [$primary]{label}[/]"
+    if active:
+        # Active pane, no dialog: both key and title primary
+        return f"[$primary]\\[{key}] {label}[/]"
+    # Inactive pane: key and title match border color via CSS
+    return f"\\[{key}] {label}"
+
+
+@lru_cache(maxsize=128)
+def _flatten(message: str) -> str:
+    """Collapse a (possibly multi-line) error message onto a single line."""
+    return _WS_RE.sub(" ", message).strip()
 
 
 class UIStatusMixin:
     """Mixin providing status bar and footer updates."""
 
-    _notification_timer: Any | None = None
-    _last_notification: str = ""
-    _last_notification_severity: str = "information"
-    _last_notification_time: str = ""
-    _notification_history: list[tuple[str, str, str]] = []
-    _last_active_pane: str | None = None
-    def _update_section_labels(self: UINavigationMixinHost) -> None:
-        """Update section labels to highlight the active pane."""
+    _notification_timer: Any | None
+    _last_notification: str
+    _last_notification_severity: str
+    _last_notification_time: str
+    _notification_history: deque[tuple[str, str, str]]
+    _last_active_pane: str | None
+    _chrome_screen: Any | None
+    _pane_explorer: Any | None
+    _pane_query: Any | None
+    _pane_results: Any | None
+    _footer: Any | None
+    _pane_titles: dict[str, str]
+    _last_footer_ctx: tuple[Any, Any] | None
+    _last_status_render: str | None
+    _status_refresh_pending: bool
+    _conn_info_cache: tuple[tuple[Any, ...], str] | None
+    _status_width: int | None
+
+    def _init_status_state(self: UINavigationMixinHost) -> None:
+        """Initialize per-instance status, notification, and chrome state."""
+        self._notification_timer = None
+        self._last_notification = ""
+        self._last_notification_severity = "information"
+        self._last_notification_time = ""
+        self._notification_history = deque(maxlen=NOTIFICATION_HISTORY_LIMIT)
+        self._last_active_pane = None
+        self._clear_pane_refs()
+        self._last_status_render = None
+        self._status_refresh_pending = False
+        self._conn_info_cache = None
+        self._status_width = None
+
+    def _cache_pane_refs(self: UINavigationMixinHost) -> None:
+        """Resolve the pane and footer widgets once after compose."""
         try:
-            pane_explorer = self.query_one("#sidebar")
-            pane_query = self.query_one("#query-area")
-            pane_results = self.query_one("#results-area")
+            self._pane_explorer = self.query_one("#sidebar")
+            self._pane_query = self.query_one("#query-area")
+            self._pane_results = self.query_one("#results-area")
+            self._footer = self.query_one(ContextFooter)
         except Exception:
+            self._clear_pane_refs()
+            return
+        self._pane_titles = {}
+        self._chrome_screen = self.screen
+
+    def _clear_pane_refs(self: UINavigationMixinHost) -> None:
+        """Drop cached pane and footer widgets."""
+        self._chrome_screen = None
+        self._pane_explorer = None
+        self._pane_query = None
+        self._pane_results = None
+        self._footer = None
+        self._pane_titles = {}
+        self._last_footer_ctx = None
+
+    def _safe_query_one(self: UINavigationMixinHost, selector: str) -> Any | None:
+        """Return the widget matching selector on the active screen, or None."""
+        try:
+            return self.query_one(selector)
+        except (NoMatches, ScreenStackError):
+            # No screen is active while the app starts up or shuts down.
+            return None
+
+    def _chrome_ready(self: UINavigationMixinHost) -> bool:
+        """True when cached chrome widgets belong to the active screen."""
+        return self._chrome_screen is not None and self._chrome_screen is self.screen
+
+    def _update_section_labels(self: UINavigationMixinHost) -> None:
+        """Update section labels to highlight the active pane."""
+        if not self._chrome_ready():
             return
+        pane_explorer = self._pane_explorer
+        pane_query = self._pane_query
+        pane_results = self._pane_results
 
         # Find which pane is focused
         active_pane = None
@@ -32,15 +148,8 @@ class UIStatusMixin:
         if focused:
             widget = focused
             while widget:
-                widget_id = getattr(widget, "id", None)
-                if widget_id == "object-tree" or widget_id == "sidebar":
-                    active_pane = "explorer"
-                    break
-                elif widget_id == "query-input" or widget_id == "query-area":
-                    active_pane = "query"
-                    break
-                elif widget_id == "results-table" or widget_id == "results-area":
-                    active_pane = "results"
+                active_pane = _PANE_BY_WIDGET_ID.get(getattr(widget, "id", None))
+                if active_pane:
                     break
                 widget = getattr(widget, "parent", None)
 
@@ -52,20 +161,21 @@ class UIStatusMixin:
         # When dialog is open, remove active-pane class (border reverts to default)
         # but title text will stay primary via explicit markup in _sync_active_pane_title
         dialog_open = bool(getattr(self, "_dialog_open", False))
-        pane_explorer.remove_class("active-pane")
-        pane_query.remove_class("active-pane")
-        pane_results.remove_class("active-pane")
-
-        if not dialog_open:
-            last_active = getattr(self, "_last_active_pane", None)
-            if last_active == "explorer":
-                pane_explorer.add_class("active-pane")
-            elif last_active == "query":
-                pane_query.add_class("active-pane")
-            elif last_active == "results":
-                pane_results.add_class("active-pane")
-
-        self._sync_active_pane_title()
+        with self.batch_update():
+            pane_explorer.remove_class("active-pane")
+            pane_query.remove_class("active-pane")
+            pane_results.remove_class("active-pane")
+
+            if not dialog_open:
+                last_active = self._last_active_pane
+                if last_active == "explorer":
+                    pane_explorer.add_class("active-pane")
+                elif last_active == "query":
+                    pane_query.add_class("active-pane")
+                elif last_active == "results":
+                    pane_results.add_class("active-pane")
+
+            self._sync_active_pane_title()
 
     def _sync_active_pane_title(self: UINavigationMixinHost) -> None:
         """Adjust pane title color when dialogs are open.
@@ -79,15 +189,14 @@ class UIStatusMixin:
         - $border (white) for inactive panes
         - $primary for active pane (via .active-pane class)
         """
-        try:
-            pane_explorer = self.query_one("#sidebar")
-            pane_query = self.query_one("#query-area")
-            pane_results = self.query_one("#results-area")
-        except Exception:
+        if not self._chrome_ready():
             return
+        pane_explorer = self._pane_explorer
+        pane_query = self._pane_query
+        pane_results = self._pane_results
 
         dialog_open = bool(getattr(self, "_dialog_open", False))
-        active_pane = getattr(self, "_last_active_pane", None)
+        active_pane = self._last_active_pane
 
         direct_config = getattr(self, "_direct_connection_config", None)
         direct_active = (
@@ -96,18 +205,15 @@ class UIStatusMixin:
             and direct_config.name == self.current_config.name
         )
         explorer_label = "Direct connection" if direct_active else "Explorer"
+        titles = self._pane_titles
 
         def set_title(pane: Any, key: str, label: str, *, active: bool) -> None:
-            if active and dialog_open:
-                # Active pane with dialog: key matches border (disabled), title stays primary
-                # Border reverts to default (active-pane class removed)
-                pane.border_title = f"[$border]\\[{key}][/] [$primary]{label}[/]"
-            elif active:
-                # Active pane, no dialog: both key and title primary
-                pane.border_title = f"[$primary]\\[{key}] {label}[/]"
-            else:
-                # Inactive pane: key and title match border color via CSS
-                pane.border_title = f"\\[{key}] {label}"
+            title = _pane_title(key, label, active, dialog_open)
+            # Re-assigning an identical title still triggers a refresh; compare
+            # against what we last set since the getter returns normalized markup.
+            if titles.get(key) != title:
+                titles[key] = title
+                pane.border_title = title
 
         set_title(pane_explorer, "e", explorer_label, active=active_pane == "explorer")
         set_title(pane_query, "q", "Query", active=active_pane == "query")
@@ -123,148 +229,161 @@ class UIStatusMixin:
 
         Only shows vim mode indicators when query pane has focus.
         """
-        from sqlit.core.vim import VimMode
-
-        try:
-            query_area = self.query_one("#query-area")
-            has_query_focus = self.query_input.has_focus
-        except Exception:
+        if not self._chrome_ready():
+            return
+        query_area = self._pane_query
+        query_input = self._safe_query_one("#query-input")
+        if query_input is None:
             return
+        has_query_focus = query_input.has_focus
 
-        # Update CSS classes for border and cursor color
-        # Only show vim mode colors when query pane has focus
-        query_area.remove_class("vim-normal", "vim-insert")
-        if has_query_focus:
-            if self.vim_mode == VimMode.NORMAL:
-                query_area.add_class("vim-normal")
-            else:
-                query_area.add_class("vim-insert")
+        with self.batch_update():
+            # Update CSS classes for border and cursor color
+            # Only show vim mode colors when query pane has focus
+            query_area.remove_class("vim-normal", "vim-insert")
+            if has_query_focus:
+                if self.vim_mode == VimMode.NORMAL:
+                    query_area.add_class("vim-normal")
+                else:
+                    query_area.add_class("vim-insert")
 
-        try:
-            query_input = self.query_input
-        except Exception:
-            query_input = None
-        if query_input is not None and hasattr(query_input, "sync_terminal_cursor"):
-            query_input.sync_terminal_cursor()
+            if hasattr(query_input, "sync_terminal_cursor"):
+                query_input.sync_terminal_cursor()
 
-        # Also update the status bar
-        self._update_status_bar()
+            # Also update the status bar
+            self._update_status_bar()
 
-    def _update_status_bar(self: UINavigationMixinHost) -> None:
-        """Update status bar with connection and vim mode info."""
-        from sqlit.core.vim import VimMode
-        from sqlit.shared.ui.spinner import SPINNER_FRAMES
+    def on_resize(self: UINavigationMixinHost, event: Any) -> None:
+        """Track the status bar width so updates don't query the compositor."""
+        self._status_width = event.size.width - 2
 
-        try:
-            status = self.status_bar
-        except Exception:
+    def _request_status_refresh(self: UINavigationMixinHost) -> None:
+        """Schedule a status bar update, coalescing ticks within one frame."""
+        if self._status_refresh_pending:
             return
-        # Hide connection info while query is executing
+        self._status_refresh_pending = True
+        self.call_after_refresh(self._flush_status)
+
+    def _flush_status(self: UINavigationMixinHost) -> None:
+        """Run a pending status bar update."""
+        self._status_refresh_pending = False
+        self._update_status_bar()
+
+    def _connection_status_info(self: UINavigationMixinHost) -> str:
+        """Connected/failed/idle label, rebuilt only when its inputs change."""
+        config = self.current_config
         direct_config = getattr(self, "_direct_connection_config", None)
-        direct_active = (
-            direct_config is not None
-            and self.current_config is not None
-            and direct_config.name == self.current_config.name
+        failed = bool(getattr(self, "_connection_failed", False))
+        conn_color = getattr(self.current_theme, "primary", "#4ADE80")
+        key = (
+            id(config),
+            config.name if config else None,
+            config.source if config else None,
+            direct_config.name if direct_config else None,
+            failed,
+            conn_color,
         )
+        cached = self._conn_info_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
+        if failed:
+            conn_info = "[#ff6b6b]Connection failed[/]"
+        elif config:
+            conn_info = f"[{conn_color}]Connected to {config.get_source_emoji()}{config.name}[/]"
+            if direct_config is not None and direct_config.name == config.name:
+                conn_info += " [dim](direct, not saved)[/]"
+        else:
+            conn_info = "Not connected"
+        self._conn_info_cache = (key, conn_info)
+        return conn_info
+
+    def _update_status_bar(self: UINavigationMixinHost) -> None:
+        """Update status bar with connection and vim mode info."""
+        status = self._safe_query_one("#status-bar")
+        if status is None:
+            return
         connecting_config = getattr(self, "_connecting_config", None)
 
         if connecting_config is not None:
+            # Animated, so this is the one case rebuilt on every tick
             connect_spinner = getattr(self, "_connect_spinner", None)
             spinner = connect_spinner.frame if connect_spinner else SPINNER_FRAMES[0]
             source_emoji = connecting_config.get_source_emoji()
             conn_info = f"[#FBBF24]{spinner} Connecting to {source_emoji}{connecting_config.name}[/]"
-        elif getattr(self, "_connection_failed", False):
-            conn_info = "[#ff6b6b]Connection failed[/]"
-        elif self.current_config:
-            source_emoji = self.current_config.get_source_emoji()
-            conn_color = getattr(self.current_theme, "primary", "#4ADE80")
-            conn_info = f"[{conn_color}]Connected to {source_emoji}{self.current_config.name}[/]"
-            if direct_active:
-                conn_info += " [dim](direct, not saved)[/]"
         else:
-            conn_info = "Not connected"
+            conn_info = self._connection_status_info()
 
         if getattr(self, "_command_mode", False):
-            from rich.markup import escape as escape_markup
-
             cmd_buffer = escape_markup(getattr(self, "_command_buffer", ""))
             conn_info = f"[bold cyan]:{cmd_buffer}[/]"
 
         # Build status indicators
         status_parts = []
+        # Debug-only indicators are skipped entirely in normal runs
+        debug_mode = getattr(self, "_debug_mode", False)
 
         # Check if schema is indexing (only show during debugging)
-        schema_spinner = getattr(self, "_schema_spinner", None)
-        if schema_spinner and schema_spinner.running:
-            if getattr(self, "_debug_mode", False) or getattr(self, "_debug_idle_scheduler", False):
+        if debug_mode or getattr(self, "_debug_idle_scheduler", False):
+            schema_spinner = getattr(self, "_schema_spinner", None)
+            if schema_spinner and schema_spinner.running:
                 status_parts.append(f"[bold cyan]{schema_spinner.frame} Indexing...[/]")
 
         # Check if in a transaction
         if getattr(self, "in_transaction", False):
             status_parts.append("[bold magenta]⚡ TRANSACTION[/]")
 
-        status_str = "  ".join(status_parts)
-        if status_str:
-            status_str += "  "
-
         # Build left side content - mode indicator is always preserved
         mode_str = ""
         mode_plain = ""
-        try:
-            if self.query_input.has_focus:
-                if self.vim_mode == VimMode.NORMAL:
-                    # Warm beige background for NORMAL mode
-                    normal_color, insert_color = self._get_mode_colors()
-                    mode_str = f"[bold #1e1e1e on {normal_color}] NORMAL [/]  "
-                    mode_plain = " NORMAL   "
-                else:
-                    # Soft green background for INSERT mode
-                    normal_color, insert_color = self._get_mode_colors()
-                    mode_str = f"[bold #1e1e1e on {insert_color}] INSERT [/]  "
-                    mode_plain = " INSERT   "
-        except Exception:
-            pass
-
-        left_content = f"{status_str}{mode_str}{conn_info}"
-
-        notification = getattr(self, "_last_notification", "")
-        timestamp = getattr(self, "_last_notification_time", "")
-        severity = getattr(self, "_last_notification_severity", "information")
-        launch_ms = getattr(self, "_launch_ms", None)
-        show_launch = (
-            getattr(self, "_debug_mode", False)
-            and isinstance(launch_ms, (int, float))
-            and not self.current_config
-            and not getattr(self, "_connection_failed", False)
-        )
-        launch_str = f"[dim]Launched in {launch_ms:.0f}ms[/]" if show_launch else ""
-        launch_plain = f"Launched in {launch_ms:.0f}ms" if show_launch else ""
-
-        # Combine right-side content
-        right_str = launch_str
-        right_plain = launch_plain
-
-        import re
-
-        try:
-            total_width = self.size.width - 2
-        except Exception:
-            total_width = 80
-
-        left_plain = re.sub(r"\[.*?\]", "", left_content)
+        query_input = self._safe_query_one("#query-input")
+        query_focused = query_input is not None and query_input.has_focus
+        if query_focused:
+            if self.vim_mode == VimMode.NORMAL:
+                # Warm beige background for NORMAL mode
+                normal_color, insert_color = self._get_mode_colors()
+                mode_str = f"[bold #1e1e1e on {normal_color}] NORMAL [/]  "
+                mode_plain = " NORMAL   "
+            else:
+                # Soft green background for INSERT mode
+                normal_color, insert_color = self._get_mode_colors()
+                mode_str = f"[bold #1e1e1e on {insert_color}] INSERT [/]  "
+                mode_plain = " INSERT   "
+
+        # Status indicators, mode, and connection info in a single join
+        status_parts.append(f"{mode_str}{conn_info}")
+        left_content = "  ".join(status_parts)
+
+        notification = self._last_notification
+        timestamp = self._last_notification_time
+        severity = self._last_notification_severity
+        # Right-side content (markup + plain text used for width), empty if none
+        right_content = ""
+        right_plain = ""
+        if debug_mode:
+            launch_ms = getattr(self, "_launch_ms", None)
+            if (
+                isinstance(launch_ms, (int, float))
+                and not self.current_config
+                and not getattr(self, "_connection_failed", False)
+            ):
+                right_content = f"[dim]Launched in {launch_ms:.0f}ms[/]"
+                right_plain = f"Launched in {launch_ms:.0f}ms"
+
+        total_width = self._status_width
+        if total_width is None:
+            try:
+                total_width = self.size.width - 2
+            except Exception:
+                total_width = 80
+
+        left_plain = _MARKUP_RE.sub("", left_content)
 
         # Build right side content - executing status takes priority over notification
         if getattr(self, "query_executing", False):
-            from sqlit.core.state_base import resolve_display_key
-
             cancel_key = resolve_display_key("cancel_operation") or "<esc>"
             query_spinner = getattr(self, "_query_spinner", None)
             if query_spinner and query_spinner.running:
-                import time
-
-                from sqlit.shared.core.utils import format_duration_ms
-
                 start_time = getattr(self, "_query_start_time", None)
                 if start_time:
                     elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -273,19 +392,13 @@ class UIStatusMixin:
                         f"[bold yellow]{query_spinner.frame} Executing [{elapsed_str}][/] "
                         f"[dim]{cancel_key} to cancel[/]"
                     )
-                    right_content_plain = f"  Executing [{elapsed_str}] {cancel_key} to cancel"
+                    right_plain = f"  Executing [{elapsed_str}] {cancel_key} to cancel"
                 else:
                     right_content = f"[bold yellow]{query_spinner.frame} Executing[/] [dim]{cancel_key} to cancel[/]"
-                    right_content_plain = f"  Executing {cancel_key} to cancel"
+                    right_plain = f"  Executing {cancel_key} to cancel"
             else:
                 right_content = "[bold yellow]Executing...[/]"
-                right_content_plain = "Executing..."
-
-            gap = total_width - len(left_plain) - len(right_content_plain)
-            if gap > 2:
-                status.update(f"{left_content}{' ' * gap}{right_content}")
-            else:
-                status.update(f"{left_content}  {right_content}")
+                right_plain = "Executing..."
         elif notification:
             # Show notification right-aligned
             time_prefix = f"[dim]{timestamp}[/] " if timestamp else ""
@@ -296,41 +409,37 @@ class UIStatusMixin:
                 notif_str = f"{time_prefix}{notification}"
             else:
                 mode_color = None
-                try:
-                    if self.query_input.has_focus:
-                        normal_color, insert_color = self._get_mode_colors()
-                        mode_color = normal_color if self.vim_mode == VimMode.NORMAL else insert_color
-                except Exception:
-                    mode_color = None
+                if query_focused:
+                    normal_color, insert_color = self._get_mode_colors()
+                    mode_color = normal_color if self.vim_mode == VimMode.NORMAL else insert_color
 
                 if mode_color:
                     notif_str = f"{time_prefix}[{mode_color}]{notification}[/]"
                 else:
                     notif_str = f"{time_prefix}{notification}"
 
-            notif_plain = f"{timestamp} {notification}" if timestamp else notification
-            gap = total_width - len(left_plain) - len(notif_plain)
-            if gap > 2:
-                status.update(f"{left_content}{' ' * gap}{notif_str}")
-            else:
-                status.update(f"{left_content}  {notif_str}")
-        elif right_str:
+            right_content = notif_str
+            right_plain = f"{timestamp} {notification}" if timestamp else notification
+
+        if right_content:
             gap = total_width - len(left_plain) - len(right_plain)
-            if gap > 2:
-                status.update(f"{left_content}{' ' * gap}{right_str}")
-            else:
-                status.update(f"{left_content}  {right_str}")
+            rendered = "".join((left_content, " " * gap if gap > 2 else "  ", right_content))
         else:
-            status.update(left_content)
+            rendered = left_content
+
+        # Spinner ticks and focus churn often produce an identical bar.
+        if rendered == self._last_status_render:
+            return
+        self._last_status_render = rendered
+        status.update(rendered)
 
     def _update_idle_scheduler_bar(self: UINavigationMixinHost) -> None:
         """Update the idle scheduler debug bar."""
         if not getattr(self, "_debug_idle_scheduler", False):
             return
 
-        try:
-            bar = self.idle_scheduler_bar
-        except Exception:
+        bar = self._safe_query_one("#idle-scheduler-bar")
+        if bar is None:
             return
 
         from sqlit.domains.shell.app.idle_scheduler import get_idle_scheduler
@@ -381,10 +490,8 @@ class UIStatusMixin:
             severity: One of "information", "warning", "error".
             timeout: Seconds before auto-clearing (default 3s, errors stay 5s).
         """
-        from datetime import datetime
-
         # Cancel any existing timer
-        if hasattr(self, "_notification_timer") and self._notification_timer is not None:
+        if self._notification_timer is not None:
             self._notification_timer.stop()
             self._notification_timer = None
 
@@ -419,13 +526,11 @@ class UIStatusMixin:
 
     def _show_error_in_results(self: UINavigationMixinHost, message: str, timestamp: str) -> None:
         """Display error message in the results table."""
-        import re
-
-        error_text = f"[{timestamp}] {message}" if timestamp else message
-
-        # Replace newlines and collapse multiple whitespace to single space
-        # DataTable cells only show one line, so we flatten the error
-        error_text = re.sub(r"\s+", " ", error_text).strip()
+        # DataTable cells only show one line, so we flatten the error.
+        # Only the message is flattened so repeated errors hit the cache.
+        error_text = _flatten(message)
+        if timestamp:
+            error_text = f"[{timestamp}] {error_text}".rstrip()
 
         self._last_result_columns = ["Error"]
         self._last_result_rows = [(error_text,)]
@@ -436,25 +541,20 @@ class UIStatusMixin:
 
     def _update_footer_bindings(self: UINavigationMixinHost) -> None:
         """Update footer with context-appropriate bindings from the state machine."""
-        from sqlit.shared.ui.widgets import ContextFooter, KeyBinding
-        from sqlit.core.vim import VimMode
-
-        try:
-            footer = self.query_one(ContextFooter)
-        except Exception:
+        if not self._chrome_ready():
             return
+        footer = self._footer
 
         if hasattr(self, "_get_input_context"):
             ctx = self._get_input_context()
         else:
             return
 
-        left_display, right_display = self._state_machine.get_display_bindings(ctx)
-
-        left_bindings = [KeyBinding(b.key, b.label, b.action) for b in left_display]
-        right_bindings = [KeyBinding(b.key, b.label, b.action) for b in right_display]
-
-        footer.set_bindings(left_bindings, right_bindings)
+        # Display bindings depend only on the context and the active keymap.
+        footer_key = (ctx, get_keymap())
+        if footer_key != self._last_footer_ctx:
+            self._last_footer_ctx = footer_key
+            footer.set_bindings(*self._state_machine.get_display_bindings(ctx))
 
         normal_color, insert_color = self._get_mode_colors()
         key_color = normal_color
@@ -463,12 +563,6 @@ class UIStatusMixin:
         footer.set_key_color(key_color)
 
     def _get_mode_colors(self: UINavigationMixinHost) -> tuple[str, str]:
-        from sqlit.domains.shell.app.themes import (
-            DEFAULT_MODE_COLORS,
-            MODE_INSERT_COLOR_VAR,
-            MODE_NORMAL_COLOR_VAR,
-        )
-
         theme = self.current_theme
         theme_key = "dark" if theme.dark else "light"
         defaults = DEFAULT_MODE_COLORS[theme_key]
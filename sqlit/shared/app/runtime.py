@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -49,95 +51,116 @@ class RuntimeConfig:
 
     @classmethod
     def from_env(cls) -> RuntimeConfig:
-        def _parse_startup_mark(value: str | None) -> float | None:
-            if not value:
-                return None
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return None
-
-        def _parse_int(value: str | None) -> int | None:
-            if not value:
-                return None
-            try:
-                return int(value)
-            except (TypeError, ValueError):
-                return None
-
-        def _parse_float(value: str | None) -> float:
-            if not value:
-                return 0.0
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return 0.0
-
-        def _parse_bool(value: str | None, default: bool) -> bool:
-            if value is None or not value.strip():
-                return default
-            return value.strip().lower() in {"1", "true", "yes", "on"}
-
-        settings_path = os.environ.get("SQLIT_SETTINGS_PATH", "").strip() or None
-        startup_log_path = os.environ.get("SQLIT_PROFILE_STARTUP_FILE", "").strip() or None
-        startup_exit = os.environ.get("SQLIT_PROFILE_STARTUP_EXIT") == "1"
-        import_log_path = os.environ.get("SQLIT_PROFILE_STARTUP_IMPORTS_FILE", "").strip() or None
-        import_enabled = os.environ.get("SQLIT_PROFILE_STARTUP_IMPORTS") == "1" or bool(import_log_path)
-        import_min_raw = os.environ.get("SQLIT_PROFILE_STARTUP_IMPORTS_MIN_MS", "").strip()
+        # Snapshot once: plain dict lookups instead of os.environ's encode/decode.
+        env = dict(os.environ)
+        # Common case: nothing configured, so every field keeps its default.
+        if not any(name.startswith("SQLIT_") for name in env):
+            return cls()
+
+        settings_path = env.get("SQLIT_SETTINGS_PATH", "").strip() or None
+        startup_log_path = env.get("SQLIT_PROFILE_STARTUP_FILE", "").strip() or None
+        startup_exit = env.get("SQLIT_PROFILE_STARTUP_EXIT") == "1"
+        import_log_path = env.get("SQLIT_PROFILE_STARTUP_IMPORTS_FILE", "").strip() or None
+        import_enabled = env.get("SQLIT_PROFILE_STARTUP_IMPORTS") == "1" or bool(import_log_path)
+        import_min_raw = env.get("SQLIT_PROFILE_STARTUP_IMPORTS_MIN_MS", "").strip()
         import_min_ms = _parse_float(import_min_raw) if import_min_raw else 1.0
         profile_startup = (
-            os.environ.get("SQLIT_PROFILE_STARTUP") == "1"
+            env.get("SQLIT_PROFILE_STARTUP") == "1"
             or bool(startup_log_path)
             or startup_exit
             or import_enabled
         )
         default_startup_log = Path(".sqlit") / "startup.txt"
-        startup_log = Path(startup_log_path).expanduser() if startup_log_path else (default_startup_log if profile_startup else None)
+        startup_log = _as_path(startup_log_path) if startup_log_path else (default_startup_log if profile_startup else None)
         startup_import_log = (
-            Path(import_log_path).expanduser()
+            _as_path(import_log_path)
             if import_log_path
             else (Path(".sqlit") / "startup-imports.txt" if import_enabled else None)
         )
-        max_rows = _parse_int(os.environ.get("SQLIT_MAX_ROWS"))
-        worker_env = os.environ.get("SQLIT_PROCESS_WORKER")
-        if worker_env is None or not worker_env.strip():
-            process_worker = True
-        else:
-            process_worker = worker_env.strip().lower() in {"1", "true", "yes", "on"}
-        warm_env = os.environ.get("SQLIT_PROCESS_WORKER_WARM_ON_IDLE")
-        process_worker_warm_on_idle = _parse_bool(warm_env, True)
-        shutdown_env = os.environ.get("SQLIT_PROCESS_WORKER_AUTO_SHUTDOWN_S")
-        process_worker_auto_shutdown_s = _parse_float(shutdown_env)
-        stall_env = os.environ.get("SQLIT_UI_STALL_WATCHDOG_MS")
-        ui_stall_watchdog_ms = _parse_float(stall_env)
-        missing_drivers = os.environ.get("SQLIT_MOCK_MISSING_DRIVERS", "")
-        missing_driver_set = {item.strip() for item in missing_drivers.split(",") if item.strip()}
+        missing_drivers = env.get("SQLIT_MOCK_MISSING_DRIVERS", "")
+        missing_driver_set = {name for name in map(str.strip, missing_drivers.split(",")) if name}
 
         mock_config = MockConfig(
             missing_drivers=missing_driver_set,
-            install_result=os.environ.get("SQLIT_MOCK_INSTALL_RESULT", "").strip().lower() or None,
-            pipx_mode=os.environ.get("SQLIT_MOCK_PIPX", "").strip().lower() or None,
-            query_delay=_parse_float(os.environ.get("SQLIT_MOCK_QUERY_DELAY")),
-            demo_rows=_parse_int(os.environ.get("SQLIT_DEMO_ROWS")) or 0,
-            demo_long_text=os.environ.get("SQLIT_DEMO_LONG_TEXT") == "1",
-            cloud=os.environ.get("SQLIT_MOCK_CLOUD") == "1",
-            driver_error=os.environ.get("SQLIT_MOCK_DRIVER_ERROR") == "1",
+            **{attr: parse(env.get(name)) for attr, name, parse in _MOCK_ENV_FIELDS},
         )
 
         return cls(
-            settings_path=Path(settings_path).expanduser() if settings_path else None,
-            max_rows=max_rows,
-            debug_mode=os.environ.get("SQLIT_DEBUG") == "1",
-            debug_idle_scheduler=os.environ.get("SQLIT_DEBUG_IDLE_SCHEDULER") == "1",
+            settings_path=_as_path(settings_path) if settings_path else None,
             profile_startup=profile_startup,
-            startup_mark=_parse_startup_mark(os.environ.get("SQLIT_STARTUP_MARK")),
             startup_log_path=startup_log,
             startup_exit_after_refresh=startup_exit,
             startup_import_log_path=startup_import_log,
             startup_import_min_ms=import_min_ms,
-            process_worker=process_worker,
-            process_worker_warm_on_idle=process_worker_warm_on_idle,
-            process_worker_auto_shutdown_s=process_worker_auto_shutdown_s,
-            ui_stall_watchdog_ms=ui_stall_watchdog_ms,
             mock=mock_config,
+            **{attr: parse(env.get(name)) for attr, name, parse in _RUNTIME_ENV_FIELDS},
         )
+
+
+def _as_path(value: str) -> Path:
+    """Build a Path, expanding ~ only when the string actually starts with it."""
+    return Path(value).expanduser() if value.startswith("~") else Path(value)
+
+
+def _parse_optional_float(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_int(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_float(value: str | None) -> float:
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _parse_bool(value: str | None, default: bool) -> bool:
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_flag(value: str | None) -> bool:
+    return value == "1"
+
+
+def _parse_lower(value: str | None) -> str | None:
+    return (value or "").strip().lower() or None
+
+
+# (attribute, environment variable, parser) for fields read straight from env.
+_RUNTIME_ENV_FIELDS: tuple[tuple[str, str, Callable[[str | None], Any]], ...] = (
+    ("max_rows", "SQLIT_MAX_ROWS", _parse_int),
+    ("debug_mode", "SQLIT_DEBUG", _parse_flag),
+    ("debug_idle_scheduler", "SQLIT_DEBUG_IDLE_SCHEDULER", _parse_flag),
+    ("startup_mark", "SQLIT_STARTUP_MARK", _parse_optional_float),
+    ("process_worker", "SQLIT_PROCESS_WORKER", partial(_parse_bool, default=True)),
+    ("process_worker_warm_on_idle", "SQLIT_PROCESS_WORKER_WARM_ON_IDLE", partial(_parse_bool, default=True)),
+    ("process_worker_auto_shutdown_s", "SQLIT_PROCESS_WORKER_AUTO_SHUTDOWN_S", _parse_float),
+    ("ui_stall_watchdog_ms", "SQLIT_UI_STALL_WATCHDOG_MS", _parse_float),
+)
+
+_MOCK_ENV_FIELDS: tuple[tuple[str, str, Callable[[str | None], Any]], ...] = (
+    ("install_result", "SQLIT_MOCK_INSTALL_RESULT", _parse_lower),
+    ("pipx_mode", "SQLIT_MOCK_PIPX", _parse_lower),
+    ("query_delay", "SQLIT_MOCK_QUERY_DELAY", _parse_float),
+    ("demo_rows", "SQLIT_DEMO_ROWS", lambda value: _parse_int(value) or 0),
+    ("demo_long_text", "SQLIT_DEMO_LONG_TEXT", _parse_flag),
+    ("cloud", "SQLIT_MOCK_CLOUD", _parse_flag),
+    ("driver_error", "SQLIT_MOCK_DRIVER_ERROR", _parse_flag),
+)
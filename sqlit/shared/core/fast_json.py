@@ -0,0 +1,63 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is optional. Input it rejects or would read differently from the
+stdlib (NaN, integers wider than 64 bits, lone surrogates, non-string keys)
+is handled by the json module instead, so callers see the stdlib's
+behavior apart from orjson's float formatting.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
+# orjson reads integers outside the 64-bit range as floats; leave any text
+# with a 19+ digit run (negatives below -2**63 have 19) to the stdlib so
+# large numeric ids keep their exact value.
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def loads(text: str) -> Any:
+    """Parse JSON text, raising ValueError (json.JSONDecodeError) on failure."""
+    if orjson is not None and _LONG_DIGITS_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize to JSON with two-space indentation and unescaped unicode."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN and infinities as null; the stdlib keeps them.
+            if b"null" not in data or not _has_non_finite_float(obj):
+                return data.decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """True if obj holds a NaN or infinite float anywhere in its containers."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            stack.extend(value)
+    return False
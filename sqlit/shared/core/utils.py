@@ -16,18 +16,21 @@ def fuzzy_match(pattern: str, text: str) -> tuple[bool, list[int]]:
     if not pattern:
         return True, []
 
-    pattern = pattern.lower()
     text_lower = text.lower()
 
-    pattern_idx = 0
+    # Jump to each pattern character with str.find instead of stepping
+    # through the text one character at a time; stops at the last match.
+    find = text_lower.find
     indices = []
+    pos = 0
+    for char in pattern.lower():
+        pos = find(char, pos)
+        if pos < 0:
+            return False, indices
+        indices.append(pos)
+        pos += 1
 
-    for i, char in enumerate(text_lower):
-        if pattern_idx < len(pattern) and char == pattern[pattern_idx]:
-            indices.append(i)
-            pattern_idx += 1
-
-    return pattern_idx == len(pattern), indices
+    return True, indices
 
 
 def highlight_matches(text: str, indices: list[int], style: str = "bold yellow") -> str:
@@ -56,6 +59,27 @@ def highlight_matches(text: str, indices: list[int], style: str = "bold yellow")
     return "".join(result)
 
 
+def highlight_span(text: str, start: int, length: int, style: str = "bold yellow") -> str:
+    """Highlight a contiguous run of characters in text using Rich markup.
+
+    Renders like highlight_matches over the same indices, with one markup
+    tag around the run instead of one per character.
+
+    Args:
+        text: The original text
+        start: Index of the first character to highlight
+        length: Number of characters to highlight
+        style: Rich style string for highlighting (default: "bold yellow")
+
+    Returns:
+        Text with Rich markup highlighting the run.
+    """
+    if length <= 0 or start >= len(text):
+        return text
+    end = start + length
+    return f"{text[:start]}[{style}]{text[start:end]}[/]{text[end:]}"
+
+
 def format_duration_ms(ms: float, *, always_seconds: bool = False) -> str:
     """Format milliseconds into a human-readable duration string.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
 if TYPE_CHECKING:
@@ -61,6 +62,9 @@ class TextualAppProtocol(Protocol):
     def call_after_refresh(self, callback: Callable[[], Any]) -> None:
         ...
 
+    def batch_update(self) -> AbstractContextManager[None]:
+        ...
+
     def set_timer(
         self,
         delay: float,
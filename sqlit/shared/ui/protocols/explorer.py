@@ -7,6 +7,7 @@ from typing import Any, Protocol
 
 class ExplorerStateProtocol(Protocol):
     _expanded_paths: set[str]
+    _persisted_expanded_paths: frozenset[str] | None
     _loading_nodes: set[str]
     _schema_service: Any | None
     _schema_service_session: Any | None
@@ -17,7 +18,13 @@ class ExplorerStateProtocol(Protocol):
     _tree_filter_typing: bool
     _tree_filter_matches: list[Any]
     _tree_filter_match_index: int
-    _tree_original_labels: dict[int, str]
+    _tree_filter_refine_query: str
+    _tree_filter_needle: str
+    _tree_filter_case_sensitive: bool
+    _tree_filter_index: list[tuple[Any, str, str]] | None
+    _tree_filter_applied_text: str | None
+    _tree_filter_update_pending: bool
+    _tree_original_labels: dict[Any, str]
 
 
 class ExplorerActionsProtocol(Protocol):
@@ -57,6 +64,9 @@ class ExplorerActionsProtocol(Protocol):
     def action_tree_filter_prev(self) -> None:
         ...
 
+    def _schedule_tree_filter_update(self) -> None:
+        ...
+
     def _update_tree_filter(self) -> None:
         ...
 
@@ -66,6 +76,9 @@ class ExplorerActionsProtocol(Protocol):
     def _expand_ancestors(self, node: Any) -> None:
         ...
 
+    def _apply_tree_label_updates(self, label_updates: list[tuple[Any, str]]) -> None:
+        ...
+
     def _restore_tree_labels(self) -> None:
         ...
 
@@ -75,7 +88,20 @@ class ExplorerActionsProtocol(Protocol):
     def _count_all_nodes(self) -> int:
         ...
 
-    def _find_matching_nodes(self, node: Any, matches: list[Any]) -> bool:
+    def _get_tree_filter_index(self) -> list[tuple[Any, str, str]]:
+        ...
+
+    def _find_matching_nodes(self, matches: list[Any], label_updates: list[tuple[Any, str]]) -> None:
+        ...
+
+    def _match_filter_node(
+        self,
+        node: Any,
+        matches: list[Any],
+        label_updates: list[tuple[Any, str]],
+        label_text: str | None = None,
+        label_lower: str | None = None,
+    ) -> bool:
         ...
 
     def _get_node_label_text(self, node: Any) -> str:
@@ -88,6 +88,7 @@ class TreeMixinHost(
 
 
 class TreeFilterMixinHost(
+    TextualAppProtocol,
     WidgetAccessProtocol,
     ExplorerProtocol,
     UINavigationProtocol,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from typing import Any, Protocol
 
 from sqlit.domains.connections.domain.config import ConnectionConfig
@@ -13,7 +14,8 @@ class StartupProtocol(Protocol):
     _startup_profile: bool
     _startup_mark: float | None
     _startup_init_time: float
-    _startup_events: list[tuple[str, float]]
+    _startup_step_names: list[str]
+    _startup_step_ts: array[float]
     _startup_connection: ConnectionConfig | None
     _startup_connect_config: ConnectionConfig | None
     _debug_mode: bool
@@ -22,6 +24,7 @@ class StartupProtocol(Protocol):
     _idle_scheduler_bar_timer: Any | None
     _theme_manager: Any
     _expanded_paths: set[str]
+    _persisted_expanded_paths: frozenset[str] | None
 
     def _startup_stamp(self, name: str) -> None:
         ...
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from collections import deque
+
     from textual.timer import Timer
     from textual.widgets import Static
 
@@ -17,11 +19,23 @@ class UIStateProtocol(Protocol):
     _last_notification_severity: str
     _last_notification_time: str
     _notification_timer: Timer | None
-    _notification_history: list[tuple[str, str, str]]
+    _notification_history: deque[tuple[str, str, str]]
     _leader_timer: Timer | None
     _leader_pending: bool
     _leader_pending_menu: str
     _last_active_pane: str | None
+    _chrome_dirty: bool
+    _chrome_screen: Any | None
+    _pane_explorer: Any | None
+    _pane_query: Any | None
+    _pane_results: Any | None
+    _footer: Any | None
+    _last_status_render: str | None
+    _pane_titles: dict[str, str]
+    _last_footer_ctx: tuple[Any, Any] | None
+    _status_refresh_pending: bool
+    _conn_info_cache: tuple[tuple[Any, ...], str] | None
+    _status_width: int | None
     _state_machine: Any
     _active_database: str | None
     _query_target_database: str | None
@@ -35,6 +49,15 @@ class UINavigationActionsProtocol(Protocol):
     def _update_status_bar(self) -> None:
         ...
 
+    def _request_status_refresh(self) -> None:
+        ...
+
+    def _flush_status(self) -> None:
+        ...
+
+    def _connection_status_info(self) -> str:
+        ...
+
     def _update_footer_bindings(self) -> None:
         ...
 
@@ -47,6 +70,27 @@ class UINavigationActionsProtocol(Protocol):
     def _sync_active_pane_title(self) -> None:
         ...
 
+    def _init_status_state(self) -> None:
+        ...
+
+    def _safe_query_one(self, selector: str) -> Any | None:
+        ...
+
+    def _cache_pane_refs(self) -> None:
+        ...
+
+    def _clear_pane_refs(self) -> None:
+        ...
+
+    def _chrome_ready(self) -> bool:
+        ...
+
+    def _schedule_chrome_refresh(self) -> None:
+        ...
+
+    def _flush_chrome(self) -> None:
+        ...
+
     def _update_idle_scheduler_bar(self) -> None:
         ...
 
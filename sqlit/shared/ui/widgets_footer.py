@@ -6,15 +6,10 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Static
 
+from sqlit.core.state_base import DisplayBinding
 
-class KeyBinding:
-    """Represents a single key binding for display."""
-
-    def __init__(self, key: str, label: str, action: str, disabled: bool = False):
-        self.key = key
-        self.label = label
-        self.action = action
-        self.disabled = disabled
+# State machines hand footer bindings over as-is; no per-update re-wrapping.
+KeyBinding = DisplayBinding
 
 
 class ContextFooter(Horizontal):
@@ -4,13 +4,46 @@ from __future__ import annotations
 
 import ast
 import json
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Any
 
 from rich.highlighter import ReprHighlighter
+from rich.style import Style
 from rich.text import Text
 from textual.widgets import Tree
-from textual.widgets.tree import TreeNode
+from textual.widgets.tree import NodeID, TreeNode
+
+from sqlit.shared.core import fast_json
+
+# Containers up to this size are built eagerly (no expand flicker); larger
+# ones, and anything past the per-build node budget, are filled on expand.
+_MAX_EAGER_CHILDREN = 50
+_EAGER_NODE_BUDGET = 2000
+
+_LEADING_SPACE_RE = re.compile(r"\s*")
+
+# Outside strings and comments, these are the only bare words a Python
+# literal can contain; any other word is a name literal_eval rejects. Words
+# glued to a number (0x10, 1e5, 1.j) are part of the number, not words.
+_PY_LITERAL_WORDS = frozenset({"None", "True", "False", "set"})
+_BARE_WORD_RE = re.compile(r"(?<![\w.])[A-Za-z_]\w*")
+
+# Label pieces shared by every node; labels are built by copying these. The
+# styles are spans rather than the base style so they don't leak onto text
+# appended after them.
+_DICT_PREFIX = Text.assemble(("{} ", "bold cyan"))
+_LIST_PREFIX = Text.assemble(("[] ", "bold magenta"))
+_COLON = Text.assemble((": ", "dim"))
+
+# Leaf value styles, parsed once rather than per leaf.
+_STYLE_NULL = Style.parse("italic dim")
+_STYLE_BOOL = Style.parse("italic cyan")
+_STYLE_NUM = Style.parse("bold blue")
+_STYLE_STR = Style.parse("green")
+_TEXT_NULL = Text("null", style=_STYLE_NULL)
+_TEXT_TRUE = Text("true", style=_STYLE_BOOL)
+_TEXT_FALSE = Text("false", style=_STYLE_BOOL)
 
 
 def parse_json_value(value: str) -> tuple[bool, dict | list | None]:
@@ -19,24 +52,50 @@ def parse_json_value(value: str) -> tuple[bool, dict | list | None]:
     Tries standard JSON parsing first, then falls back to Python literal_eval
     for Python-style dicts/lists.
     """
-    stripped = value.strip()
-    if not stripped or stripped[0] not in "{[":
-        return False, None
+    is_json, parsed, _source = parse_json_source(value)
+    return is_json, parsed
+
+
+def parse_json_source(value: str) -> tuple[bool, dict | list | None, str | None]:
+    """Like parse_json_value, also returning the JSON text that was parsed.
+
+    The third item is the stripped input when it was valid JSON (so callers
+    can reuse it instead of serializing the parsed value again), or None when
+    parsing failed or needed the Python literal fallback.
+    """
+    # Find the first non-blank character without copying the value, so
+    # large plain-text cells are rejected before any allocation.
+    start = _LEADING_SPACE_RE.match(value).end()
+    if start == len(value) or value[start] not in "{[":
+        return False, None, None
+    stripped = value[start:].rstrip()
 
     try:
-        parsed = json.loads(stripped)
-        return True, parsed
+        parsed = fast_json.loads(stripped)
+        return True, parsed, stripped
     except (json.JSONDecodeError, ValueError):
         pass
 
+    # literal_eval runs the full Python compiler; skip it for bracketed
+    # prose like "[INFO] ..." that it is certain to reject.
+    if not _may_be_python_literal(stripped):
+        return False, None, None
+
     try:
         parsed = ast.literal_eval(stripped)
         if isinstance(parsed, dict | list):
-            return True, parsed
+            return True, parsed, None
     except (ValueError, SyntaxError):
         pass
 
-    return False, None
+    return False, None, None
+
+
+def _may_be_python_literal(text: str) -> bool:
+    """False only when text cannot be a Python literal."""
+    if "'" in text or '"' in text or "#" in text:
+        return True
+    return all(match.group() in _PY_LITERAL_WORDS for match in _BARE_WORD_RE.finditer(text))
 
 
 @dataclass
@@ -45,6 +104,9 @@ class JSONNodeData:
 
     key: str | None  # The key/index for this node (None for root)
     value: Any  # The actual value at this node
+    # Serialized forms, filled on first copy of this node
+    cached_json: str | None = field(default=None, repr=False, compare=False)
+    cached_field_json: str | None = field(default=None, repr=False, compare=False)
 
 
 class JSONTreeView(Tree[JSONNodeData]):
@@ -82,102 +144,158 @@ class JSONTreeView(Tree[JSONNodeData]):
         classes: str | None = None,
     ) -> None:
         super().__init__(label, id=id, classes=classes)
-        self._raw_json: str = ""
+        # JSON text for raw_json; None means serialize root data on first read.
+        self._raw_json: str | None = ""
         self._highlighter = ReprHighlighter()
+        # Container nodes whose children have not been built yet.
+        self._unloaded: set[NodeID] = set()
+        # Highlighted reprs of non-JSON leaves, by id, for the current data.
+        self._repr_cache: dict[int, Text] = {}
+        # Payload and label currently shown, to skip rebuilding the same data.
+        self._shown: tuple[str | dict | list, str] | None = None
+
+    def set_json(self, data: str | dict | list, label: str = "JSON", *, raw: str | None = None) -> None:
+        """Set JSON data to display in the tree.
+
+        ``raw`` is the text to report as raw_json when the caller already has
+        it; otherwise parsed data is only serialized if raw_json is read.
+        Passing the same object (or an equal string) with the same label as
+        the data already shown keeps the existing nodes and their expansion.
+        """
+        shown = self._shown
+        if shown is not None and shown[1] == label:
+            previous = shown[0]
+            if previous is data or (isinstance(data, str) and previous == data):
+                self.root.expand()
+                return
+        self._shown = None
 
-    def set_json(self, data: str | dict | list, label: str = "JSON") -> None:
-        """Set JSON data to display in the tree."""
-        self._raw_json = data if isinstance(data, str) else json.dumps(data)
+        self._raw_json = data if isinstance(data, str) else raw
 
+        original = data
         if isinstance(data, str):
             try:
-                data = json.loads(data)
+                data = fast_json.loads(data)
             except (json.JSONDecodeError, ValueError):
                 self.root.set_label(Text("Invalid JSON", style="red"))
                 return
 
         self.clear()
+        self._unloaded.clear()
+        self._repr_cache.clear()
         self.root.set_label(Text(f"{{}} {label}" if isinstance(data, dict) else f"[] {label}"))
         self.root.data = JSONNodeData(key=None, value=data)
         self._add_json_node(self.root, data)
         self.root.expand()
+        self._shown = (original, label)
 
     def _add_json_node(self, node: TreeNode[JSONNodeData], data: Any, key: str | None = None) -> None:
-        """Recursively add JSON data to tree nodes."""
-        if isinstance(data, dict):
-            if key is not None:
-                label = Text.assemble(Text("{} ", style="bold cyan"), Text(key))
-                child = node.add(label, data=JSONNodeData(key=key, value=data))
-            else:
-                child = node
-            for k, v in data.items():
-                self._add_json_node(child, v, k)
-        elif isinstance(data, list):
-            if key is not None:
-                label = Text.assemble(
-                    Text("[] ", style="bold magenta"),
-                    Text(key),
-                    Text(f" ({len(data)})", style="dim"),
-                )
-                child = node.add(label, data=JSONNodeData(key=key, value=data))
-            else:
-                child = node
-            for i, v in enumerate(data):
-                self._add_json_node(child, v, f"[{i}]")
-        else:
-            if key is not None:
-                value_text = self._format_value(data)
-                label = Text.assemble(
-                    Text(f"{key}", style="bold"),
-                    Text(": ", style="dim"),
-                    value_text,
-                )
-                leaf = node.add_leaf(label, data=JSONNodeData(key=key, value=data))
+        """Add JSON data to tree nodes.
+
+        Walks the document with an explicit stack rather than recursion, so
+        deep or wide payloads cost no Python frame per node. Children are
+        pushed in reverse so siblings are still added in document order.
+        Nested containers that are large, or past the eager node budget, are
+        added unpopulated and filled in by _materialize when expanded.
+        """
+        format_value = self._format_value
+        unloaded = self._unloaded
+        budget = _EAGER_NODE_BUDGET
+        stack: list[tuple[TreeNode[JSONNodeData], Any, str | None]] = [(node, data, key)]
+        pop = stack.pop
+        push = stack.extend
+
+        while stack:
+            parent, value, key = pop()
+            budget -= 1
+            if isinstance(value, dict):
+                if key is not None:
+                    label = _DICT_PREFIX.copy()
+                    label.append(str(key))
+                    parent = parent.add(label, data=JSONNodeData(key=key, value=value))
+                    if len(value) > _MAX_EAGER_CHILDREN or budget <= 0:
+                        unloaded.add(parent.id)
+                        continue
+                push((parent, v, k) for k, v in reversed(value.items()))
+            elif isinstance(value, list):
+                if key is not None:
+                    label = _LIST_PREFIX.copy()
+                    label.append(str(key))
+                    label.append(f" ({len(value)})", style="dim")
+                    parent = parent.add(label, data=JSONNodeData(key=key, value=value))
+                    if len(value) > _MAX_EAGER_CHILDREN or budget <= 0:
+                        unloaded.add(parent.id)
+                        continue
+                push((parent, value[i], f"[{i}]") for i in range(len(value) - 1, -1, -1))
+            elif key is not None:
+                label = Text()
+                label.append(str(key), style="bold")
+                label.append_text(_COLON)
+                label.append_text(format_value(value))
+                leaf = parent.add_leaf(label, data=JSONNodeData(key=key, value=value))
                 leaf.allow_expand = False
             else:
-                node.add_leaf(self._format_value(data), data=JSONNodeData(key=None, value=data))
+                parent.add_leaf(format_value(value), data=JSONNodeData(key=None, value=value))
+
+    def _materialize(self, node: TreeNode[JSONNodeData]) -> None:
+        """Build the children of a lazily added container node."""
+        if node.id not in self._unloaded:
+            return
+        self._unloaded.discard(node.id)
+        if node.data is not None:
+            self._add_json_node(node, node.data.value)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[JSONNodeData]) -> None:
+        """Fill in a lazily added container the first time it is expanded."""
+        self._materialize(event.node)
 
     def _format_value(self, value: Any) -> Text:
         """Format a leaf value with syntax highlighting."""
         if value is None:
-            return Text("null", style="italic dim")
+            return _TEXT_NULL.copy()
         elif isinstance(value, bool):
-            return Text(str(value).lower(), style="italic cyan")
+            return (_TEXT_TRUE if value else _TEXT_FALSE).copy()
         elif isinstance(value, int | float):
-            return Text(str(value), style="bold blue")
+            return Text(str(value), style=_STYLE_NUM)
         elif isinstance(value, str):
             if len(value) > 100:
                 display = f'"{value[:100]}..."'
             else:
                 display = f'"{value}"'
-            return Text(display, style="green")
-        else:
-            return self._highlighter(repr(value))
+            return Text(display, style=_STYLE_STR)
+        cached = self._repr_cache.get(id(value))
+        if cached is None:
+            if isinstance(value, bytes | bytearray) and len(value) > 100:
+                display = f"{bytes(value[:100])!r}... ({len(value)} bytes)"
+            else:
+                display = repr(value)
+            cached = self._repr_cache[id(value)] = self._highlighter(display)
+        return cached.copy()
 
     def action_expand_all(self) -> None:
         """Expand all nodes in the tree."""
-
-        def expand_recursive(node: TreeNode[JSONNodeData]) -> None:
-            node.expand()
-            for child in node.children:
-                expand_recursive(child)
-
-        expand_recursive(self.root)
+        materialize = self._materialize
+        stack = [self.root]
+        with self.app.batch_update():
+            while stack:
+                node = stack.pop()
+                materialize(node)
+                node.expand()
+                stack.extend(node.children)
 
     def action_collapse_all(self) -> None:
         """Collapse all nodes except root."""
-
-        def collapse_recursive(node: TreeNode[JSONNodeData]) -> None:
-            for child in node.children:
-                collapse_recursive(child)
-                child.collapse()
-
-        collapse_recursive(self.root)
-        self.root.expand()
+        with self.app.batch_update():
+            for child in self.root.children:
+                child.collapse_all()
+            self.root.expand()
 
     @property
     def raw_json(self) -> str:
         """Get the raw JSON string for copying."""
+        if self._raw_json is None:
+            data = self.root.data
+            self._raw_json = json.dumps(data.value) if data is not None else ""
         return self._raw_json
 
     def get_cursor_key(self) -> str | None:
@@ -196,24 +314,33 @@ class JSONTreeView(Tree[JSONNodeData]):
 
     def get_cursor_value_json(self) -> str:
         """Get the value of the currently selected node as JSON string."""
-        value = self.get_cursor_value()
-        if value is None:
+        node = self.cursor_node
+        if node is None or node.data is None or node.data.value is None:
             return "null"
-        return json.dumps(value, indent=2, ensure_ascii=False)
+        data = node.data
+        if data.cached_json is None:
+            data.cached_json = fast_json.dumps_pretty(data.value)
+        return data.cached_json
 
     def get_cursor_field_json(self) -> str | None:
         """Get the current field as 'key': value JSON string."""
         node = self.cursor_node
         if node is None or node.data is None:
             return None
-        key = node.data.key
-        value = node.data.value
+        data = node.data
+        if data.cached_field_json is not None:
+            return data.cached_field_json
+        key = data.key
+        value = data.value
         if key is None:
             # Root node - just return the value
-            return json.dumps(value, indent=2, ensure_ascii=False)
+            result = fast_json.dumps_pretty(value)
         # Check if key is an array index like [0]
-        if key.startswith("[") and key.endswith("]"):
+        elif key.startswith("[") and key.endswith("]"):
             # Array element - just return the value
-            return json.dumps(value, indent=2, ensure_ascii=False)
-        # Object field - return as "key": value
-        return f'"{key}": {json.dumps(value, ensure_ascii=False)}'
+            result = fast_json.dumps_pretty(value)
+        else:
+            # Object field - return as "key": value
+            result = f'"{key}": {json.dumps(value, ensure_ascii=False)}'
+        data.cached_field_json = result
+        return result
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from rich.syntax import Syntax
@@ -10,7 +9,8 @@ from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.widgets import Static
 
-from sqlit.shared.ui.widgets_json_tree import JSONTreeView, parse_json_value
+from sqlit.shared.core import fast_json
+from sqlit.shared.ui.widgets_json_tree import JSONTreeView, parse_json_source
 
 
 class InlineValueView(Container):
@@ -60,17 +60,37 @@ class InlineValueView(Container):
         self._is_json: bool = False
         self._tree_mode: bool = True
         self._parsed_json: dict | list | None = None
+        # Original JSON text when the value parsed as strict JSON.
+        self._json_source: str | None = None
+        # Syntax-mode renderable for JSON, built on first use per value.
+        self._syntax: Syntax | None = None
+        # Width the plain-text value was last wrapped to (-1: not wrapped yet).
+        self._last_wrap_width: int = -1
+        # Child widgets, looked up once on mount.
+        self._scroll_widget: VerticalScroll | None = None
+        self._static_widget: Static | None = None
+        self._tree_widget: JSONTreeView | None = None
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="syntax-scroll", classes="hidden"):
             yield Static("", id="value-content", markup=False)
         yield JSONTreeView("JSON", id="json-tree", classes="hidden")
 
+    def on_mount(self) -> None:
+        self._scroll_widget = self.query_one("#syntax-scroll", VerticalScroll)
+        self._static_widget = self.query_one("#value-content", Static)
+        self._tree_widget = self.query_one("#json-tree", JSONTreeView)
+
     def set_value(self, value: str, column_name: str = "") -> None:
         """Set the value to display."""
+        if value != self._raw_value or self._parsed_json is None:
+            # Keep the parsed object for a repeated value so the tree can
+            # tell it is already showing it.
+            self._is_json, self._parsed_json, self._json_source = parse_json_source(value)
+            self._syntax = None
+            self._last_wrap_width = -1
         self._raw_value = value
         self._column_name = column_name
-        self._is_json, self._parsed_json = parse_json_value(value)
         self._rebuild()
 
     def toggle_view_mode(self) -> None:
@@ -80,33 +100,30 @@ class InlineValueView(Container):
 
     def collapse_all_nodes(self) -> None:
         """Collapse all tree nodes."""
-        if self._is_json and self._tree_mode:
-            try:
-                self.query_one("#json-tree", JSONTreeView).action_collapse_all()
-            except Exception:
-                pass
+        tree = self.get_tree_widget()
+        if tree is not None:
+            tree.action_collapse_all()
 
     def expand_all_nodes(self) -> None:
         """Expand all tree nodes."""
-        if self._is_json and self._tree_mode:
-            try:
-                self.query_one("#json-tree", JSONTreeView).action_expand_all()
-            except Exception:
-                pass
+        tree = self.get_tree_widget()
+        if tree is not None:
+            tree.action_expand_all()
 
     def _rebuild(self) -> None:
         """Rebuild the display based on current mode."""
+        scroll_widget = self._scroll_widget
+        static_widget = self._static_widget
+        tree_widget = self._tree_widget
+        if scroll_widget is None or static_widget is None or tree_widget is None:
+            return
         try:
-            scroll_widget = self.query_one("#syntax-scroll", VerticalScroll)
-            static_widget = self.query_one("#value-content", Static)
-            tree_widget = self.query_one("#json-tree", JSONTreeView)
-
             if self._is_json and self._tree_mode and self._parsed_json is not None:
                 scroll_widget.add_class("hidden")
                 tree_widget.remove_class("hidden")
 
                 label = self._column_name or "JSON"
-                tree_widget.set_json(self._parsed_json, label)
+                tree_widget.set_json(self._parsed_json, label, raw=self._json_source)
                 tree_widget.focus()
             else:
                 tree_widget.add_class("hidden")
@@ -124,19 +141,33 @@ class InlineValueView(Container):
         import textwrap
 
         if self._is_json and self._parsed_json is not None:
-            formatted = json.dumps(self._parsed_json, indent=2, ensure_ascii=False)
-            return Syntax(formatted, "json", theme="ansi_dark", word_wrap=True)
+            if self._syntax is None:
+                pretty = fast_json.dumps_pretty(self._parsed_json)
+                self._syntax = Syntax(pretty, "json", theme="ansi_dark", word_wrap=True)
+            return self._syntax
 
-        wrap_width = max(self.size.width - 4, 20) if self.size.width > 0 else 100
+        wrap_width = self._wrap_width()
+        self._last_wrap_width = wrap_width
         if len(self._raw_value) > wrap_width and "\n" not in self._raw_value:
             return textwrap.fill(self._raw_value, width=wrap_width)
 
         return self._raw_value
 
+    def _wrap_width(self) -> int:
+        """Width plain-text values are wrapped to at the current size."""
+        return max(self.size.width - 4, 20) if self.size.width > 0 else 100
+
     def on_resize(self, event: Any) -> None:
         """Re-wrap text when widget is resized."""
-        if self.is_visible and not self._tree_mode:
-            self._rebuild()
+        if not self.is_visible or self._tree_mode:
+            return
+        # JSON syntax output wraps itself at render time; plain text only
+        # needs re-wrapping when the wrap width actually changed.
+        if self._is_json and self._parsed_json is not None:
+            return
+        if self._wrap_width() == self._last_wrap_width:
+            return
+        self._rebuild()
 
     def show(self) -> None:
         """Show the value view."""
@@ -164,29 +195,16 @@ class InlineValueView(Container):
 
     def get_cursor_value_json(self) -> str | None:
         """Get the current tree node's value as JSON string."""
-        if not self._is_json or not self._tree_mode:
-            return None
-        try:
-            tree = self.query_one("#json-tree", JSONTreeView)
-            return tree.get_cursor_value_json()
-        except Exception:
-            return None
+        tree = self.get_tree_widget()
+        return tree.get_cursor_value_json() if tree is not None else None
 
     def get_cursor_field_json(self) -> str | None:
         """Get the current tree node as 'key': value JSON string."""
-        if not self._is_json or not self._tree_mode:
-            return None
-        try:
-            tree = self.query_one("#json-tree", JSONTreeView)
-            return tree.get_cursor_field_json()
-        except Exception:
-            return None
+        tree = self.get_tree_widget()
+        return tree.get_cursor_field_json() if tree is not None else None
 
     def get_tree_widget(self) -> JSONTreeView | None:
         """Get the JSON tree widget for flashing."""
         if not self._is_json or not self._tree_mode:
             return None
-        try:
-            return self.query_one("#json-tree", JSONTreeView)
-        except Exception:
-            return None
+        return self._tree_widget
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -11,8 +11,10 @@ from sqlit.domains.connections.discovery.docker_detector import (
     DetectedContainer,
     DockerStatus,
     StaticDockerContainerScanner,
+    _extract_port_info,
+    _get_container_image_name,
     _get_db_type_from_image,
-    _get_host_port,
+    _reset_docker_status_cache,
     container_to_connection_config,
     detect_database_containers,
     get_docker_status,
@@ -29,6 +31,13 @@ def _get_container_credentials(db_type: str, env_vars: dict[str, str]) -> Docker
     return detector.get_credentials(env_vars)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_status_cache():
+    _reset_docker_status_cache()
+    yield
+    _reset_docker_status_cache()
+
+
 class TestDockerStatus:
     def test_docker_not_installed(self):
         """Test detection when docker SDK is not installed."""
@@ -43,6 +52,26 @@ class TestDockerStatus:
         with patch("builtins.__import__", side_effect=mock_import):
             assert get_docker_status() == DockerStatus.NOT_INSTALLED
 
+    def test_docker_status_is_reused_within_ttl(self):
+        """Test repeated status checks share one client and ping."""
+        mock_client = MagicMock()
+        with patch("docker.from_env", return_value=mock_client) as from_env:
+            assert get_docker_status() == DockerStatus.AVAILABLE
+            assert get_docker_status() == DockerStatus.AVAILABLE
+        assert from_env.call_count == 1
+        assert mock_client.ping.call_count == 1
+
+    def test_detection_reuses_status_client(self):
+        """Test detection lists containers on the client the status check pinged."""
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = []
+        with patch("docker.from_env", return_value=mock_client) as from_env:
+            status, containers = detect_database_containers()
+        assert status == DockerStatus.AVAILABLE
+        assert containers == []
+        assert from_env.call_count == 1
+        mock_client.containers.list.assert_called_once_with(all=True)
+
     def test_docker_status_enum_values(self):
         """Test DockerStatus enum has all expected values."""
         assert DockerStatus.AVAILABLE.value == "available"
@@ -135,7 +164,7 @@ class TestCredentialExtraction:
 
 
 class TestHostPortExtraction:
-    def test_get_host_port_mapped(self):
+    def test_default_host_port_mapped(self):
         """Test extracting mapped host port."""
         mock_container = MagicMock()
         mock_container.attrs = {
@@ -145,15 +174,15 @@ class TestHostPortExtraction:
                 }
             }
         }
-        assert _get_host_port(mock_container, 5432) == 15432
+        assert _extract_port_info(mock_container, 5432)[0] == 15432
 
-    def test_get_host_port_not_mapped(self):
+    def test_default_host_port_not_mapped(self):
         """Test when port is not mapped."""
         mock_container = MagicMock()
         mock_container.attrs = {"NetworkSettings": {"Ports": {}}}
-        assert _get_host_port(mock_container, 5432) is None
+        assert _extract_port_info(mock_container, 5432)[0] is None
 
-    def test_get_host_port_empty_bindings(self):
+    def test_default_host_port_empty_bindings(self):
         """Test when port bindings exist but are empty."""
         mock_container = MagicMock()
         mock_container.attrs = {
@@ -163,7 +192,7 @@ class TestHostPortExtraction:
                 }
             }
         }
-        assert _get_host_port(mock_container, 5432) is None
+        assert _extract_port_info(mock_container, 5432)[0] is None
 
 
 class TestDetectedContainer:
@@ -285,6 +314,7 @@ class TestDetectDatabaseContainers:
         mock_container = MagicMock()
         mock_container.name = "test-postgres"
         mock_container.short_id = "abc123"
+        mock_container.status = "running"
         mock_container.image.tags = ["postgres:15"]
         mock_container.attrs = {
             "Config": {
@@ -303,7 +333,7 @@ class TestDetectDatabaseContainers:
         }
 
         mock_client = MagicMock()
-        mock_client.containers.list.side_effect = [[mock_container], []]
+        mock_client.containers.list.return_value = [mock_container]
         mock_client.ping.return_value = True
 
         with (
@@ -330,6 +360,7 @@ class TestDetectDatabaseContainers:
         mock_container = MagicMock()
         mock_container.name = "test-postgres"
         mock_container.short_id = "abc123"
+        mock_container.status = "running"
         mock_container.image.tags = []
         mock_container.attrs = {
             "Config": {
@@ -347,7 +378,7 @@ class TestDetectDatabaseContainers:
         }
 
         mock_client = MagicMock()
-        mock_client.containers.list.side_effect = [[mock_container], []]
+        mock_client.containers.list.return_value = [mock_container]
         mock_client.ping.return_value = True
 
         with (
@@ -362,11 +393,29 @@ class TestDetectDatabaseContainers:
             assert containers[0].db_type == "postgresql"
             assert containers[0].port == 15432
 
+    def test_config_image_avoids_image_inspect(self):
+        """Test Config.Image is used without touching the lazy container.image."""
+        mock_container = MagicMock()
+        mock_container.attrs = {"Config": {"Image": "postgres:15"}}
+        type(mock_container).image = PropertyMock(side_effect=AssertionError("inspect_image called"))
+
+        assert _get_container_image_name(mock_container) == "postgres:15"
+
+    @pytest.mark.parametrize("image_id", ["1a2b3c4d5e6f", "sha256:" + "0f" * 32])
+    def test_image_id_config_falls_back_to_tags(self, image_id):
+        """Test containers run from an image ID are named by the image's tags."""
+        mock_container = MagicMock()
+        mock_container.attrs = {"Config": {"Image": image_id}}
+        mock_container.image.tags = ["postgres:15"]
+
+        assert _get_container_image_name(mock_container) == "postgres:15"
+
     def test_detect_container_host_network(self):
         """Test host-network containers use exposed/default port."""
         mock_container = MagicMock()
         mock_container.name = "test-postgres"
         mock_container.short_id = "abc123"
+        mock_container.status = "running"
         mock_container.image.tags = ["postgres:15"]
         mock_container.attrs = {
             "Config": {
@@ -380,7 +429,7 @@ class TestDetectDatabaseContainers:
         }
 
         mock_client = MagicMock()
-        mock_client.containers.list.side_effect = [[mock_container], []]
+        mock_client.containers.list.return_value = [mock_container]
         mock_client.ping.return_value = True
 
         with (
@@ -400,6 +449,7 @@ class TestDetectDatabaseContainers:
         mock_container = MagicMock()
         mock_container.name = "test-postgres"
         mock_container.short_id = "abc123"
+        mock_container.status = "running"
         mock_container.image.tags = ["postgres:15"]
         mock_container.attrs = {
             "Config": {
@@ -413,7 +463,7 @@ class TestDetectDatabaseContainers:
         }
 
         mock_client = MagicMock()
-        mock_client.containers.list.side_effect = [[mock_container], []]
+        mock_client.containers.list.return_value = [mock_container]
         mock_client.ping.return_value = True
 
         with (
@@ -428,6 +478,40 @@ class TestDetectDatabaseContainers:
             assert containers[0].port is None
             assert containers[0].connectable is False
 
+    def test_detect_multiple_containers_preserves_order(self):
+        """Test detection keeps the daemon's container order."""
+        containers = []
+        for name, image, port in [
+            ("pg", "postgres:15", "5432"),
+            ("web", "nginx:latest", "8080"),
+            ("my", "mysql:8", "3306"),
+        ]:
+            container = MagicMock()
+            container.name = name
+            container.short_id = name
+            container.status = "running"
+            container.image.tags = [image]
+            container.attrs = {
+                "Config": {"Env": []},
+                "HostConfig": {"NetworkMode": "bridge"},
+                "NetworkSettings": {"Ports": {f"{port}/tcp": [{"HostPort": port}]}},
+            }
+            containers.append(container)
+
+        mock_client = MagicMock()
+        mock_client.containers.list.return_value = containers
+
+        with (
+            patch(
+                "sqlit.domains.connections.discovery.docker_detector.get_docker_status",
+                return_value=DockerStatus.AVAILABLE,
+            ),
+            patch("docker.from_env", return_value=mock_client),
+        ):
+            _, detected = detect_database_containers()
+            assert [c.container_name for c in detected] == ["pg", "my"]
+            assert [c.db_type for c in detected] == ["postgresql", "mysql"]
+
 
 class TestDefaultPorts:
     def test_default_ports_defined(self):
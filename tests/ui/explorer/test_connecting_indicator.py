@@ -0,0 +1,45 @@
+"""Tests for the connecting spinner row in the explorer tree."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from textual.widgets import Tree
+
+from sqlit.domains.explorer.ui.tree import builder
+
+
+def _make_host(config):
+    tree = Tree("root")
+    return SimpleNamespace(
+        object_tree=tree,
+        _connecting_config=config,
+        _connect_spinner_frame=lambda: "*",
+        _format_connection_label=lambda conn, status, spinner=None: f"{status}:{conn.name}:{spinner}",
+        _get_node_kind=lambda node: node.data.get_node_kind() if node.data else "",
+    )
+
+
+def test_spinner_update_reuses_connecting_node() -> None:
+    config = SimpleNamespace(name="db", folder_path="")
+    host = _make_host(config)
+    builder.ensure_connecting_indicator(host, config)
+    node = host._connecting_node
+
+    with patch.object(builder, "_find_connection_node") as find:
+        builder.update_connecting_indicator(host)
+    find.assert_not_called()
+    assert str(node.label) == "connecting:db:*"
+
+
+def test_removed_connecting_node_is_looked_up_again() -> None:
+    config = SimpleNamespace(name="db", folder_path="")
+    host = _make_host(config)
+    builder.ensure_connecting_indicator(host, config)
+    stale = host._connecting_node
+    stale.remove()
+    builder.ensure_connecting_indicator(host, config)
+
+    assert host._connecting_node is not stale
+    assert host._connecting_node in host.object_tree.root.children
@@ -211,6 +211,44 @@ class TestCrossDatabaseQuery:
         # (the action_select_table part works)
         assert executed_configs[0] == "norway_geography"
 
+    def test_select_table_reuses_columns_loaded_by_expansion(self):
+        """Columns fetched when the table node was expanded skip the re-fetch."""
+        from sqlit.domains.explorer.ui.tree import loaders as tree_loaders
+
+        mixin = self._create_tree_mixin()
+        mixin._last_query_table_token = 0
+        columns = [MagicMock(name="id"), MagicMock(name="name")]
+        tree_loaders.remember_table_columns(mixin, "norway_geography", "public", "fjords", columns)
+
+        mixin.object_tree.cursor_node = MockTreeNode(
+            label="fjords",
+            data=TableNode(database="norway_geography", schema="public", name="fjords"),
+        )
+        mixin.action_select_table()
+
+        assert mixin._last_query_table["columns"] == columns
+        mixin._prime_last_query_table_columns.assert_not_called()
+
+    def test_select_table_refetches_stale_columns(self, monkeypatch):
+        """Cached columns older than the TTL are fetched again."""
+        from sqlit.domains.explorer.ui.tree import loaders as tree_loaders
+
+        mixin = self._create_tree_mixin()
+        tree_loaders.remember_table_columns(mixin, "norway_geography", "public", "fjords", [MagicMock()])
+        now = tree_loaders.time.monotonic()
+        monkeypatch.setattr(
+            tree_loaders.time, "monotonic", lambda: now + tree_loaders.TABLE_COLUMNS_TTL_S
+        )
+
+        mixin.object_tree.cursor_node = MockTreeNode(
+            label="fjords",
+            data=TableNode(database="norway_geography", schema="public", name="fjords"),
+        )
+        mixin.action_select_table()
+
+        assert mixin._last_query_table["columns"] == []
+        mixin._prime_last_query_table_columns.assert_called_once_with("norway_geography", "public", "fjords")
+
     def test_postgres_apply_database_override_should_modify_config(self):
         """PostgreSQL should handle database override by modifying the connection config.
 
@@ -0,0 +1,45 @@
+"""Tests for the folder nodes added under each database."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from textual.widgets import Tree
+
+from sqlit.domains.connections.providers.explorer_nodes import DefaultExplorerNodeProvider
+from sqlit.domains.explorer.domain.tree_nodes import FolderNode
+from sqlit.domains.explorer.ui.tree import builder
+
+
+def _provider():
+    capabilities = SimpleNamespace(
+        supports_indexes=True,
+        supports_triggers=False,
+        supports_sequences=False,
+        supports_stored_procedures=False,
+    )
+    node_provider = MagicMock(wraps=DefaultExplorerNodeProvider())
+    return SimpleNamespace(capabilities=capabilities, explorer_nodes=node_provider)
+
+
+def test_folder_layout_is_resolved_once_per_provider() -> None:
+    provider = _provider()
+    host = SimpleNamespace(current_provider=provider)
+    tree = Tree("root")
+    first = tree.root.add("db1")
+    second = tree.root.add("db2")
+
+    builder.add_database_object_nodes(host, first, "db1")
+    builder.add_database_object_nodes(host, second, "db2")
+
+    assert provider.explorer_nodes.get_root_folders.call_count == 1
+    assert [str(child.label) for child in second.children] == [
+        str(child.label) for child in first.children
+    ]
+    assert second.children[0].data == FolderNode(folder_type="tables", database="db2")
+    assert str(second.children[-1].label) == "Stored Procedures (Not available)"
+
+    host.current_provider = _provider()
+    builder.add_database_object_nodes(host, tree.root.add("db3"), "db3")
+    assert host.current_provider.explorer_nodes.get_root_folders.call_count == 1
@@ -0,0 +1,84 @@
+"""Tests for path bookkeeping in explorer expansion state."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlit.domains.explorer.ui.tree.expansion_state import (
+    get_node_path,
+    restore_subtree_expansion_with_paths,
+    save_expanded_state,
+)
+
+
+class _Node:
+    def __init__(self, part: str | None, parent: _Node | None = None):
+        self.data = SimpleNamespace(part=part) if part is not None else None
+        self.parent = parent
+        self.children: list[_Node] = []
+        self.is_expanded = False
+        if parent is not None:
+            parent.children.append(self)
+
+    def expand(self) -> None:
+        self.is_expanded = True
+
+
+def _host(root: _Node):
+    host = MagicMock()
+    host.object_tree.root = root
+    host._get_node_path_part = lambda data: data.part
+    host.services.settings_store.load_all.return_value = {}
+    return host
+
+
+def _build():
+    root = _Node("ignored")
+    conn = _Node("conn:a", root)
+    untitled = _Node("", conn)
+    tables = _Node("folder:tables", untitled)
+    _Node("table:t", tables)
+    _Node(None, conn)
+    return root, conn, untitled, tables
+
+
+def test_restore_matches_get_node_path() -> None:
+    root, conn, untitled, tables = _build()
+    host = _host(root)
+    wanted = {get_node_path(host, conn), get_node_path(host, tables)}
+    assert wanted == {"conn:a", "conn:a/folder:tables"}
+
+    restore_subtree_expansion_with_paths(host, root, wanted)
+
+    assert conn.is_expanded and tables.is_expanded
+    # A node with an empty path part shares its parent's path.
+    assert untitled.is_expanded
+
+
+def test_save_collects_top_down_paths() -> None:
+    root, conn, _untitled, tables = _build()
+    host = _host(root)
+    root.is_expanded = conn.is_expanded = tables.is_expanded = True
+
+    save_expanded_state(host)
+
+    assert host._expanded_paths == {"conn:a", "conn:a/folder:tables"}
+
+
+def test_unchanged_expanded_paths_are_not_rewritten() -> None:
+    from sqlit.domains.explorer.ui.tree.expansion_state import persist_expanded_state
+
+    host = _host(_Node(None))
+    host._persisted_expanded_paths = None
+    host._expanded_paths = {"conn:a"}
+    store = host.services.settings_store
+
+    persist_expanded_state(host)
+    persist_expanded_state(host)
+    assert store.save_all.call_count == 1
+
+    host._expanded_paths.add("conn:a/folder:tables")
+    persist_expanded_state(host)
+    assert store.save_all.call_count == 2
+    assert store.save_all.call_args[0][0]["expanded_nodes"] == ["conn:a", "conn:a/folder:tables"]
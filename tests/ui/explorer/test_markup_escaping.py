@@ -270,6 +270,25 @@ class TestProcedureNameEscaping:
 
         assert len(parent.children) == 2
 
+    def test_large_procedure_folder_is_added_in_batches(self):
+        """Long folder listings are split across timer callbacks."""
+        mixin = object.__new__(TreeMixin)
+        mixin._loading_nodes = set()
+        mixin._session = MockSession(MockAdapter())
+        scheduled = []
+        mixin.set_timer = lambda delay, callback: scheduled.append(callback)
+
+        parent = MockTreeNode("Procedures", ("folder", "procedures", "db"))
+        items = [("procedure", "", f"proc_{i}") for i in range(450)]
+
+        mixin._on_folder_loaded(parent, "db", "procedures", items)
+        assert len(parent.children) == 200
+
+        while scheduled:
+            scheduled.pop(0)()
+        assert len(parent.children) == 450
+        assert parent.children[-1].data.name == "proc_449"
+
 
 class TestExpandingTablesWithMultipleSchemas:
     """Test expanding the Tables folder with multiple schemas."""
@@ -165,6 +165,10 @@ class MockHost:
         self.services = MagicMock()
         self.services.runtime = MagicMock()
         self.services.runtime.process_worker = False
+        self._db_object_cache = {}
+
+    def _get_object_cache(self) -> dict:
+        return self._db_object_cache
 
     def _format_connection_label(self, config, status, spinner=None) -> str:
         return config.name
@@ -363,3 +367,28 @@ def test_refresh_restores_cursor_to_column_after_reload() -> None:
     column_after = _find_column(host.object_tree.root, "id")
     assert column_after is not None
     assert host.object_tree.cursor_node is column_after
+
+
+def test_unforced_refresh_skips_when_tree_state_is_unchanged(monkeypatch) -> None:
+    host = MockHost()
+    populated: list[object] = []
+    monkeypatch.setattr(tree_builder, "populate_connected_tree", populated.append)
+    done: list[bool] = []
+
+    tree_builder.refresh_tree_chunked(host, force=False)
+    assert len(populated) == 1
+
+    tree_builder.refresh_tree_chunked(host, on_done=lambda: done.append(True), force=False)
+    assert len(populated) == 1
+    assert done == [True]
+
+    tree_builder.refresh_tree_chunked(host)
+    assert len(populated) == 2
+
+    host.connections = [*host.connections, MockConfig("Other")]
+    tree_builder.refresh_tree_chunked(host, force=False)
+    assert len(populated) == 3
+
+    host.connections[1].folder_path = "team"
+    tree_builder.refresh_tree_chunked(host, force=False)
+    assert len(populated) == 4
@@ -198,3 +198,25 @@ def test_refresh_restores_expanded_table_loads_columns() -> None:
     )
 
     assert host.column_load_calls == ["users"]
+
+
+def test_loaded_folder_drops_its_loading_placeholder() -> None:
+    host = MockHost()
+    host._expanded_paths = {"conn:Local/folder:tables"}
+
+    tree_builder.refresh_tree_incremental(host)
+
+    tables = _find_folder(host.object_tree.root, "tables")
+    assert tables is not None
+    assert [host._get_node_kind(child) for child in tables.children] == ["loading"]
+
+    tree_loaders.on_folder_loaded(
+        host,
+        tables,
+        None,
+        "tables",
+        [("table", "public", "users")],
+    )
+
+    assert [host._get_node_kind(child) for child in tables.children] == ["table"]
+    assert not host._loading_placeholders
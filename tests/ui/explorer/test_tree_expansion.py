@@ -5,7 +5,13 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 from sqlit.domains.connections.providers.model import SchemaCapabilities
-from sqlit.domains.explorer.domain.tree_nodes import FolderNode, LoadingNode, SchemaNode, TableNode
+from sqlit.domains.explorer.domain.tree_nodes import (
+    ColumnNode,
+    FolderNode,
+    LoadingNode,
+    SchemaNode,
+    TableNode,
+)
 from sqlit.domains.explorer.ui.mixins.tree import TreeMixin
 
 
@@ -32,6 +38,9 @@ class MockTreeNode:
         if self.parent:
             self.parent.children.remove(self)
 
+    def remove_children(self):
+        self.children = []
+
     def expand(self):
         self.is_expanded = True
 
@@ -257,3 +266,98 @@ class TestTreeExpansion:
             for table_node in schema_folder.children:
                 assert isinstance(table_node.data, TableNode)
                 assert table_node.allow_expand is True
+
+
+    def test_expanding_leaf_kind_skips_state_save(self):
+        """Leaf kinds neither record expansion state nor schedule a save."""
+        mixin, _ = self._create_mixin_with_adapter([])
+        mixin._schedule_expanded_state_persist = MagicMock()
+        column = MockTreeNode(
+            "id", ColumnNode(database="mydb", schema="public", table="users", name="id")
+        )
+
+        mixin.on_tree_node_expanded(MockNodeExpandedEvent(column))
+
+        assert mixin._expanded_paths == set()
+        mixin._schedule_expanded_state_persist.assert_not_called()
+
+
+class TestCollapsedFolderRelease:
+    """Large folders drop their children when collapsed."""
+
+    def _mixin(self):
+        mixin = object.__new__(TreeMixin)
+        mixin._loading_nodes = set()
+        mixin._expanded_paths = set()
+        mixin._session = MockSession(MockAdapter([], "public"))
+        mixin._schedule_expanded_state_persist = MagicMock()
+        return mixin
+
+    def _folder(self, mixin, count):
+        folder = MockTreeNode("Tables", FolderNode(folder_type="tables", database="mydb"))
+        items = [("table", "public", f"t{i}") for i in range(count)]
+        mixin.set_timer = lambda delay, callback: callback()
+        mixin._on_folder_loaded(folder, "mydb", "tables", items)
+        return folder
+
+    def test_large_folder_children_removed_on_collapse(self):
+        mixin = self._mixin()
+        folder = self._folder(mixin, 300)
+        assert len(folder.children) == 300
+
+        mixin.on_tree_node_collapsed(MockNodeExpandedEvent(folder))
+
+        assert folder.children == []
+
+    def test_collapse_mid_render_cancels_queued_batches(self):
+        from sqlit.domains.explorer.ui.tree import loaders as tree_loaders
+
+        mixin = self._mixin()
+        queued = []
+        mixin.set_timer = lambda delay, callback: queued.append(callback)
+        folder = MockTreeNode("Tables", FolderNode(folder_type="tables", database="mydb"))
+        items = [("table", "public", f"t{i}") for i in range(300)]
+        items += [("table", "sales", f"s{i}") for i in range(300)]
+        mixin._on_folder_loaded(folder, "mydb", "tables", items)
+        public, sales = folder.children
+        assert queued
+        assert sales.children == []
+        tree_loaders._claim_render_token(mixin, public)
+        tree_loaders._claim_render_token(mixin, public.children[0])
+
+        mixin.on_tree_node_collapsed(MockNodeExpandedEvent(folder))
+        for callback in queued:
+            callback()
+
+        assert folder.children == []
+        assert sales.children == []
+        assert mixin._schema_render_tokens == {}
+        assert mixin._node_render_tokens == {}
+
+    def test_small_folder_keeps_children_on_collapse(self):
+        mixin = self._mixin()
+        folder = self._folder(mixin, 20)
+
+        mixin.on_tree_node_collapsed(MockNodeExpandedEvent(folder))
+
+        assert len(folder.children) == 20
+
+
+class TestNodeKind:
+    """_get_node_kind reads the KIND class attribute of node data."""
+
+    def test_kind_matches_get_node_kind(self):
+        mixin = object.__new__(TreeMixin)
+        for data in (
+            FolderNode(folder_type="tables"),
+            SchemaNode(database=None, schema="public", folder_type="tables"),
+            TableNode(database=None, schema="public", name="users"),
+            LoadingNode(),
+        ):
+            assert mixin._get_node_kind(MockTreeNode(data=data)) == data.get_node_kind()
+
+    def test_nodes_without_kind(self):
+        mixin = object.__new__(TreeMixin)
+        assert mixin._get_node_kind(MockTreeNode()) == ""
+        assert mixin._get_node_kind(MockTreeNode(data=("table", "db", "public", "users"))) == ""
+        assert mixin._get_node_kind(None) == ""
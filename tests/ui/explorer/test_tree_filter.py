@@ -0,0 +1,253 @@
+"""Tests for the explorer tree filter."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+from sqlit.domains.explorer.domain.tree_nodes import FolderNode, TableNode
+from sqlit.domains.explorer.ui.mixins.tree_filter import TreeFilterMixin
+
+
+class MockTreeNode:
+    def __init__(self, label: str = "", data=None, parent: MockTreeNode | None = None):
+        self.label = label
+        self.label_sets = 0
+        self.data = data
+        self.parent = parent
+        self.children: list[MockTreeNode] = []
+
+    def add(self, label: str, data=None) -> MockTreeNode:
+        child = MockTreeNode(label, data, parent=self)
+        self.children.append(child)
+        return child
+
+    def set_label(self, label: str) -> None:
+        self.label = label
+        self.label_sets += 1
+
+    def remove(self) -> None:
+        self.parent.children.remove(self)
+
+    def expand(self) -> None:
+        pass
+
+
+class MockTree:
+    def __init__(self) -> None:
+        self.root = MockTreeNode("root")
+        self.selected: MockTreeNode | None = None
+        self.has_focus = True
+
+    def select_node(self, node: MockTreeNode) -> None:
+        self.selected = node
+
+
+class FilterHost(TreeFilterMixin):
+    def __init__(self, table_names: list[str]) -> None:
+        self.object_tree = MockTree()
+        self.tree_filter_input = MagicMock()
+        self.refresh_tree = MagicMock()
+        self._update_footer_bindings = MagicMock()
+        self.batches = 0
+        folder = self.object_tree.root.add("Tables", FolderNode(folder_type="tables"))
+        for name in table_names:
+            folder.add(name, TableNode(database=None, schema="public", name=name))
+
+    def batch_update(self):
+        self.batches += 1
+        return nullcontext()
+
+    def type(self, text: str) -> None:
+        self._tree_filter_text += text
+        self._update_tree_filter()
+
+    def backspace(self) -> None:
+        self._tree_filter_text = self._tree_filter_text[:-1]
+        self._update_tree_filter()
+
+    def match_names(self) -> list[str]:
+        return [node.data.name for node in self._tree_filter_matches]
+
+
+def test_extended_query_only_checks_previous_matches() -> None:
+    host = FilterHost(["users", "user_roles", "orders"])
+    host.action_tree_filter()
+    host.type("us")
+    assert host.match_names() == ["users", "user_roles"]
+
+    host._find_matching_nodes = MagicMock(side_effect=AssertionError("full walk"))
+    host.type("er_")
+
+    assert host.match_names() == ["user_roles"]
+    assert "[bold #FFFF00]" in host._tree_filter_matches[0].label
+
+
+def test_fuzzy_and_shortened_queries_walk_the_tree() -> None:
+    host = FilterHost(["users", "user_roles", "orders"])
+    host.action_tree_filter()
+    host.type("user_")
+    assert host.match_names() == ["user_roles"]
+
+    host.backspace()
+    assert host._tree_filter_refine_query == "user"
+
+    host._tree_filter_text = ""
+    host.type("~ue")
+    assert host._tree_filter_refine_query == ""
+    host._find_matching_nodes = MagicMock(return_value=False)
+    host.type("s")
+    host._find_matching_nodes.assert_called_once()
+
+
+def test_restored_labels_after_refined_match() -> None:
+    host = FilterHost(["users", "orders"])
+    host.action_tree_filter()
+    host.type("u")
+    host.type("s")
+    users = host._tree_filter_matches[0]
+
+    host._restore_tree_labels()
+
+    assert users.label == "users"
+
+
+def test_index_is_reused_until_the_tree_changes() -> None:
+    from sqlit.domains.explorer.ui.tree import builder as tree_builder
+
+    host = FilterHost(["users", "orders"])
+    host.action_tree_filter()
+    assert host._count_all_nodes() == 3
+    index = host._get_tree_filter_index()
+    assert [text for _, text, _ in index] == ["users", "orders", "tables"]
+
+    host.type("o")
+    assert host._get_tree_filter_index() is not index
+    assert host._count_all_nodes() == 2
+
+    folder = host.object_tree.root.children[0]
+    folder.add("order_items", TableNode(database=None, schema="public", name="order_items"))
+    tree_builder.mark_tree_changed(host)
+    host.type("r")
+
+    assert host.match_names() == ["orders", "order_items"]
+
+
+def test_filter_keeps_only_matches_and_their_ancestors() -> None:
+    host = FilterHost(["users", "orders"])
+    views = host.object_tree.root.add("Views", FolderNode(folder_type="views"))
+    views.add("user_view", TableNode(database=None, schema="public", name="user_view"))
+    views.add("totals", TableNode(database=None, schema="public", name="totals"))
+    host.action_tree_filter()
+
+    host.type("user")
+
+    tables, views = host.object_tree.root.children
+    assert [child.label for child in views.children] == [host._tree_filter_matches[1].label]
+    assert [node.data.name for node in tables.children] == ["users"]
+    assert host.match_names() == ["users", "user_view"]
+
+
+def _key(char: str) -> MagicMock:
+    event = MagicMock()
+    event.key = char
+    event.character = char
+    return event
+
+
+def test_keystroke_bursts_update_the_filter_once() -> None:
+    host = FilterHost(["users", "orders"])
+    callbacks: list = []
+    host.call_after_refresh = callbacks.append
+    host.action_tree_filter()
+
+    for char in "ord":
+        host.on_key(_key(char))
+    assert len(callbacks) == 1
+    assert host._tree_filter_matches == []
+
+    host._apply_tree_label_updates = MagicMock()
+    callbacks.pop()()
+    assert host.match_names() == ["orders"]
+    host._apply_tree_label_updates.assert_called_once()
+
+    host._update_tree_filter()
+    host._apply_tree_label_updates.assert_called_once()
+
+
+def test_accept_applies_pending_text_first() -> None:
+    host = FilterHost(["users", "orders"])
+    callbacks: list = []
+    host.call_after_refresh = callbacks.append
+    host._activate_tree_node = MagicMock()
+    host.action_tree_filter()
+    host.on_key(_key("u"))
+
+    host.action_tree_filter_accept()
+
+    activated = host._activate_tree_node.call_args.args[0]
+    assert activated.data.name == "users"
+    callbacks.pop()()
+    assert not host._tree_filter_update_pending
+
+
+def test_uppercase_query_matches_case_sensitively() -> None:
+    host = FilterHost(["Users", "users_archive", "orders"])
+    host.action_tree_filter()
+
+    host.type("us")
+    assert host.match_names() == ["Users", "users_archive"]
+
+    host._tree_filter_text = ""
+    host._show_all_tree_nodes()
+    host.type("U")
+    assert host.match_names() == ["Users"]
+
+
+def test_labels_are_set_once_per_update_in_one_batch() -> None:
+    host = FilterHost(["users", "user_roles", "orders"])
+    host.action_tree_filter()
+    host.type("us")
+    users, roles = host._tree_filter_matches
+    assert (users.label_sets, roles.label_sets) == (1, 1)
+    batches = host.batches
+
+    host.type("er_")
+
+    assert host.batches == batches + 1
+    assert users.label == "users"
+    assert users.label_sets == 2
+    assert roles.label_sets == 2
+    assert "[bold #FFFF00]" in roles.label
+
+    host.action_tree_filter_close()
+    assert roles.label == "user_roles"
+
+
+def test_original_labels_are_captured_once_per_session() -> None:
+    host = FilterHost(["users", "user_roles"])
+    host.action_tree_filter()
+    host.type("u")
+    roles = host._tree_filter_matches[1]
+    assert host._tree_original_labels[roles] == "user_roles"
+
+    host.type("ser_")
+
+    assert host._tree_original_labels == {roles: "user_roles"}
+    host._restore_tree_labels()
+    assert roles.label == "user_roles"
+    assert host._tree_original_labels == {}
+
+
+def test_single_character_fuzzy_query_uses_substring_scan(monkeypatch) -> None:
+    from sqlit.domains.explorer.ui.mixins import tree_filter
+
+    monkeypatch.setattr(tree_filter, "fuzzy_match", MagicMock(side_effect=AssertionError("fuzzy")))
+    host = FilterHost(["Users", "orders"])
+    host.action_tree_filter()
+
+    host.type("~U")
+
+    assert not host._tree_filter_fuzzy
+    assert host.match_names() == ["Users"]
+    assert host._tree_filter_refine_query == "U"
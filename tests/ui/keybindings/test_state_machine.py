@@ -177,3 +177,22 @@ class TestValueViewStates:
             value_view_tree_mode=False,
         )
         assert sm.check_action(ctx, "collapse_all_json_nodes") is False
+
+
+class TestActionCheckCache:
+    """Test caching of action checks per input snapshot."""
+
+    def test_equal_contexts_share_cached_result(self):
+        """Equal snapshots should resolve from the cache."""
+        sm = UIStateMachine()
+
+        assert sm.check_action(make_context(query_executing=True), "cancel_operation") is True
+        assert sm.check_action(make_context(query_executing=True), "cancel_operation") is True
+        assert sm._check_cached.cache_info().hits == 1
+
+    def test_changed_context_is_not_served_stale(self):
+        """A different snapshot must be evaluated on its own."""
+        sm = UIStateMachine()
+
+        assert sm.check_action(make_context(query_executing=True), "cancel_operation") is True
+        assert sm.check_action(make_context(query_executing=False), "cancel_operation") is False
@@ -0,0 +1,44 @@
+"""Tests for keeping the context footer in sync with dialogs."""
+
+from __future__ import annotations
+
+import pytest
+
+from sqlit.domains.explorer.domain.tree_nodes import ConnectionNode
+from sqlit.domains.shell.app.main import SSMSTUI
+from sqlit.shared.ui.widgets import ContextFooter
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services, create_test_connection
+
+
+def _make_app() -> SSMSTUI:
+    services = build_test_services(
+        connection_store=MockConnectionStore([create_test_connection("TestDB", "sqlite")]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    return SSMSTUI(services=services)
+
+
+@pytest.mark.asyncio
+async def test_footer_bindings_return_after_cancelled_edit_dialog():
+    app = _make_app()
+
+    async with app.run_test(size=(100, 35)) as pilot:
+        app.action_focus_explorer()
+        await pilot.pause()
+        node = next(
+            child for child in app.object_tree.root.children if isinstance(child.data, ConnectionNode)
+        )
+        app.object_tree.move_cursor(node)
+        await pilot.pause()
+        footer = app.query_one(ContextFooter)
+        assert footer._left_bindings
+
+        app.action_edit_connection()
+        await pilot.pause()
+        assert footer._left_bindings == []
+
+        app.pop_screen()
+        await pilot.pause()
+
+        assert footer._left_bindings
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlit.shared.ui.widgets_json_tree import parse_json_value
+from sqlit.shared.ui.widgets_json_tree import parse_json_source, parse_json_value
 
 
 class TestParseJsonValue:
@@ -49,3 +49,197 @@ class TestParseJsonValue:
         is_json, parsed = parse_json_value("   \n\t  ")
         assert is_json is False
         assert parsed is None
+
+
+class TestParseJsonSource:
+    """Tests for parse_json_source, which also returns the parsed JSON text."""
+
+    def test_strict_json_returns_stripped_source(self):
+        is_json, parsed, source = parse_json_source('  {"a": 1}\n')
+        assert is_json is True
+        assert parsed == {"a": 1}
+        assert source == '{"a": 1}'
+
+    def test_python_literal_has_no_source(self):
+        is_json, parsed, source = parse_json_source("{'a': None}")
+        assert is_json is True
+        assert parsed == {"a": None}
+        assert source is None
+
+    def test_python_only_syntax_still_parses(self):
+        assert parse_json_source("[1, 2,]")[:2] == (True, [1, 2])
+        assert parse_json_source("[(1, 2)]")[:2] == (True, [(1, 2)])
+
+    def test_python_literals_json_rejects_still_parse(self):
+        assert parse_json_source('{1: "a"}')[:2] == (True, {1: "a"})
+        assert parse_json_source("{1: 2}")[:2] == (True, {1: 2})
+        assert parse_json_source("[0x10]")[:2] == (True, [16])
+        assert parse_json_source("[1., .5]")[:2] == (True, [1.0, 0.5])
+        assert parse_json_source("[+1]")[:2] == (True, [1])
+
+    def test_number_forms_and_set_calls_reach_literal_eval(self):
+        assert parse_json_source("[1.e5, 1j, 0b11, 1_000]")[:2] == (True, [1e5, 1j, 3, 1000])
+        assert parse_json_source("[set(), None, True]")[:2] == (True, [set(), None, True])
+        assert parse_json_source("[1, # note\n 2]")[:2] == (True, [1, 2])
+
+    def test_invalid_text_without_python_syntax(self):
+        assert parse_json_source("{abc}") == (False, None, None)
+
+    def test_bracketed_prose_skips_literal_eval(self, monkeypatch):
+        import ast
+
+        def fail(_text):
+            raise AssertionError("literal_eval called")
+
+        monkeypatch.setattr(ast, "literal_eval", fail)
+        assert parse_json_source("[INFO] server started") == (False, None, None)
+        assert parse_json_source("{placeholder}") == (False, None, None)
+
+
+class TestJSONTreeLazyChildren:
+    """Large nested containers are built when first expanded."""
+
+    async def test_large_container_materializes_on_expand(self):
+        from textual.app import App, ComposeResult
+
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        class TreeApp(App):
+            def compose(self) -> ComposeResult:
+                yield JSONTreeView("JSON")
+
+        data = {"small": [1, 2], "big": list(range(500))}
+        app = TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json(data)
+            small, big = tree.root.children
+            assert len(small.children) == 2
+            assert len(big.children) == 0
+            assert big.allow_expand
+
+            big.expand()
+            await pilot.pause()
+            assert len(big.children) == 500
+            assert str(big.children[0].label) == "[0]: 0"
+
+
+class TestJSONTreeCopy:
+    """Copy helpers serialize the cursor node once."""
+
+    async def test_cursor_json_is_cached_on_node(self):
+        from textual.app import App, ComposeResult
+
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        class TreeApp(App):
+            def compose(self) -> ComposeResult:
+                yield JSONTreeView("JSON")
+
+        app = TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json({"name": "é", "items": [1, 2]})
+            await pilot.pause()
+            tree.move_cursor(tree.root.children[0])
+            assert tree.get_cursor_field_json() == '"name": "é"'
+            assert tree.get_cursor_value_json() == '"é"'
+            data = tree.cursor_node.data
+            assert data.cached_field_json == '"name": "é"'
+            assert data.cached_json == '"é"'
+
+
+class TestJSONTreeFormatValue:
+    """Leaf formatting for values outside the JSON types."""
+
+    def test_large_bytes_are_truncated(self):
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        tree = JSONTreeView("JSON")
+        text = tree._format_value(b"x" * 5000)
+        assert text.plain == f"b'{'x' * 100}'... (5000 bytes)"
+
+    def test_repeated_value_reuses_highlighted_repr(self):
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        tree = JSONTreeView("JSON")
+        value = (1, 2)
+        first = tree._format_value(value)
+        second = tree._format_value(value)
+        assert first.plain == second.plain == "(1, 2)"
+        assert first is not second
+        assert len(tree._repr_cache) == 1
+
+
+class TestJSONTreeSetJsonReuse:
+    """Showing the same payload again keeps the built tree."""
+
+    async def test_same_payload_keeps_nodes(self):
+        from textual.app import App, ComposeResult
+
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        class TreeApp(App):
+            def compose(self) -> ComposeResult:
+                yield JSONTreeView("JSON")
+
+        data = {"a": {"b": 1}}
+        app = TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json(data, "col")
+            child = tree.root.children[0]
+            child.expand()
+            await pilot.pause()
+
+            tree.set_json(data, "col")
+            assert tree.root.children[0] is child
+            assert child.is_expanded
+
+            tree.set_json({"a": {"b": 1}}, "col")
+            assert tree.root.children[0] is not child
+
+
+class TestJSONTreeRawJson:
+    """raw_json is taken from the caller or serialized on demand."""
+
+    async def test_raw_json_uses_given_text_or_serializes_lazily(self):
+        from textual.app import App, ComposeResult
+
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        class TreeApp(App):
+            def compose(self) -> ComposeResult:
+                yield JSONTreeView("JSON")
+
+        app = TreeApp()
+        async with app.run_test():
+            tree = app.query_one(JSONTreeView)
+            tree.set_json({"a": 1}, raw='{"a":1}')
+            assert tree.raw_json == '{"a":1}'
+
+            tree.set_json({"b": 2})
+            assert tree._raw_json is None
+            assert tree.raw_json == '{"b": 2}'
+
+
+class TestJSONTreeNonStringKeys:
+    """Dicts from the Python literal fallback can have non-str keys."""
+
+    async def test_int_keys_are_rendered(self):
+        from textual.app import App, ComposeResult
+
+        from sqlit.shared.ui.widgets_json_tree import JSONTreeView
+
+        class TreeApp(App):
+            def compose(self) -> ComposeResult:
+                yield JSONTreeView("JSON")
+
+        app = TreeApp()
+        async with app.run_test():
+            tree = app.query_one(JSONTreeView)
+            tree.set_json({1: "a", 2: {3: [4]}})
+            leaf, nested = tree.root.children
+            assert str(leaf.label) == '1: "a"'
+            assert str(nested.label) == "{} 2"
+            assert str(nested.children[0].label) == "[] 3 (1)"
@@ -360,6 +360,34 @@ class TestSchemaGrouping:
         mixin._add_schema_grouped_items(parent, None, "tables", items, "public")
 
 
+    def test_pregrouped_items_render_like_ungrouped(self):
+        """Items grouped ahead of time (as the folder loader does) render identically."""
+        from sqlit.domains.explorer.ui.tree import schema_render
+
+        items = [
+            ("table", "sales", "orders"),
+            ("table", "public", "users"),
+            ("table", "Archive", "old_orders"),
+            ("table", "public", "posts"),
+        ]
+        grouped = schema_render.group_items_by_schema(items, "public")
+        assert [schema for schema, _ in grouped] == ["public", "Archive", "sales"]
+        assert grouped[0][1] == [("table", "public", "users"), ("table", "public", "posts")]
+
+        mixin = object.__new__(TreeMixin)
+        plain = MockTreeNode("Tables", ("folder", "tables", None))
+        pregrouped = MockTreeNode("Tables", ("folder", "tables", None))
+        schema_render.add_schema_grouped_items(mixin, plain, None, "tables", items, "public")
+        schema_render.add_schema_grouped_items(
+            mixin, pregrouped, None, "tables", items, "public", grouped=grouped
+        )
+
+        def shape(node):
+            return [(child.label, child.data, shape(child)) for child in node.children]
+
+        assert shape(pregrouped) == shape(plain)
+
+
 class TestRichMarkupRendering:
     """Test that Rich markup in names doesn't break rendering."""
 
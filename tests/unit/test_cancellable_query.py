@@ -0,0 +1,82 @@
+"""Unit tests for CancellableQuery cancellation and cleanup."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig, TcpEndpoint
+from sqlit.domains.query.app.cancellable import CancellableQuery
+
+
+def _make_query(connection: object) -> CancellableQuery:
+    config = ConnectionConfig(
+        name="test",
+        db_type="postgresql",
+        endpoint=TcpEndpoint(host="localhost", port="5432", database="db", username="u", password="p"),
+    )
+    provider = MagicMock()
+    provider.connection_factory.connect.return_value = connection
+    return CancellableQuery(sql="SELECT 1", config=config, provider=provider)
+
+
+class _Connection:
+    """Connection stub that records whether close ran under the query lock."""
+
+    def __init__(self, query_ref: list[CancellableQuery]) -> None:
+        self._query_ref = query_ref
+        self.closed = 0
+        self.closed_while_locked = False
+
+    def close(self) -> None:
+        self.closed += 1
+        self.closed_while_locked = self._query_ref[0]._lock.locked()
+
+
+class TestCancellableQuery:
+    def test_cancel_twice_only_succeeds_once(self) -> None:
+        query = _make_query(MagicMock())
+        assert query.cancel() is True
+        assert query.cancel() is False
+        assert query.is_cancelled
+
+    def test_execute_after_cancel_raises(self) -> None:
+        query = _make_query(MagicMock())
+        query.cancel()
+        with pytest.raises(RuntimeError, match="cancelled"):
+            query.execute()
+        assert not query.is_executing
+
+    def test_cancel_closes_connection_outside_lock(self) -> None:
+        query_ref: list[CancellableQuery] = []
+        connection = _Connection(query_ref)
+        query = _make_query(connection)
+        query_ref.append(query)
+
+        def run_query(conn: object, sql: str, max_rows: int | None) -> tuple[list[str], list[tuple], bool]:
+            assert query.cancel() is True
+            return ["x"], [(1,)], False
+
+        query.provider.query_executor.execute_query.side_effect = run_query
+        query.execute()
+
+        assert connection.closed == 1
+        assert not connection.closed_while_locked
+        assert not query.is_executing
+
+    def test_cancel_aborts_before_closing(self) -> None:
+        calls: list[str] = []
+        connection = MagicMock()
+        connection.abort.side_effect = lambda: calls.append("abort")
+        connection.close.side_effect = lambda: calls.append("close")
+        query = _make_query(connection)
+
+        def run_query(conn: object, sql: str, max_rows: int | None) -> tuple[list[str], list[tuple], bool]:
+            query.cancel()
+            return ["x"], [(1,)], False
+
+        query.provider.query_executor.execute_query.side_effect = run_query
+        query.execute()
+
+        assert calls == ["abort", "close"]
@@ -0,0 +1,34 @@
+"""Tests for connection error handler dispatch."""
+
+from __future__ import annotations
+
+from sqlit.domains.connections.providers.exceptions import MissingDriverError
+from sqlit.domains.connections.ui.connection_error_handlers import (
+    AzureFirewallHandler,
+    MissingDriverHandler,
+    _find_handler,
+)
+
+
+class _SubclassedDriverError(MissingDriverError):
+    pass
+
+
+def test_missing_driver_error_dispatches_by_type() -> None:
+    error = MissingDriverError("PostgreSQL", "postgres", "psycopg2-binary")
+    assert isinstance(_find_handler(error), MissingDriverHandler)
+
+
+def test_subclass_of_missing_driver_error_is_handled() -> None:
+    error = _SubclassedDriverError("PostgreSQL", "postgres", "psycopg2-binary")
+    assert isinstance(_find_handler(error), MissingDriverHandler)
+
+
+def test_firewall_message_is_checked_first(monkeypatch) -> None:
+    monkeypatch.setattr(AzureFirewallHandler, "can_handle", lambda self, error: True)
+    error = MissingDriverError("PostgreSQL", "postgres", "psycopg2-binary")
+    assert isinstance(_find_handler(error), AzureFirewallHandler)
+
+
+def test_unrelated_error_has_no_handler() -> None:
+    assert _find_handler(RuntimeError("boom")) is None
@@ -0,0 +1,55 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from sqlit.shared.core import fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return fast_json
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": [1, 2.5, null, true]}',
+        '{"big": 123456789012345678901234567890}',
+        '{"low": -9999999999999999999}',
+        "[NaN]",
+        '["\\ud800"]',
+    ],
+)
+def test_loads_matches_stdlib(codec, text):
+    result = codec.loads(text)
+    assert json.dumps(result) == json.dumps(json.loads(text))
+
+
+def test_loads_raises_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.loads("{bad")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"name": "é", "items": [1, {}, []]},
+        {1: "int key"},
+        [(1, 2)],
+        {"a": None, "b": [float("nan"), float("inf"), -float("inf")]},
+    ],
+)
+def test_dumps_pretty_matches_stdlib(codec, value):
+    assert codec.dumps_pretty(value) == json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def test_loads_keeps_exact_large_negative_int(codec):
+    assert codec.loads("[-9999999999999999999]") == [-9999999999999999999]
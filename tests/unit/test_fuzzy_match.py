@@ -0,0 +1,37 @@
+"""Tests for subsequence fuzzy matching in shared text utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from sqlit.shared.core.utils import fuzzy_match
+
+
+def _greedy_match(pattern: str, text: str) -> tuple[bool, list[int]]:
+    pattern = pattern.lower()
+    indices = []
+    for i, char in enumerate(text.lower()):
+        if len(indices) < len(pattern) and char == pattern[len(indices)]:
+            indices.append(i)
+    return len(indices) == len(pattern), indices
+
+
+@pytest.mark.parametrize(
+    ("pattern", "text"),
+    [
+        ("usrtbl", "users_table"),
+        ("USR", "users"),
+        ("ss", "sessions"),
+        ("aaa", "banana"),
+        ("ordx", "orders"),
+        ("zz", "orders"),
+        ("", "orders"),
+        ("o", ""),
+    ],
+)
+def test_matches_greedy_subsequence(pattern: str, text: str) -> None:
+    assert fuzzy_match(pattern, text) == _greedy_match(pattern, text)
+
+
+def test_reports_leftmost_indices() -> None:
+    assert fuzzy_match("ur", "users_roles") == (True, [0, 3])
@@ -0,0 +1,38 @@
+"""Tests for span highlighting in shared text utilities."""
+
+from __future__ import annotations
+
+import pytest
+from rich.text import Text
+
+from sqlit.shared.core.utils import highlight_matches, highlight_span
+
+
+def _styled_chars(markup: str) -> list[tuple[str, list[str]]]:
+    text = Text.from_markup(markup)
+    return [
+        (char, [str(span.style) for span in text.spans if span.start <= i < span.end])
+        for i, char in enumerate(text.plain)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "start", "length"),
+    [
+        ("users", 0, 5),
+        ("user_roles", 5, 3),
+        ("orders", 4, 2),
+        ("orders", 4, 10),
+    ],
+)
+def test_span_renders_like_per_character_highlight(text: str, start: int, length: int) -> None:
+    span = highlight_span(text, start, length, style="bold #FFFF00")
+    chars = highlight_matches(text, list(range(start, start + length)), style="bold #FFFF00")
+
+    assert span.count("[/]") == 1
+    assert _styled_chars(span) == _styled_chars(chars)
+
+
+def test_empty_span_leaves_text_unchanged() -> None:
+    assert highlight_span("users", 2, 0) == "users"
+    assert highlight_span("users", 9, 2) == "users"
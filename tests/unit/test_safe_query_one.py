@@ -0,0 +1,28 @@
+"""Tests for the status mixin's guarded widget lookup."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import ScreenStackError
+from textual.css.query import NoMatches
+
+from sqlit.domains.shell.ui.mixins.ui_status import UIStatusMixin
+
+
+class _Host(UIStatusMixin):
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+
+    def query_one(self, selector: str):
+        if self.error is not None:
+            raise self.error
+        return selector
+
+
+@pytest.mark.parametrize("error", [NoMatches("#status-bar"), ScreenStackError("no screens")])
+def test_missing_widget_or_screen_returns_none(error: Exception) -> None:
+    assert _Host(error)._safe_query_one("#status-bar") is None
+
+
+def test_found_widget_is_returned() -> None:
+    assert _Host()._safe_query_one("#status-bar") == "#status-bar"